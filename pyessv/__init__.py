@@ -5,10 +5,17 @@ __license__ = 'COSL'
 __copyright__ = 'Copyright 2022 ES-DOC'
 
 
+from pyessv.aio import init_async
+from pyessv.aio import load_async
+from pyessv.aio import parse_identifer_async
+from pyessv.aio import ready_async
+from pyessv.aio import reload_async
 from pyessv.archive import archive
 from pyessv.cache import get_cached
 from pyessv.codecs import decode
 from pyessv.codecs import encode
+from pyessv.constants import ARCHIVE_LAYOUT_BUNDLE
+from pyessv.constants import ARCHIVE_LAYOUT_DIRECTORY
 from pyessv.constants import DIR_ARCHIVE
 from pyessv.constants import ENCODING_DICT
 from pyessv.constants import ENCODING_JSON
@@ -44,8 +51,15 @@ from pyessv.governance import deprecate
 from pyessv.governance import reject
 from pyessv.governance import reset
 from pyessv.initializer import init
+from pyessv.initializer import init_deferred
+from pyessv.initializer import get_deferred_constant
+from pyessv.initializer import get_init_profile
+from pyessv.initializer import ready
+from pyessv.initializer import reload
+from pyessv.initializer import watch
 from pyessv.loader import load_random
 from pyessv.loader import load
+from pyessv.loader import load_many
 from pyessv.matcher import match_term
 from pyessv.model import Authority
 from pyessv.model import Collection
@@ -68,6 +82,21 @@ from pyessv.validation import validate
 if INITIALISATION_MODE == "AUTO":
     init()
 
+# Lazily initializes upon first access to vocabularies.
+elif INITIALISATION_MODE == "LAZY":
+    __getattr__ = get_deferred_constant
+    archive = init_deferred(archive)
+    build_identifier = init_deferred(build_identifier)
+    get_cached = init_deferred(get_cached)
+    load = init_deferred(load)
+    load_many = init_deferred(load_many)
+    load_random = init_deferred(load_random)
+    match_term = init_deferred(match_term)
+    parse_identifer = init_deferred(parse_identifer)
+    parse_identifer_set = init_deferred(parse_identifer_set)
+    parse_namespace = init_deferred(parse_namespace)
+    parse = parse_namespace
+
 # Export set.
 __all__ = [
     accept,
@@ -83,25 +112,37 @@ __all__ = [
     get_cached,
     get_datasets_for_testing,
     get_errors,
+    get_init_profile,
     init,
+    init_async,
     is_valid,
     match_term,
     load_random,
     load,
+    load_async,
+    load_many,
     log,
     log_error,
     log_warning,
     parse,
     parse_identifer,
+    parse_identifer_async,
     parse_identifer_set,
     parse_namespace,
     reject,
+    ready,
+    ready_async,
+    reload,
+    reload_async,
     reset,
     validate,
+    watch,
     Authority,
     Collection,
     Scope,
     Term,
+    ARCHIVE_LAYOUT_BUNDLE,
+    ARCHIVE_LAYOUT_DIRECTORY,
     DIR_ARCHIVE,
     ENCODING_DICT,
     ENCODING_JSON,
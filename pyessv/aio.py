@@ -0,0 +1,76 @@
+"""
+Asyncio friendly variants of blocking library functions.
+
+Each variant runs its blocking counterpart within the event loop's default executor, so that
+the loop remains responsive whilst archive files are read & decoded.  Waiting for initialisation
+occupies no executor thread.
+
+"""
+import asyncio
+import functools
+
+import pyessv
+from pyessv import initializer
+
+
+async def init_async(*args, **kwargs):
+    """Library initializer - see pyessv.init.
+
+    """
+    await _run(pyessv.init, *args, **kwargs)
+
+
+async def load_async(*args, **kwargs):
+    """Loads a vocabulary node from archive - see pyessv.load.
+
+    :return: A vocabulary node.
+    :rtype: pyessv.Node | None
+
+    """
+    return await _run(pyessv.load, *args, **kwargs)
+
+
+async def parse_identifer_async(*args, **kwargs):
+    """Parses an identifier - see pyessv.parse_identifer.
+
+    """
+    return await _run(pyessv.parse_identifer, *args, **kwargs)
+
+
+async def ready_async():
+    """Waits until library has been initialised.
+
+    :returns: True once library has been initialised.
+    :rtype: bool
+
+    """
+    if not initializer.ready():
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        # Signalled from within the thread completing initialisation, so no executor thread is held.
+        def _set_result():
+            if not future.done():
+                future.set_result(True)
+
+        initializer.add_ready_callback(functools.partial(loop.call_soon_threadsafe, _set_result))
+        await future
+
+    return True
+
+
+async def reload_async():
+    """Reloads changed vocabularies - see pyessv.reload.
+
+    :returns: Namespaces of reloaded authorities & collections.
+    :rtype: list
+
+    """
+    return await _run(pyessv.reload)
+
+
+def _run(func, *args, **kwargs):
+    """Returns a future wrapping execution of a blocking function within event loop's default executor.
+
+    """
+    return asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
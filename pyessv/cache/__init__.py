@@ -1,9 +1,15 @@
 from pyessv.cache.store import decache
 from pyessv.cache.store import encache
 from pyessv.cache.store import get_cached
+from pyessv.cache.store import get_cached_matches
+from pyessv.cache.store import get_cached_version
+from pyessv.cache.store import recache
 
 __all__ = [
     decache,
     encache,
-    get_cached
+    get_cached,
+    get_cached_matches,
+    get_cached_version,
+    recache
 ]
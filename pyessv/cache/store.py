@@ -19,16 +19,32 @@ def decache(identifier):
         store.decache(identifier)
 
 
-def encache(node):
+def encache(node, is_detached=False):
     """Caches a vocabulary node.
 
     :param pyeesv.Node: Node to be cached.
+    :param bool is_detached: Flag indicating whether node is detached from archive hierarchy, e.g. a virtual term.
 
     """
     assert isinstance(node, Node), 'Invalid node'
 
     for store in _STORES.values():
-        store.cache(node)
+        store.cache(node, is_detached)
+
+
+def recache(nodes, identifiers, swap=None):
+    """Atomically replaces a set of cached nodes.
+
+    :param list nodes: Vocabulary nodes to be cached.
+    :param list identifiers: Identifiers of vocabulary nodes to be uncached.
+    :param func swap: Callable swapping archive hierarchy whilst cache is locked, i.e. in same step as cached nodes.
+
+    """
+    assert all(isinstance(i, Node) for i in nodes), 'Invalid node'
+    assert swap is None or callable(swap), 'Invalid swap callback'
+
+    for store in _STORES.values():
+        store.recache(nodes, identifiers, swap)
 
 
 def get_cached(identifier=None, store_type=CACHE_STORE_MEMORY):
@@ -44,3 +60,31 @@ def get_cached(identifier=None, store_type=CACHE_STORE_MEMORY):
     assert store_type in CACHE_STORE_TYPES, 'Invalid cache store type'
 
     return _STORES[store_type].get_cached(identifier)
+
+
+def get_cached_matches(name, store_type=CACHE_STORE_MEMORY):
+    """Returns cached authorities matched by a normalised name spelling.
+
+    :param str name: Stripped & lower cased authority name.
+    :param str store_type: Cache store type.
+
+    :returns: Matched authorities.
+    :rtype: tuple
+
+    """
+    assert store_type in CACHE_STORE_TYPES, 'Invalid cache store type'
+
+    return _STORES[store_type].get_cached_matches(name)
+
+
+def get_cached_version(store_type=CACHE_STORE_MEMORY):
+    """Returns cache version, incremented whenever cached hierarchy is modified or a node is renamed or re-parented.
+
+    :param str store_type: Cache store type.
+
+    :rtype: int
+
+    """
+    assert store_type in CACHE_STORE_TYPES, 'Invalid cache store type'
+
+    return _STORES[store_type].get_version()
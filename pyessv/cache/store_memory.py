@@ -1,10 +1,30 @@
+import threading
+
 from pyessv.model import NODE_TYPES
 from pyessv.model import Authority
+from pyessv.model import Collection
+from pyessv.model import IterableNode
+from pyessv.model import Term
+from pyessv.model.node import get_generation
+from pyessv.utils import compat
+from pyessv.utils.formatter import format_spellings
 
 
 # Cached loaded vocabulary authorities objects.
 _DATA = {}
 
+# Cached authorities keyed by namespace & by normalised name spelling.
+_AUTHORITIES = ({}, {})
+
+# Namespaces of cached collections whose terms are to be cached upon demand.
+_DEFERRED = set()
+
+# Lock serialising cache writes.
+_LOCK = threading.RLock()
+
+# Cache version, incremented whenever cached hierarchy is modified.
+_VERSION = 0
+
 
 def decache(identifier):
     """Uncaches a node.
@@ -12,26 +32,80 @@ def decache(identifier):
     :param str identifier: A vocabulary node identifier.
 
     """
-    try:
-        del _DATA[identifier]
-    except KeyError:
-        pass
+    with _LOCK:
+        try:
+            del _DATA[identifier]
+        except KeyError:
+            pass
+        _DEFERRED.discard(identifier)
+        if identifier in _AUTHORITIES[0]:
+            _set_authorities([i for i in _AUTHORITIES[0].values() if i.namespace != identifier])
+        _increment_version()
 
 
-def cache(node):
+def cache(node, is_detached=False):
     """Caches a vocabulary node.
 
     :param pyeesv.Node: Node to be cached.
+    :param bool is_detached: Flag indicating whether node is detached from archive hierarchy, e.g. a virtual term.
+
+    """
+    with _LOCK:
+        _cache(_DATA, node)
+        if isinstance(node, Authority):
+            authorities = dict(_AUTHORITIES[0])
+            authorities[node.namespace] = node
+            _set_authorities(authorities.values())
+
+        # Detached nodes leave lookups unchanged, therefore memoised lookups are retained.
+        if not is_detached:
+            _increment_version()
+
+
+def recache(nodes, identifiers, swap=None):
+    """Atomically replaces a set of cached nodes.
+
+    Readers see either the previous or the new set of nodes, never a mixture.
+
+    :param list nodes: Vocabulary nodes to be cached.
+    :param list identifiers: Identifiers of vocabulary nodes to be uncached.
+    :param func swap: Callable swapping archive hierarchy whilst cache is locked, i.e. in same step as cached nodes.
+
+    """
+    global _DATA
+
+    with _LOCK:
+        data = dict(_DATA)
+        for identifier in identifiers:
+            data.pop(identifier, None)
+            _DEFERRED.discard(identifier)
+        for node in nodes:
+            _cache(data, node)
+        if swap is not None:
+            swap()
+        _DATA = data
+        _set_authorities([i for i in data.values() if isinstance(i, Authority)])
+        _increment_version()
+
+
+def _cache(data, node):
+    """Caches a vocabulary node within a cache dictionary.
 
     """
-    _DATA[node.namespace] = node
-    try:
-        iter(node)
-    except TypeError:
+    data[node.namespace] = node
+
+    # Terms of collections not yet loaded are cached upon demand.
+    if isinstance(node, Collection) and not node.is_loaded:
+        _DEFERRED.add(node.namespace)
+        return
+
+    # Terms held in columnar storage are resolved upon demand.
+    if isinstance(node, Collection) and node.is_columnar:
         return
-    else:
-        for subnode in node:
-            cache(subnode)
+
+    if isinstance(node, IterableNode):
+        for subnode in node.iter_items():
+            _cache(data, subnode)
 
 
 def get_cached(cache_filter):
@@ -46,6 +120,103 @@ def get_cached(cache_filter):
     if cache_filter in _DATA:
         return _DATA[cache_filter]
     elif cache_filter in NODE_TYPES:
-        return [i for i in _DATA.values() if isinstance(i, cache_filter)]
+        if cache_filter is Term:
+            for namespace in list(_DEFERRED):
+                _load_deferred(namespace)
+        if cache_filter is Authority:
+            return list(_AUTHORITIES[0].values())
+        result = [i for i in _DATA.values() if isinstance(i, cache_filter)]
+        if cache_filter is Term:
+            result += [t for c in _get_columnar() for t in c.terms]
+        return result
     elif cache_filter is None:
         return sorted(get_cached(Authority), key=lambda i: i.canonical_name)
+    elif isinstance(cache_filter, compat.basestring) and cache_filter.count(':') == 3:
+        if _load_deferred(cache_filter.rsplit(':', 1)[0]):
+            return _DATA.get(cache_filter)
+        return _get_columnar_term(cache_filter)
+
+
+def get_cached_matches(name):
+    """Returns cached authorities matched by a normalised name spelling.
+
+    :param str name: Stripped & lower cased authority name.
+
+    :returns: Matched authorities in cache order.
+    :rtype: tuple
+
+    """
+    return _AUTHORITIES[1].get(name, ())
+
+
+def get_version():
+    """Returns cache version, incremented whenever cached hierarchy is modified or a node is renamed or re-parented.
+
+    :rtype: int
+
+    """
+    return _VERSION + get_generation()
+
+
+def _increment_version():
+    """Increments cache version.
+
+    """
+    global _VERSION
+
+    _VERSION += 1
+
+
+def _set_authorities(authorities):
+    """Swaps set of cached authorities & map of their normalised name spellings.
+
+    """
+    global _AUTHORITIES
+
+    spellings = {}
+    for authority in authorities:
+        for key in format_spellings(authority.canonical_name, authority.raw_name, authority.alternative_names):
+            spellings[key] = spellings.get(key, ()) + (authority, )
+
+    _AUTHORITIES = ({i.namespace: i for i in authorities}, spellings)
+
+
+def _get_columnar():
+    """Returns cached collections whose terms are held in columnar storage.
+
+    """
+    return [i for i in _DATA.values() if isinstance(i, Collection) and i.is_columnar]
+
+
+def _get_columnar_term(namespace):
+    """Returns a term held in columnar storage by namespace.
+
+    :param str namespace: Namespace of a term.
+
+    """
+    collection_namespace, _, name = namespace.rpartition(':')
+    collection = _DATA.get(collection_namespace)
+    if isinstance(collection, Collection) and collection.is_columnar:
+        term = collection.terms.find(name)
+        if term is not None and term.canonical_name == name:
+            return term
+
+
+def _load_deferred(namespace):
+    """Loads & caches terms of a collection whose loading was deferred.
+
+    :param str namespace: Namespace of a cached collection.
+
+    :returns: Flag indicating whether terms were cached.
+
+    """
+    with _LOCK:
+        try:
+            _DEFERRED.remove(namespace)
+        except KeyError:
+            return False
+
+        for term in _DATA[namespace].iter_items():
+            cache(term)
+
+    return True
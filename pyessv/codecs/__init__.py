@@ -23,6 +23,9 @@ _DECODE_TYPE_WHITELIST = {
 def decode(representation, encoding=ENCODING_JSON):
     """Returns a decoded domain model class instance.
 
+    Dictionaries & lists nested within decoded node data are shared between nodes & cannot be
+    modified in place, i.e. modified copies (e.g. copy.deepcopy) are to be assigned instead.
+
     :param str|dict representation: A domain model class instance representation.
     :param str encoding: A supported encoding (dict|json).
 
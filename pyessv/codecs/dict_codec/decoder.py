@@ -1,3 +1,8 @@
+import copy
+import sys
+import threading
+import weakref
+
 from pyessv.constants import NODE_TYPEKEY_AUTHORITY
 from pyessv.constants import NODE_TYPEKEY_COLLECTION
 from pyessv.constants import NODE_TYPEKEY_SCOPE
@@ -10,23 +15,137 @@ from pyessv.model import Term
 from pyessv.utils import compat
 
 
+# Frozen data structures shared between decoded nodes, keyed by content.
+_SHARED = weakref.WeakValueDictionary()
+
+# Lock serialising lookups & insertions of shared data structures, i.e. whilst decoding concurrently.
+_SHARED_LOCK = threading.Lock()
+
+
 def _decode_node(obj, typeof):
     """Decodes a node instance from a dictionary representation.
 
+    Names are interned & data sub-structures are shared between nodes as frozen objects.
+
     """
     instance = typeof()
-    instance.alternative_names = obj.get('alternative_names', [])
+    instance.alternative_names = [_intern(i) for i in obj.get('alternative_names') or []]
     instance.create_date = compat.to_datetime(obj['create_date'])
-    instance.data = obj.get('data', dict())
+    instance.data = {_intern(k): _share(v)[0] for k, v in (obj.get('data') or {}).items()}
     instance.description = obj.get('description')
-    instance.label = obj.get('label', obj['canonical_name'])
-    instance.canonical_name = obj['canonical_name']
-    instance.raw_name = obj.get('raw_name', obj['canonical_name'])
+    instance.label = _intern(obj.get('label', obj['canonical_name']))
+    instance.canonical_name = _intern(obj['canonical_name'])
+    instance.raw_name = _intern(obj.get('raw_name', obj['canonical_name']))
     instance.url = obj.get('url')
 
     return instance
 
 
+def _intern(value):
+    """Returns interned form of a string.
+
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _share(value):
+    """Returns shared frozen form of a data structure plus the key by which it is shared.
+
+    """
+    if type(value) is str:
+        value = sys.intern(value)
+        return value, value
+
+    if isinstance(value, dict):
+        items = [(_intern(k), _share(v)) for k, v in value.items()]
+        key = (dict, tuple((k, v[1]) for k, v in items))
+        factory = lambda: _FrozenDict((k, v[0]) for k, v in items)
+    elif isinstance(value, list):
+        items = [_share(i) for i in value]
+        key = (list, tuple(i[1] for i in items))
+        factory = lambda: _FrozenList(i[0] for i in items)
+    else:
+        return value, (type(value), value)
+
+    try:
+        with _SHARED_LOCK:
+            shared = _SHARED.get(key)
+            if shared is None:
+                shared = _SHARED[key] = factory()
+    # Structures holding unhashable scalars are not shared.
+    except TypeError:
+        return factory(), (type(value), id(value))
+
+    return shared, key
+
+
+def _raise_frozen(self, *args, **kwargs):
+    """Raises an error upon attempting to modify shared data.
+
+    """
+    msg = '{} is shared between vocabulary nodes and cannot be modified in place, '.format(type(self).__name__)
+    msg += 'instead assign a modified copy, e.g. copy.deepcopy(value)'
+    raise TypeError(msg)
+
+
+class _FrozenDict(dict):
+    """A dictionary shared between vocabulary nodes.
+
+    Copies are modifiable dictionaries (holding modifiable copies of nested structures if deep).
+
+    """
+    __hash__ = None
+    __delitem__ = __ior__ = __setitem__ = _raise_frozen
+    clear = pop = popitem = setdefault = update = _raise_frozen
+
+    def __copy__(self):
+        """Returns a modifiable shallow copy.
+
+        """
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        """Returns a modifiable deep copy.
+
+        """
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        """Returns pickling reduction.
+
+        """
+        return (_FrozenDict, (dict(self), ))
+
+
+class _FrozenList(list):
+    """A list shared between vocabulary nodes.
+
+    Copies are modifiable lists (holding modifiable copies of nested structures if deep).
+
+    """
+    __hash__ = None
+    __delitem__ = __iadd__ = __imul__ = __setitem__ = _raise_frozen
+    append = clear = extend = insert = pop = remove = reverse = sort = _raise_frozen
+
+    def __copy__(self):
+        """Returns a modifiable shallow copy.
+
+        """
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        """Returns a modifiable deep copy.
+
+        """
+        return [copy.deepcopy(i, memo) for i in self]
+
+    def __reduce__(self):
+        """Returns pickling reduction.
+
+        """
+        return (_FrozenList, (list(self), ))
+
+
 def _decode_authority(obj):
     """Decodes a termset from a dictionary.
 
@@ -84,6 +203,10 @@ _DECODERS = {
 def decode(obj):
     """Decodes a term from a dictionary.
 
+    Dictionaries & lists nested within node data are shared between nodes & cannot be modified in
+    place (a TypeError is raised), therefore modified copies (e.g. copy.deepcopy) are to be assigned
+    instead.
+
     :param dict obj: Dictionary to be decoded.
 
     :returns: Decoded term.
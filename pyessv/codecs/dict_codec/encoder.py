@@ -3,6 +3,7 @@ from pyessv.model import Collection
 from pyessv.model import Node
 from pyessv.model import Scope
 from pyessv.model import Term
+from pyessv.model.columns import TermView
 
 
 def _encode_node(instance):
@@ -55,7 +56,9 @@ def _encode_collection(instance):
 
     """
     obj = _encode_node(instance)
-    obj['terms'] = ['{}:{}'.format(i.canonical_name, i.label) for i in instance]
+    obj['terms'] = ['{}:{}'.format(*i) for i in zip(
+        instance.get_column('canonical_name'), instance.get_column('label')
+        )]
     obj['term_regex'] = instance.term_regex
 
     return obj
@@ -80,7 +83,8 @@ _ENCODERS = {
     Authority: _encode_authority,
     Collection: _encode_collection,
     Scope: _encode_scope,
-    Term: _encode_term
+    Term: _encode_term,
+    TermView: _encode_term
     }
 
 
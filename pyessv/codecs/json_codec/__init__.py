@@ -1,8 +1,10 @@
 from pyessv.codecs.json_codec.decoder import decode
+from pyessv.codecs.json_codec.decoder import decode_as_dict
 from pyessv.codecs.json_codec.encoder import encode
 
 
 __all__ = [
    decode,
+   decode_as_dict,
    encode
 ]
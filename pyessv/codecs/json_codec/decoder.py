@@ -7,30 +7,49 @@ from pyessv.utils import convert
 _UTF8 = 'utf-8'
 
 
-def decode(as_json):
+def decode(as_json, schema_aware=False):
     """Decodes a document from a UTF-8 encoded json text blob.
 
     :param str as_xml: Term JSON representation.
+    :param bool schema_aware: Flag indicating whether only node schema date fields are to be parsed.
 
     :returns: A term instance.
     :rtype: pyessv.Term
 
     """
-    # Decode raw text blob.
-    as_json = _decode_blob(as_json)
-
     # Convert to dictionary.
-    as_dict = _JSONDecoder().decode(as_json)
+    as_dict = decode_as_dict(as_json, schema_aware)
 
     # Decode from dictionary.
     return dict_decoder.decode(as_dict)
 
 
+def decode_as_dict(as_json, schema_aware=False):
+    """Decodes a dictionary representation of a document from a UTF-8 encoded json text blob.
+
+    :param str as_json: Term JSON representation.
+    :param bool schema_aware: Flag indicating whether only node schema date fields are to be parsed.
+
+    :returns: A dictionary representation of a term instance.
+    :rtype: dict
+
+    """
+    # Decode raw text blob.
+    as_json = _decode_blob(as_json)
+
+    # Convert to dictionary - when schema aware the dictionary decoder parses create_date
+    # whilst arbitrary data is left untouched.
+    if schema_aware:
+        return compat.json.loads(as_json)
+
+    return _JSONDecoder().decode(as_json)
+
+
 class _JSONDecoder(compat.json.JSONDecoder):
     """Extends json decoder so as to handle extended types.
 
     """
-    def __init__(self, key_formatter=lambda k: k, to_namedtuple=False):
+    def __init__(self, key_formatter=None, to_namedtuple=False):
         """Instance constructor.
 
         """
@@ -8,10 +8,11 @@ from pyessv.utils import compat
 _ENCODE_IGNOREABLE = tuple(list(compat.numeric_types) + [type(None), compat.str])
 
 
-def encode(instance):
+def encode(instance, indent=4):
     """Encodes an instance of a domain model class as a JSON text blob.
 
     :param pyessv.Node instance: A domain model class instance to be encoded as a JSON text blob.
+    :param int indent: JSON indentation level (if None then output is a single line).
 
     :returns: Instance encoded as a JSON text blob.
     :rtype: str
@@ -21,21 +22,22 @@ def encode(instance):
     obj = dict_encoder.encode(instance)
 
     # Return JSON.
-    as_json = compat.str(dict_to_json(obj))
+    as_json = compat.str(dict_to_json(obj, indent))
 
     return as_json
 
 
-def dict_to_json(obj):
+def dict_to_json(obj, indent=4):
     """Converts a dictionary to json.
 
     :param dict obj: A dictionary.
+    :param int indent: JSON indentation level (if None then output is a single line).
 
     :returns: A json encoded text blob.
     :rtype: str
 
     """
-    return compat.json.dumps(_to_encodable(obj), indent=4, sort_keys=True)
+    return compat.json.dumps(_to_encodable(obj), indent=indent, sort_keys=True)
 
 
 def _to_encodable(obj, key_formatter=lambda k: k):
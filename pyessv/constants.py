@@ -1,6 +1,21 @@
 import os
 
 
+# Archive layout: a directory per authority holding a manifest plus a file per term.
+ARCHIVE_LAYOUT_DIRECTORY = 'directory'
+
+# Archive layout: a file per authority holding a manifest line plus a line per term.
+ARCHIVE_LAYOUT_BUNDLE = 'bundle'
+
+# Set of supported archive layouts.
+ARCHIVE_LAYOUT_SET = (
+    ARCHIVE_LAYOUT_DIRECTORY,
+    ARCHIVE_LAYOUT_BUNDLE
+    )
+
+# Flag indicating whether collection terms are loaded within a background thread.
+BACKGROUND_LOADING = os.getenv("PYESSV_BACKGROUND_LOADING", "0") == "1"
+
 # In memory cache type.
 CACHE_STORE_MEMORY = 'memory'
 
@@ -9,12 +24,21 @@ CACHE_STORE_TYPES = (
     CACHE_STORE_MEMORY,
     )
 
+# Minimum number of terms of a collection held in columnar storage (opt-in, i.e. disabled if zero).
+COLUMNAR_THRESHOLD = int(os.getenv("PYESSV_COLUMNAR_THRESHOLD", "0"))
+
 # Directory containing vocabulary archive.
 DIR_ARCHIVE = os.getenv('PYESSV_ARCHIVE_HOME', os.path.expanduser('~/.esdoc/pyessv-archive'))
 
 # Directory containing configuration.
 DIR_CONFIG = os.getenv('PYESSV_CONFIG_HOME', os.path.expanduser('~/.esdoc/pyessv-config'))
 
+# Directory containing warm-start snapshots of vocabulary archive.
+DIR_SNAPSHOT = os.getenv('PYESSV_SNAPSHOT_HOME', os.path.expanduser('~/.esdoc/pyessv-snapshot'))
+
+# Path to a read-only vocabulary image (if unspecified then archive is read).
+IMAGE_PATH = os.getenv('PYESSV_IMAGE', None)
+
 # Dictionary encoding.
 ENCODING_DICT = 'dict'
 
@@ -30,6 +54,34 @@ ENCODING_SET = {
 # Mode of library initialisation.
 INITIALISATION_MODE = os.getenv("PYESSV_INITIALISATION_MODE", "AUTO")
 
+# Number of processes over which archive term files are read & decoded.  Worker processes are forked,
+# hence threads are used instead upon macOS or whilst other threads (e.g. background preload) are alive.
+IO_PROCESSES = int(os.getenv("PYESSV_IO_PROCESSES", "1"))
+
+# Number of threads over which archive term files are read.
+IO_WORKERS = int(os.getenv("PYESSV_IO_WORKERS", "1"))
+
+# Flag indicating whether collection terms are loaded upon first access.
+LAZY_TERMS = os.getenv("PYESSV_LAZY_TERMS", "0") == "1"
+
+# Maximum number of identifiers not mapped to a vocabulary node that are remembered (disabled if zero).
+LOAD_MISS_CACHE_SIZE = int(os.getenv("PYESSV_LOAD_MISS_CACHE_SIZE", "4096"))
+
+# Minimum number of seconds between repeated warnings of an identifier not mapped to a vocabulary node.
+LOAD_WARNING_INTERVAL = float(os.getenv("PYESSV_LOAD_WARNING_INTERVAL", "60"))
+
+# Maximum number of parsed namespaces that are remembered (disabled if zero).
+PARSING_MEMO_SIZE = int(os.getenv("PYESSV_PARSING_MEMO_SIZE", "16384"))
+
+# Flag indicating whether library initialisation is profiled.
+PROFILE_INIT = os.getenv("PYESSV_PROFILE_INIT", "0") == "1"
+
+# Number of seconds between background reloads of changed vocabularies (disabled if zero).
+RELOAD_INTERVAL = float(os.getenv("PYESSV_RELOAD_INTERVAL", "0"))
+
+# Flag indicating whether vocabularies are loaded from a warm-start snapshot.
+USE_SNAPSHOT = os.getenv("PYESSV_SNAPSHOT", "0") == "1"
+
 # Node type key: an authority governing vocabularies.
 NODE_TYPEKEY_AUTHORITY = 'authority'
 
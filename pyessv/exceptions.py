@@ -8,6 +8,8 @@ class NamespaceParsingError(ValueError):
         """
         msg = 'Parsing error: typeof={}, name={}'.format(typeof, name)
         super(NamespaceParsingError, self).__init__(msg)
+        self.typeof = typeof
+        self.name = name
 
 
 class ValidationError(ValueError):
@@ -84,7 +84,7 @@ def create_scope(
     """
     def _callback(instance):
         instance.authority = authority
-        authority.scopes.append(instance)
+        authority.append_item(instance)
 
     return _create_node(
         typeof=Scope,
@@ -132,7 +132,7 @@ def create_collection(
     def _callback(instance):
         instance.scope = scope
         instance.term_regex = term_regex
-        scope.collections.append(instance)
+        scope.append_item(instance)
 
     return _create_node(
         typeof=Collection,
@@ -176,7 +176,7 @@ def create_term(
     def _callback(instance):
         instance.collection = collection
         if append:
-            collection.terms.append(instance)
+            collection.append_item(instance)
 
     return _create_node(
         typeof=Term,
@@ -187,7 +187,8 @@ def create_term(
         create_date=create_date or collection.create_date,
         alternative_names=alternative_names,
         data=data,
-        callback=_callback
+        callback=_callback,
+        is_detached=not append
         )
 
 
@@ -200,7 +201,8 @@ def _create_node(
     create_date,
     alternative_names,
     data,
-    callback=None
+    callback=None,
+    is_detached=False
 ):
     """Instantiates, initialises & returns a node.
 
@@ -230,6 +232,6 @@ def _create_node(
         raise ValidationError(errors)
 
     # Cache.
-    encache(node)
+    encache(node, is_detached)
 
     return node
@@ -46,5 +46,5 @@ def _apply(target, status):
 
     # Cascade.
     if isinstance(target, IterableNode):
-        for child in target:
+        for child in target.iter_items():
             _apply(child, status)
@@ -1,48 +1,577 @@
+import concurrent.futures
+import copy
+import functools
 import inspect
 import os
+import threading
+import time
 
 import pyessv
 from pyessv.accessors import ACCESSORS
 from pyessv.cache import encache
+from pyessv.cache import get_cached
+from pyessv.cache import recache
+from pyessv.constants import BACKGROUND_LOADING
 from pyessv.constants import DIR_ARCHIVE
+from pyessv.constants import IMAGE_PATH
+from pyessv.constants import IO_PROCESSES
+from pyessv.constants import IO_WORKERS
+from pyessv.constants import LAZY_TERMS
+from pyessv.constants import PROFILE_INIT
+from pyessv.constants import RELOAD_INTERVAL
+from pyessv.constants import USE_SNAPSHOT
+from pyessv.model import Authority
+from pyessv.model import Term
+from pyessv.profiler import InitProfile
+from pyessv.profiler import get_step
 from pyessv.utils import logger
+from pyessv import io_image
 from pyessv import io_manager
+from pyessv import io_snapshot
 
 
-def init(archive_dir=DIR_ARCHIVE, authority=None, scope=None):
+# Flag indicating whether library has been initialised.
+_IS_INITIALISED = False
+
+# Event signalling that library has been initialised.
+_READY = threading.Event()
+
+# Callbacks invoked once library has been initialised, plus lock guarding their registration.
+_READY_CALLBACKS = []
+_READY_LOCK = threading.Lock()
+
+# Lock ensuring that deferred initialisation occurs once only.
+_LOCK = threading.Lock()
+
+# Options with which library was initialised.
+_OPTIONS = {}
+
+# Lock ensuring that reloads occur serially.
+_RELOAD_LOCK = threading.Lock()
+
+# Stats of archive files as at previous reload, keyed by authority/collection namespace.
+_STATS = {}
+
+# Time (ns) from which archive file modifications are considered unseen, keyed by authority namespace.
+_SINCE = {}
+
+# Tolerance (ns) applied to modification times, i.e. file system timestamp granularity.
+_MTIME_TOLERANCE = 10 ** 7
+
+# Event used to stop background reload watcher.
+_WATCHER = None
+
+# Profile recorded during most recent initialisation.
+_PROFILE = None
+
+
+def init(
+    archive_dir=DIR_ARCHIVE,
+    authority=None,
+    scope=None,
+    lazy=LAZY_TERMS,
+    snapshot=USE_SNAPSHOT,
+    image=IMAGE_PATH,
+    io_workers=IO_WORKERS,
+    io_processes=IO_PROCESSES,
+    include=None,
+    reload_interval=RELOAD_INTERVAL,
+    background=BACKGROUND_LOADING,
+    profile=PROFILE_INIT
+):
     """Library initializer.
 
+    :param archive_dir: Directory hosting vocabulary archive, or path to a tar or zip package thereof.
     :param authority: Authority to be loaded (if unspecified then all will be loaded).
     :param scope: Scope to be loaded (if unspecified then all will be loaded).
+    :param lazy: Flag indicating whether collection terms are to be loaded upon first access.
+    :param snapshot: Flag indicating whether a warm-start snapshot is to be used (ignored if lazy).
+    :param image: Path to a read-only vocabulary image to be loaded instead of archive.
+    :param io_workers: Number of threads over which archive term files are read.
+    :param io_processes: Number of processes over which archive term files are read & decoded.
+    :param include: Namespaces of authorities, scopes and/or collections to be loaded, e.g. ['wcrp:cmip6:source-id'].
+    :param reload_interval: Number of seconds between background reloads of changed vocabularies (disabled if zero).
+    :param background: Flag indicating whether collection terms are to be loaded within a background thread.
+    :param profile: Flag indicating whether timings & I/O volumes are to be recorded (bypasses snapshot).
+    :returns: If loading in background, a future resolved once all collection terms have been loaded.
+    :rtype: concurrent.futures.Future | None
 
     """
-    # Verify archive folder exists.
-    if not os.path.isdir(archive_dir):
+    # Verify archive folder (or package) exists.
+    if image is None and not os.path.exists(archive_dir):
         raise EnvironmentError('{} directory does not exists'.format(archive_dir))
 
+    # Loading in background implies reading manifests now & terms later.
+    if background:
+        lazy = True
+        _READY.clear()
+
+    global _PROFILE
+    _PROFILE = profile = InitProfile() if profile else None
+
     # Load set of authorities from file system.
-    authorities = _load_authorities(archive_dir, authority, scope)
+    since = time.time_ns() - _MTIME_TOLERANCE
+    authorities = _load_authorities(
+        archive_dir, authority, scope, image, snapshot,
+        lazy=lazy, io_workers=io_workers, io_processes=io_processes, include=include, profile=profile
+        )
 
     # Mixin pseudo-constants.
-    _mixin_constants(authorities)
+    with get_step(profile, '_mixin_constants'):
+        _mixin_constants(authorities)
 
     # Set scope level accessor functions.
-    _mixin_scopeaccessors(authorities)
+    with get_step(profile, '_mixin_scopeaccessors'):
+        _mixin_scopeaccessors(authorities)
+
+    if profile is not None:
+        logger.log('Initialisation profile:\n{}'.format(profile.get_report()))
+
+    # Retain options for subsequent reloads.
+    _OPTIONS.update(
+        archive_dir=archive_dir, authority=authority, scope=scope, image=image, lazy=lazy, include=include
+        )
+    _STATS.clear()
+    _SINCE.clear()
+    _SINCE.update({i.namespace: since for i in authorities})
+
+    global _IS_INITIALISED
+    _IS_INITIALISED = True
+
+    # Start (or stop) background reloads.
+    watch(reload_interval)
+
+    if background:
+        return _preload(authorities)
+    _set_ready()
+
+
+def reload():
+    """Reloads vocabularies whose archive files have changed since initialisation or previous reload.
+
+    Only term directories that have changed (i.e. a term file was added, removed or replaced) are
+    listed, & only changed, added or removed term files are decoded.  Affected collections are
+    rebuilt within copies of their authority & scopes, which are swapped into archive hierarchy &
+    cache in a single step.  Callers holding previously loaded nodes continue to see them unchanged.
+    An authority whose manifest (or bundle/package) has changed is reloaded in full, whilst
+    vocabularies loaded from an image are never reloaded.
+
+    :returns: Namespaces of reloaded authorities & collections.
+    :rtype: list
+
+    """
+    if not _OPTIONS or _OPTIONS['image'] is not None:
+        return []
+
+    with _RELOAD_LOCK:
+        swaps = [i for i in map(_reload_authority, get_cached(Authority)) if i is not None]
+        if not swaps:
+            return []
+
+        # Replacement authorities are built off-line, therefore unchanged collections they share are
+        # re-parented whilst swapping cache entries.
+        def _swap():
+            for _, _, _, shared in swaps:
+                for collection, scope in shared:
+                    collection.scope = scope
+
+        replaced = [j for _, _, i, _ in swaps for j in i]
+        recache([i for _, i, _, _ in swaps], [j for i in replaced for j in _get_namespaces(i)], _swap)
+        _mixin_constants([i for _, i, _, _ in swaps])
+        _mixin_scopeaccessors([i for _, i, _, _ in swaps])
+
+        # Resolve references to reloaded terms.
+        _set_term_references({j.namespace for i in replaced for j in _get_terms(i)})
+
+        return [i.namespace for i in replaced]
+
+
+def watch(interval=RELOAD_INTERVAL):
+    """Starts (or stops) reloading changed vocabularies in a background thread.
+
+    :param interval: Number of seconds between reloads (stops reloading if zero).
+
+    """
+    global _WATCHER
+
+    if _WATCHER is not None:
+        _WATCHER.set()
+        _WATCHER = None
+
+    if interval:
+        _WATCHER = threading.Event()
+        threading.Thread(target=_watch, args=(_WATCHER, interval), name='pyessv-reload', daemon=True).start()
+
+
+def get_init_profile():
+    """Returns timings & I/O volumes recorded during most recent (profiled) initialisation.
 
+    :returns: Profile, or None if most recent initialisation was not profiled.
+    :rtype: pyessv.profiler.InitProfile | None
 
-def _load_authorities(archive_dir, authority, scope):
+    """
+    return _PROFILE
+
+
+def ready():
+    """Returns flag indicating whether library has been initialised (including terms loaded in background).
+
+    :rtype: bool
+
+    """
+    return _READY.is_set()
+
+
+def wait(timeout=None):
+    """Blocks until library has been initialised.
+
+    :param timeout: Maximum number of seconds to wait (if unspecified then waits indefinitely).
+    :returns: Flag indicating whether library has been initialised.
+    :rtype: bool
+
+    """
+    return _READY.wait(timeout)
+
+
+def add_ready_callback(callback):
+    """Registers a callback to be invoked once library has been initialised.
+
+    The callback is invoked immediately if library has already been initialised, otherwise from
+    within the thread that completes initialisation.
+
+    :param func callback: Callable invoked without arguments.
+
+    """
+    with _READY_LOCK:
+        if not _READY.is_set():
+            _READY_CALLBACKS.append(callback)
+            return
+    callback()
+
+
+def init_deferred(func):
+    """Decorates a function so that library initialisation occurs prior to first invocation.
+
+    :param func: Function to be decorated.
+
+    """
+    @functools.wraps(func)
+    def _decorator(*args, **kwargs):
+        _init_once()
+        return func(*args, **kwargs)
+
+    return _decorator
+
+
+def get_deferred_constant(name):
+    """Returns an authority pseudo-constant, initialising library beforehand if necessary.
+
+    :param str name: Name of a pseudo-constant, e.g. WCRP.
+
+    """
+    if name.startswith('_') or name != name.upper():
+        raise AttributeError('module pyessv has no attribute {}'.format(name))
+
+    _init_once()
+    try:
+        return vars(pyessv)[name]
+    except KeyError:
+        raise AttributeError('module pyessv has no attribute {}'.format(name))
+
+
+def _init_once():
+    """Initializes library if not already initialised.
+
+    """
+    if _IS_INITIALISED:
+        return
+    with _LOCK:
+        if not _IS_INITIALISED:
+            init()
+
+
+def _load_authorities(archive_dir, authority, scope, image, snapshot, **read_options):
     """Loads vocabulary authorities from archive.
 
     """
-    logger.log('Loading vocabularies from {} ... please wait'.format(DIR_ARCHIVE))
-    authorities = []
-    for authority in io_manager.read(archive_dir, authority, scope):
-        authorities.append(authority)
-        encache(authority)
+    logger.log('Loading vocabularies from {} ... please wait'.format(image or DIR_ARCHIVE))
+    with get_step(read_options['profile'], '_read_authorities'):
+        authorities = _read_authorities(archive_dir, authority, scope, image, snapshot, **read_options)
+    with get_step(read_options['profile'], 'encache'):
+        for authority in authorities:
+            encache(authority)
 
     return authorities
 
 
+def _read_authorities(archive_dir, authority, scope, image, snapshot, **read_options):
+    """Reads vocabulary authorities from either an image, a warm-start snapshot or the archive.
+
+    """
+    if image is not None:
+        return [io_manager.select(i, scope, read_options['include']) for i in io_image.read(image)
+                if authority in (None, i.canonical_name)]
+
+    if read_options['lazy'] or not snapshot or read_options['profile'] is not None:
+        result = io_manager.read(archive_dir, authority, scope, **read_options)
+    else:
+        result = io_snapshot.read(archive_dir, authority, scope, include=read_options['include'])
+        if result is None:
+            result = io_manager.read(archive_dir, authority, scope, **read_options)
+            io_snapshot.write(result, archive_dir, authority, scope, include=read_options['include'])
+
+    # A single authority is returned when one is specified.
+    return [result] if isinstance(result, Authority) else result
+
+
+def _preload(authorities):
+    """Loads collection terms within a background thread.
+
+    Collections required by callers beforehand are loaded upon demand in the calling thread.
+
+    """
+    future = concurrent.futures.Future()
+
+    def _load():
+        try:
+            for collection in [c for a in authorities for s in a for c in s]:
+                if not collection.is_loaded:
+                    collection.terms.load()
+            get_cached(Term)
+        except Exception as err:
+            logger.log_error('Vocabulary preload failed: {}'.format(err))
+            future.set_exception(err)
+        else:
+            future.set_result(authorities)
+        finally:
+            _set_ready()
+
+    threading.Thread(target=_load, name='pyessv-preload', daemon=True).start()
+
+    return future
+
+
+def _set_ready():
+    """Signals that library has been initialised, invoking registered callbacks.
+
+    """
+    with _READY_LOCK:
+        _READY.set()
+        callbacks = list(_READY_CALLBACKS)
+        del _READY_CALLBACKS[:]
+
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as err:
+            logger.log_error('Ready callback failed: {}'.format(err))
+
+
+def _watch(stopped, interval):
+    """Reloads changed vocabularies at a regular interval until stopped.
+
+    """
+    while not stopped.wait(interval):
+        try:
+            reload()
+        except Exception as err:
+            logger.log_error('Vocabulary reload failed: {}'.format(err))
+
+
+def _reload_authority(authority):
+    """Returns a replacement authority reflecting changes to its archive files, or None if unchanged.
+
+    :returns: Authority, its replacement, replaced nodes & collections shared with their replacement scope.
+    :rtype: tuple | None
+
+    """
+    # Authorities not loaded from archive are ignored.
+    if authority.namespace not in _SINCE:
+        return None
+
+    # Manifest changes imply a full reload.
+    since = time.time_ns() - _MTIME_TOLERANCE
+    stat = io_manager.get_source_stat(_OPTIONS['archive_dir'], authority)
+    if stat is not None and _is_changed(_STATS.get(authority.namespace), stat, _SINCE[authority.namespace]):
+        new = io_manager.read(
+            _OPTIONS['archive_dir'], authority.io_name, _OPTIONS['scope'],
+            lazy=_OPTIONS['lazy'], include=_OPTIONS['include']
+            )
+        for namespace in [i for i in _STATS if i.startswith(authority.namespace + ':')]:
+            del _STATS[namespace]
+        _STATS[authority.namespace] = stat
+        _SINCE[authority.namespace] = since
+        return authority, new, [authority], []
+    _STATS[authority.namespace] = stat
+
+    replacements = {}
+    if os.path.isdir(_OPTIONS['archive_dir']):
+        for scope in authority:
+            for collection in scope:
+                new = _reload_collection(collection)
+                if new is not None:
+                    replacements[collection] = new
+    if not replacements:
+        return None
+
+    return (authority, ) + _rebuild_authority(authority, replacements)
+
+
+def _rebuild_authority(authority, replacements):
+    """Returns a copy of an authority & its scopes holding replacement collections.
+
+    The authority & its scopes are left as they were, unchanged collections being shared with their
+    replacement scope (to which they are re-parented upon swap).
+
+    :returns: Replacement authority, replaced collections & collections shared with their replacement scope.
+    :rtype: tuple
+
+    """
+    new = copy.copy(authority)
+    new.scopes = new._items = []
+    shared = []
+    for scope in authority:
+        new_scope = copy.copy(scope)
+        new_scope.authority = new
+        new_scope.collections = new_scope._items = []
+        for collection in scope:
+            if collection in replacements:
+                replacements[collection].scope = new_scope
+                new_scope.collections.append(replacements[collection])
+            else:
+                shared.append((collection, new_scope))
+                new_scope.collections.append(collection)
+        new.scopes.append(new_scope)
+
+    return new, [i for s in authority for i in s if i in replacements], shared
+
+
+def _reload_collection(collection):
+    """Returns a rebuilt collection reflecting changes to its term files, or None if unchanged.
+
+    """
+    # Collections yet to be loaded will be read afresh upon first access.
+    if not collection.is_loaded:
+        return None
+
+    # Term directories are listed only once changed, i.e. a term file was added, removed or replaced.
+    stat = io_manager.get_collection_stat(_OPTIONS['archive_dir'], collection)
+    previous_stat, previous = _STATS.get(collection.namespace, (None, {}))
+    since = _SINCE[collection.authority.namespace]
+    if stat is None or not _is_changed(previous_stat, stat, since):
+        return None
+    stats = io_manager.get_term_stats(_OPTIONS['archive_dir'], collection)
+    if stats is None:
+        return None
+
+    # Determine changed, added & removed term files.
+    terms = {i.io_name: i for i in collection.terms}
+    changed = {k for k, v in stats.items() if k not in terms or _is_changed(previous.get(k), v, since)}
+    removed = set(terms) - set(stats)
+    if not changed and not removed:
+        _STATS[collection.namespace] = stat, stats
+        return None
+
+    try:
+        decoded = {i: io_manager.read_term(_OPTIONS['archive_dir'], collection, i) for i in changed}
+    # Files part way through being written are retried upon next reload.
+    except (IOError, ValueError) as err:
+        logger.log_warning('Cannot reload {}: {}'.format(collection.namespace, err))
+        return None
+    _STATS[collection.namespace] = stat, stats
+
+    # Rebuild collection rather than modify it so that callers iterating it see a consistent set of terms.
+    # Unchanged terms are copied, the replaced collection & its terms being left as they were.
+    new = copy.copy(collection)
+    new.terms = new._items = [decoded[k] if k in decoded else _copy_term(v)
+                              for k, v in terms.items() if k not in removed] + \
+                             [v for k, v in sorted(decoded.items()) if k not in terms]
+    for term in new.terms:
+        term.collection = new
+
+    # Columnar storage is retained, references to its terms being resolved to views upon swap.
+    if collection.is_columnar:
+        new.set_columnar()
+
+    return new
+
+
+def _copy_term(term):
+    """Returns a copy of a term whose mutable attributes are not shared with the original.
+
+    """
+    term = copy.copy(term)
+    term.alternative_names = list(term.alternative_names)
+    term.associations = list(term.associations)
+    if term.data is not None:
+        term.data = dict(term.data)
+
+    return term
+
+
+def _is_changed(previous, stat, since):
+    """Returns flag indicating whether a file has changed since previous reload (or since initialisation).
+
+    """
+    if previous is None:
+        return stat[1] >= since
+
+    return previous != stat
+
+
+def _get_namespaces(node):
+    """Returns namespaces of a node plus those of its loaded descendants.
+
+    """
+    namespaces = [node.namespace]
+    if isinstance(node, Authority):
+        for scope in node:
+            namespaces.append(scope.namespace)
+            for collection in scope:
+                namespaces += _get_namespaces(collection)
+    else:
+        namespaces += [i.namespace for i in _get_terms(node)]
+
+    return namespaces
+
+
+def _get_terms(node):
+    """Returns loaded terms of an authority or collection.
+
+    """
+    if isinstance(node, Authority):
+        return [t for s in node for c in s for t in _get_terms(c)]
+
+    return list(node.terms) if node.is_loaded else []
+
+
+def _set_term_references(replaced):
+    """Resolves term parent & association references following a reload.
+
+    """
+    for authority in get_cached(Authority):
+        terms = {i.namespace: i for i in _get_terms(authority)}
+        for term in terms.values():
+            if term.parent is not None:
+                term.parent = _get_term_reference(term.parent, terms, replaced)
+            if term.associations:
+                associations = [_get_term_reference(i, terms, replaced) for i in term.associations]
+                if any(i is not j for i, j in zip(associations, term.associations)):
+                    term.associations = associations
+
+
+def _get_term_reference(reference, terms, replaced):
+    """Returns a term reference resolved against an authority's current terms.
+
+    """
+    if isinstance(reference, Term):
+        if reference.namespace not in replaced:
+            return reference
+        reference = reference.namespace
+
+    return terms.get(reference, reference)
+
+
 def _mixin_constants(authorities):
     """Mixes in authorities as pseudo-constants to pyessv.
 
@@ -74,4 +603,4 @@ def _mixin_scopeaccessors(authorities):
         funcs = [i for i in inspect.getmembers(accessor)
                  if inspect.isfunction(i[1]) and not i[0].startswith('_')]
         for name, func in funcs:
-            setattr(scope, name, func)
+            scope.set_accessor(name, func)
@@ -0,0 +1,278 @@
+"""
+Read-only vocabulary image.
+
+An image is a single memory-mapped file holding:
+
+    - a header;
+    - a string table (each distinct string stored once);
+    - per collection: a term table (one string reference per term JSON blob)
+      plus exact & case-insensitive name indexes (sorted name/row pairs);
+    - a skeleton: authority manifests plus the location of each collection's tables.
+
+Processes mapping the same image share its physical pages.  Terms are decoded
+only when a collection is iterated or when a name lookup resolves to them.
+
+"""
+import json
+import mmap
+import struct
+import threading
+
+from pyessv.codecs import encode
+from pyessv.codecs import json_codec
+from pyessv.model import Authority
+
+
+# Image file signature.
+_MAGIC = b'PYESSVIM'
+
+# Image format version.
+_VERSION = 1
+
+# Header: magic, version, string offsets position, string count, string blob position, skeleton position, skeleton length.
+_HEADER = struct.Struct('<8sIQQQQQ')
+
+# String table offset.
+_OFFSET = struct.Struct('<Q')
+
+# Term table entry: string reference of term JSON blob.
+_TERM = struct.Struct('<I')
+
+# Name index entry: string reference of name, term row.
+_INDEX_ENTRY = struct.Struct('<II')
+
+
+def read(fpath):
+    """Reads vocabularies from an image.
+
+    :param str fpath: Path to image file.
+    :returns: List of vocabulary authorities whose collection terms are decoded upon demand.
+
+    """
+    return _Image(fpath).authorities
+
+
+def write(authorities, fpath):
+    """Writes vocabularies to an image.
+
+    :param list authorities: Vocabulary authorities to be written.
+    :param str fpath: Path to image file.
+
+    """
+    if isinstance(authorities, Authority):
+        authorities = [authorities]
+
+    strings = _StringTable()
+    tables = bytearray()
+    skeleton = {'authorities': [], 'collections': {}}
+
+    for authority in authorities:
+        skeleton['authorities'].append(encode(authority))
+        for scope in authority:
+            for collection in scope:
+                terms = list(collection)
+                info = [len(tables), len(terms)]
+                for term in terms:
+                    tables += _TERM.pack(strings.add(encode(term)))
+                for case_sensitive in (True, False):
+                    index = _get_index(terms, case_sensitive)
+                    info += [len(tables), len(index)]
+                    for name, row in index:
+                        tables += _INDEX_ENTRY.pack(strings.add(name), row)
+                skeleton['collections'][collection.namespace] = info
+
+    skeleton = json.dumps(skeleton).encode('utf-8')
+    offsets, blob = strings.dump()
+
+    # Layout: header | tables | string offsets | string blob | skeleton.
+    pos_tables = _HEADER.size
+    pos_offsets = pos_tables + len(tables)
+    pos_blob = pos_offsets + len(offsets)
+    pos_skeleton = pos_blob + len(blob)
+    with open(fpath, 'wb') as fstream:
+        fstream.write(_HEADER.pack(
+            _MAGIC, _VERSION, pos_offsets, len(strings), pos_blob, pos_skeleton, len(skeleton)
+            ))
+        fstream.write(tables)
+        fstream.write(offsets)
+        fstream.write(blob)
+        fstream.write(skeleton)
+
+
+def _get_index(terms, case_sensitive):
+    """Returns sorted name index of a collection's terms.
+
+    Name precedence mirrors IterableNode.__getitem__, i.e. canonical > raw > alternative names,
+    with ties resolved by term order.
+
+    """
+    index = {}
+    for attr in ('alternative_names', 'raw_name', 'canonical_name'):
+        for row in reversed(range(len(terms))):
+            names = getattr(terms[row], attr)
+            for name in names if isinstance(names, list) else [names]:
+                if name:
+                    index[name if case_sensitive else name.strip().lower()] = row
+
+    return sorted(index.items())
+
+
+class _StringTable(object):
+    """Table of distinct strings referenced by position.
+
+    """
+    def __init__(self):
+        """Instance constructor.
+
+        """
+        self._strings = []
+        self._positions = {}
+
+    def __len__(self):
+        """Returns number of strings.
+
+        """
+        return len(self._strings)
+
+    def add(self, value):
+        """Adds a string returning its position.
+
+        """
+        try:
+            return self._positions[value]
+        except KeyError:
+            self._positions[value] = len(self._strings)
+            self._strings.append(value.encode('utf-8'))
+            return self._positions[value]
+
+    def dump(self):
+        """Returns encoded string offsets & blob.
+
+        """
+        offsets, position = bytearray(), 0
+        for value in self._strings:
+            offsets += _OFFSET.pack(position)
+            position += len(value)
+        offsets += _OFFSET.pack(position)
+
+        return bytes(offsets), b''.join(self._strings)
+
+
+class _Image(object):
+    """A memory mapped vocabulary image.
+
+    """
+    def __init__(self, fpath):
+        """Instance constructor.
+
+        """
+        with open(fpath, 'rb') as fstream:
+            self._mm = mmap.mmap(fstream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self._pos_offsets, _, self._pos_blob, pos_skeleton, len_skeleton = \
+            _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION:
+            raise IOError('Invalid vocabulary image: {}'.format(fpath))
+
+        skeleton = json.loads(self._mm[pos_skeleton:pos_skeleton + len_skeleton].decode('utf-8'))
+        self._lock = threading.RLock()
+        self._tables = {}
+        self._terms = {}
+        self.authorities = [json_codec.decode(i, schema_aware=True) for i in skeleton['authorities']]
+        for authority in self.authorities:
+            for scope in authority:
+                for collection in scope:
+                    self._set_collection(collection, skeleton['collections'][collection.namespace])
+
+    def _set_collection(self, collection, info):
+        """Defers loading of a collection's terms to the image.
+
+        """
+        self._tables[collection.namespace] = (collection, info)
+        collection.defer_terms(
+            lambda: [self._get_term(collection, i) for i in range(info[1])],
+            lambda name, case_sensitive: self._find_term(collection, name, case_sensitive),
+            info[1]
+            )
+
+    def _get_string(self, idx):
+        """Returns a string from string table.
+
+        """
+        start, end = struct.unpack_from('<QQ', self._mm, self._pos_offsets + idx * _OFFSET.size)
+
+        return self._mm[self._pos_blob + start:self._pos_blob + end].decode('utf-8')
+
+    def _find_row(self, namespace, name, case_sensitive=True):
+        """Returns row of a term within a collection's term table via binary search of name index.
+
+        """
+        _, info = self._tables[namespace]
+        pos, count = info[2:4] if case_sensitive else info[4:6]
+        lower, upper = 0, count
+        while lower < upper:
+            middle = (lower + upper) // 2
+            name_idx, row = _INDEX_ENTRY.unpack_from(self._mm, _HEADER.size + pos + middle * _INDEX_ENTRY.size)
+            candidate = self._get_string(name_idx)
+            if candidate == name:
+                return row
+            elif candidate < name:
+                lower = middle + 1
+            else:
+                upper = middle
+
+    def _find_term(self, collection, name, case_sensitive):
+        """Returns a term by name, decoding it if necessary.
+
+        """
+        row = self._find_row(collection.namespace, name, case_sensitive)
+        if row is not None:
+            return self._get_term(collection, row)
+
+    def _get_term(self, collection, row):
+        """Returns a term, decoding it (plus those it references) if necessary.
+
+        """
+        with self._lock:
+            key = (collection.namespace, row)
+            if key in self._terms:
+                return self._terms[key]
+
+            pending = []
+            term = self._decode_term(collection, row, pending)
+            while pending:
+                referrer = pending.pop()
+                referrer.associations = [self._resolve(i, pending) for i in referrer.associations]
+
+            return term
+
+    def _decode_term(self, collection, row, pending):
+        """Decodes a term from term table.
+
+        """
+        _, info = self._tables[collection.namespace]
+        pos = _HEADER.size + info[0] + row * _TERM.size
+        term = json_codec.decode(self._get_string(_TERM.unpack_from(self._mm, pos)[0]), schema_aware=True)
+        term.collection = collection
+        self._terms[(collection.namespace, row)] = term
+        if term.associations:
+            pending.append(term)
+
+        return term
+
+    def _resolve(self, namespace, pending):
+        """Resolves a term namespace to a term.
+
+        """
+        collection_namespace, _, name = namespace.rpartition(':')
+        if collection_namespace not in self._tables:
+            return namespace
+
+        collection, _ = self._tables[collection_namespace]
+        row = self._find_row(collection_namespace, name)
+        if row is None:
+            return namespace
+        try:
+            return self._terms[(collection_namespace, row)]
+        except KeyError:
+            return self._decode_term(collection, row, pending)
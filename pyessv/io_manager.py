@@ -1,16 +1,36 @@
+import collections
+import contextlib
+import functools
 import glob
+import hashlib
+import itertools
 import json
+import multiprocessing
 import os
 import shutil
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 from os.path import isdir
 
 from pyessv.codecs import decode
 from pyessv.codecs import encode
+from pyessv.codecs import json_codec
 from pyessv.constants import DIR_ARCHIVE
+from pyessv.constants import ARCHIVE_LAYOUT_BUNDLE
+from pyessv.constants import ARCHIVE_LAYOUT_DIRECTORY
+from pyessv.constants import ARCHIVE_LAYOUT_SET
+from pyessv.constants import COLUMNAR_THRESHOLD
 from pyessv.constants import DIR_CONFIG
-from pyessv.constants import ENCODING_JSON
+from pyessv.constants import ENCODING_DICT
 from pyessv.constants import IDENTIFIER_TYPE_SET
+from pyessv.constants import IO_PROCESSES
+from pyessv.constants import IO_WORKERS
 from pyessv.model import Authority
 from pyessv.model import Collection
 from pyessv.model import Scope
@@ -18,11 +38,32 @@ from pyessv.model import Term
 from pyessv.model import Node
 from pyessv.validation import get_errors
 from pyessv.validation import is_valid
+from pyessv.utils.formatter import format_io_name
 
 
 # Manifest file name.
 _MANIFEST = 'MANIFEST'
 
+# Bundle file suffix.
+_BUNDLE_SUFFIX = '.bundle'
+
+# Index file name.
+_INDEX = 'INDEX'
+
+
+def convert(archive_dir, dest_dir, layout):
+    """Converts a vocabulary archive from one layout to another.
+
+    :param archive_dir: Directory hosting vocabulary archive to be converted.
+    :param dest_dir: Directory to which converted archive will be written.
+    :param layout: Layout of converted archive (directory | bundle).
+
+    """
+    assert layout in ARCHIVE_LAYOUT_SET, 'Invalid archive layout'
+
+    for authority in read(archive_dir):
+        write(authority, dest_dir, layout)
+
 
 def delete(target):
     """Deletes vocabulary data from file system.
@@ -59,19 +100,146 @@ def delete(target):
         pass
 
 
-def read(archive_dir=DIR_ARCHIVE, authority=None, scope=None):
+def read(
+    archive_dir=DIR_ARCHIVE,
+    authority=None,
+    scope=None,
+    lazy=False,
+    io_workers=IO_WORKERS,
+    io_processes=IO_PROCESSES,
+    include=None,
+    profile=None,
+    columnar=COLUMNAR_THRESHOLD
+):
     """Reads vocabularies from archive folder (~/.esdoc/pyessv-archive) upon file system.
 
-    :param archive_dir: Directory hosting vocabulary archive.
+    :param archive_dir: Directory hosting vocabulary archive, or path to a tar or zip package thereof.
     :param authority: Authority to be loaded (if unspecified then all will be loaded).
     :param scope: Scope to be loaded (if unspecified then all will be loaded).
+    :param lazy: Flag indicating whether collection terms are to be loaded upon first access.
+    :param io_workers: Number of threads over which term files are read (if > 1).
+    :param io_processes: Number of processes over which term files are read & decoded (if > 1).
+    :param include: Namespaces of authorities, scopes and/or collections to be loaded (if unspecified then all will be loaded).
+    :param profile: Profile against which timings & I/O volumes are recorded (term files are then read sequentially).
+    :param columnar: Minimum number of terms of a collection whose terms are held in columnar storage (disabled if zero).
     :returns: List of vocabulary authorities loaded from archive folder.
 
     """
-    if authority is not None:
-        return _read_authority("{}/{}".format(archive_dir, authority), scope)
+    if _is_package(archive_dir):
+        result = _read_package(archive_dir, authority, scope, lazy, include)
+    else:
+        # Profiled reads are sequential so that measurements are attributable to collections.
+        if profile is not None:
+            io_workers = io_processes = None
+
+        with _get_executor(io_workers, io_processes) as executor:
+            if authority is not None:
+                result = _read_authority(
+                    _get_path_to_authority(archive_dir, authority), scope, lazy, executor, include, profile
+                    )
+            else:
+                result = [_read_authority(i, lazy=lazy, executor=executor, include=include, profile=profile)
+                          for i in _get_paths_to_authorities(archive_dir)
+                          if _is_included(_get_authority_name(i), include)]
+
+    # Hold terms of large collections in columnar storage.
+    if columnar:
+        for i in [result] if isinstance(result, Authority) else result:
+            _set_term_columns(i, columnar)
+
+    return result
+
+
+def select(authority, scope=None, include=None):
+    """Removes scopes & collections not selected for loading from an authority.
+
+    :param pyessv.Authority authority: Authority from which unselected scopes & collections are removed.
+    :param scope: Scope to be retained (if unspecified then all will be retained).
+    :param include: Namespaces of scopes and/or collections to be retained (if unspecified then all will be retained).
+    :returns: The authority.
+
+    """
+    authority.scopes[:] = [i for i in authority
+                           if scope in (None, i.canonical_name) and _is_included(i.namespace, include)]
+    for i in authority:
+        i.collections[:] = [j for j in i if _is_included(j.namespace, include)]
+
+    return authority
+
+
+def get_source_stat(archive_dir, authority):
+    """Returns size & modification time of the file from which an authority's manifest is read.
+
+    :param archive_dir: Directory hosting vocabulary archive, or path to a tar or zip package thereof.
+    :param pyessv.Authority authority: Authority read from archive.
+    :returns: Size & modification time (ns) of manifest, bundle or package, or None if missing.
+
+    """
+    if os.path.isfile(archive_dir):
+        fpath = archive_dir
     else:
-        return [_read_authority(i) for i in glob.glob('{}/*'.format(archive_dir)) if isdir(i)]
+        fpath = _get_path_to_authority(archive_dir, authority.io_name)
+        if isdir(fpath):
+            fpath = join(fpath, _MANIFEST)
+    try:
+        stat = os.stat(fpath)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_collection_stat(archive_dir, collection):
+    """Returns size & modification time of a collection's term directory, changed whenever a term file is added,
+    removed or replaced (e.g. by git or rsync).
+
+    :param archive_dir: Directory hosting vocabulary archive.
+    :param pyessv.Collection collection: Collection read from archive.
+    :returns: Size & modification time (ns) of term directory, or None if missing.
+
+    """
+    dpath = join(archive_dir, collection.authority.io_name, collection.scope.io_name, collection.io_name)
+    try:
+        stat = os.stat(dpath)
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_term_stats(archive_dir, collection):
+    """Returns size & modification time of each of a collection's term files.
+
+    :param archive_dir: Directory hosting vocabulary archive.
+    :param pyessv.Collection collection: Collection read from archive.
+    :returns: Size & modification time (ns) keyed by term file name, or None if collection has no term directory.
+
+    """
+    dpath = join(archive_dir, collection.authority.io_name, collection.scope.io_name, collection.io_name)
+    if not isdir(dpath):
+        return None
+
+    stats = {}
+    for entry in os.scandir(dpath):
+        if entry.is_file() and not entry.name.startswith('.'):
+            stat = entry.stat()
+            stats[entry.name] = (stat.st_size, stat.st_mtime_ns)
+
+    return stats
+
+
+def read_term(archive_dir, collection, name):
+    """Reads a term from archive.
+
+    :param archive_dir: Directory hosting vocabulary archive.
+    :param pyessv.Collection collection: Collection to which term belongs.
+    :param str name: Term file name.
+    :returns: Term whose parent & associations are yet to be resolved.
+
+    """
+    dpath = join(archive_dir, collection.authority.io_name, collection.scope.io_name, collection.io_name)
+
+    return _read_term(join(dpath, name))
 
 
 def read_scope_parser_config(s, identifier_type, config_dir=DIR_CONFIG):
@@ -88,20 +256,28 @@ def read_scope_parser_config(s, identifier_type, config_dir=DIR_CONFIG):
         return json.loads(fstream.read())
 
 
-def write(authority, archive_dir=DIR_ARCHIVE):
+def write(authority, archive_dir=DIR_ARCHIVE, layout=ARCHIVE_LAYOUT_DIRECTORY):
     """Writes authority CV data to file system.
 
     :param pyessv.Authority authority: Authority class instance to be written to file-system.
     :param archive_dir: Directory hosting vocabulary archive.
+    :param layout: Archive layout (directory | bundle).
 
     """
     assert isinstance(authority, Authority), \
         'Invalid authority: unknown type'
     assert isdir(archive_dir), \
         'Invalid authority directory.'
+    assert layout in ARCHIVE_LAYOUT_SET, \
+        'Invalid archive layout.'
     assert is_valid(authority), \
         'Invalid authority: {} : {}'.format(authority, get_errors(authority))
 
+    # Write bundle.
+    if layout == ARCHIVE_LAYOUT_BUNDLE:
+        _write_bundle(archive_dir, authority)
+        return
+
     # Set directory.
     dpath = join(archive_dir, authority.io_name)
     try:
@@ -110,14 +286,22 @@ def write(authority, archive_dir=DIR_ARCHIVE):
         pass
 
     # Write manifest.
+    manifest = encode(authority)
     with open(join(dpath, _MANIFEST), 'w') as fstream:
-        fstream.write(encode(authority))
+        fstream.write(manifest)
 
     # Write collections/terms.
+    index = {}
     for scope in authority:
         for collection in scope:
-            for term in collection:
-                _write_term(dpath, term)
+            index[_get_collection_key(scope, collection)] = [_write_term(dpath, i) for i in collection]
+
+    # Write index of term files, trusted whilst manifest & listed term file sizes are unchanged.
+    with open(join(dpath, _INDEX), 'w') as fstream:
+        fstream.write(json.dumps({
+            'manifest': _get_hash(manifest),
+            'collections': index
+            }, indent=4))
 
 
 def write_scope_parser_config(scope, identifier_type, cfg, config_dir=DIR_CONFIG):
@@ -157,28 +341,359 @@ def _get_path_to_scope_parser_config(s, identifier_type, config_dir):
     return join(io_path, "{}.json".format(identifier_type))
 
 
-def _read_authority(dpath, scope_id=None):
+def _get_executor(io_workers, io_processes):
+    """Returns context manager yielding a pool executor (or None if reading sequentially).
+
+    """
+    if io_processes is not None and io_processes > 1:
+        if _is_fork_safe():
+            return ProcessPoolExecutor(max_workers=io_processes, mp_context=multiprocessing.get_context('fork'))
+        # ... otherwise fall back to threads.
+        io_workers = max(io_workers or 1, io_processes)
+
+    if io_workers is not None and io_workers > 1:
+        return ThreadPoolExecutor(max_workers=io_workers)
+
+    return contextlib.nullcontext()
+
+
+def _is_fork_safe():
+    """Returns flag indicating whether archive files can be read within forked worker processes.
+
+    Process pools are restricted to forked workers as spawned workers would re-initialise library.
+    Forking is unsafe upon macOS, and whilst other threads (e.g. background preload or reload) are
+    alive as a child may inherit a lock held by one of them.
+
+    """
+    return 'fork' in multiprocessing.get_all_start_methods() and \
+        sys.platform != 'darwin' and \
+        threading.active_count() == 1
+
+
+def _get_path_to_authority(archive_dir, authority):
+    """Returns path to an authority's directory, or to its bundle if no such directory exists.
+
+    """
+    dpath = join(archive_dir, authority)
+    if not isdir(dpath) and os.path.isfile(dpath + _BUNDLE_SUFFIX):
+        return dpath + _BUNDLE_SUFFIX
+
+    return dpath
+
+
+def _get_paths_to_authorities(archive_dir):
+    """Returns paths to authority directories & bundles within an archive.
+
+    """
+    dpaths = [i for i in glob.glob(join(archive_dir, '*')) if isdir(i)]
+    fpaths = [i for i in glob.glob(join(archive_dir, '*' + _BUNDLE_SUFFIX))
+              if i[:-len(_BUNDLE_SUFFIX)] not in dpaths]
+
+    return dpaths + fpaths
+
+
+def _get_authority_name(path):
+    """Returns name of an authority from path to its directory or bundle.
+
+    """
+    name = os.path.basename(path)
+
+    return name[:-len(_BUNDLE_SUFFIX)] if name.endswith(_BUNDLE_SUFFIX) else name
+
+
+def _is_included(namespace, include):
+    """Returns flag indicating whether a node is selected for loading.
+
+    A node is selected if its namespace is either an ancestor or a descendant of an included namespace.
+
+    """
+    if include is None:
+        return True
+
+    names = namespace.split(':')
+    for i in include:
+        i = i.lower().split(':')
+        if names[:len(i)] == i[:len(names)]:
+            return True
+
+    return False
+
+
+def _read_authority(dpath, scope_id=None, lazy=False, executor=None, include=None, profile=None):
     """Reads authority CV data from file system.
 
     """
+    start = time.perf_counter()
+    if dpath.endswith(_BUNDLE_SUFFIX):
+        authority = _read_bundle(dpath, scope_id, lazy, include)
+        if profile is not None:
+            profile.record(authority.namespace, time.perf_counter() - start, 1, os.path.getsize(dpath))
+        return authority
+
     # Read authority from manifest.
     try:
-        with open(join(dpath, _MANIFEST), 'r') as fstream:
-            authority = decode(fstream.read(), ENCODING_JSON)
+        manifest = _read_file(join(dpath, _MANIFEST))
     except IOError:
         raise IOError('Invalid authority MANIFEST: {}/MANIFEST'.format(dpath))
+    authority = json_codec.decode(manifest, schema_aware=True)
+    if profile is not None:
+        profile.record(authority.namespace, time.perf_counter() - start, 1, len(manifest.encode('utf-8')))
+
+    # Remove unselected scopes & collections so that their term directories are never read.
+    select(authority, scope_id, include)
 
     # Read terms.
+    index = _read_index(dpath, manifest)
     termcache = {}
+    targets = []
     for scope in authority:
-        if scope_id is not None and scope.canonical_name != scope_id:
-            authority.scopes.remove(scope)
-            continue
         for collection in scope:
-            for term in _read_terms(dpath, scope, collection, termcache):
-                term.collection = collection
-                collection.terms.append(term)
+            if lazy:
+                collection.defer_terms(functools.partial(
+                    _read_terms_deferred, dpath, scope, collection, termcache, index
+                    ))
+            else:
+                targets.append((scope, collection))
+    try:
+        collections = _read_collections(dpath, targets, executor, index, profile)
+    # Index is stale, therefore list term directories instead.
+    except FileNotFoundError:
+        if index is None:
+            raise
+        collections = _read_collections(dpath, targets, executor, profile=profile)
+    for (_, collection), terms in zip(targets, collections):
+        collection.terms.extend(_set_terms(collection, terms, termcache))
+
+    # Set term hierarchies.
+    start = time.perf_counter()
+    _set_term_hierarchies(termcache)
+    if profile is not None:
+        profile.record(authority.namespace, time.perf_counter() - start)
+
+    return authority
+
+
+def _read_index(dpath, manifest):
+    """Returns an authority's index of term files keyed by collection, or None if missing or stale.
+
+    """
+    try:
+        index = json.loads(_read_file(join(dpath, _INDEX)))
+    except (IOError, ValueError):
+        return None
+
+    # Indexes written alongside a different manifest (which lists terms) are stale.
+    if index.get('manifest') != _get_hash(manifest):
+        return None
+
+    return index['collections']
+
+
+def _get_hash(as_json):
+    """Returns hash of a JSON document as written to file system.
+
+    """
+    return hashlib.sha1(as_json.encode('utf-8')).hexdigest()
+
+
+def _read_bundle(fpath, scope_id=None, lazy=False, include=None):
+    """Reads authority CV data from a bundle, i.e. a manifest line followed by a line per term.
+
+    """
+    try:
+        with open(fpath, 'r') as fstream:
+            return _decode_bundle(fstream.read(), scope_id, lazy, include)
+    except (IOError, IndexError, ValueError):
+        raise IOError('Invalid authority bundle: {}'.format(fpath))
+
+
+def _decode_bundle(text, scope_id=None, lazy=False, include=None):
+    """Decodes authority CV data from bundle text.
+
+    """
+    lines = text.splitlines()
+
+    # Group term records by collection.
+    records = collections.defaultdict(list)
+    for line in lines[1:]:
+        key, _, record = line.partition('\t')
+        records[key].append(record)
+
+    return _decode_authority(lines[0], records, scope_id, lazy, include)
+
+
+def _decode_authority(manifest, records, scope_id=None, lazy=False, include=None):
+    """Decodes authority CV data from a manifest plus term records grouped by collection.
+
+    """
+    authority = select(json_codec.decode(manifest, schema_aware=True), scope_id, include)
 
+    # Decode terms.
+    termcache = {}
+    for scope in authority:
+        for collection in scope:
+            key = _get_collection_key(scope, collection)
+            if lazy:
+                collection.defer_terms(functools.partial(
+                    _decode_terms_deferred, records.get(key, []), collection, termcache
+                    ))
+            else:
+                terms = [json_codec.decode(i, schema_aware=True) for i in records.get(key, [])]
+                collection.terms.extend(_set_terms(collection, terms, termcache))
+
+    # Set term hierarchies.
+    _set_term_hierarchies(termcache)
+
+    return authority
+
+
+def _is_package(fpath):
+    """Gets flag indicating whether a path is a tar or zip package.
+
+    """
+    return os.path.isfile(fpath) and (zipfile.is_zipfile(fpath) or tarfile.is_tarfile(fpath))
+
+
+def _read_package(fpath, authority_id=None, scope_id=None, lazy=False, include=None):
+    """Reads authority CV data from a tar or zip package in a single sequential pass.
+
+    Packages may hold authorities in either layout, beneath an optional top-level directory.
+    Members are read only if they may hold selected CV data, whilst the term files of a lazily
+    read zip package are read upon first access of their collection.
+
+    """
+    defer = lazy and zipfile.is_zipfile(fpath)
+
+    # Map authority directory paths to manifests & term records, plus bundle paths to bundles.
+    manifests, bundles = {}, {}
+    records = collections.defaultdict(lambda: collections.defaultdict(list))
+    for name, path, read in _iter_package(fpath):
+        if path[-1] == _MANIFEST:
+            if _is_member_selected(path[-2:-1], authority_id, scope_id, include):
+                manifests[path[:-1]] = read()
+        elif path[-1].endswith(_BUNDLE_SUFFIX):
+            if _is_member_selected((_get_authority_name(path[-1]), ), authority_id, scope_id, include):
+                bundles[path] = read()
+        elif len(path) > 3 and _is_member_selected(path[-4:-1], authority_id, scope_id, include):
+            records[path[:-3]]['/'.join(path[-3:-1])].append(name if defer else read())
+    if defer:
+        records = {k: {i: _PackageRecords(fpath, j) for i, j in v.items()} for k, v in records.items()}
+
+    # Decode authorities.
+    authorities = []
+    for path in sorted(manifests):
+        authorities.append(_decode_authority(manifests[path], records.get(path, {}), scope_id, lazy, include))
+    for path in sorted(bundles):
+        if path[:-1] + (_get_authority_name(path[-1]), ) not in manifests:
+            authorities.append(_decode_bundle(bundles[path], scope_id, lazy, include))
+
+    if authority_id is None:
+        return authorities
+    elif authorities:
+        return authorities[0]
+    raise IOError('Invalid authority: {} not found within {}'.format(authority_id, fpath))
+
+
+def _is_member_selected(names, authority_id=None, scope_id=None, include=None):
+    """Returns flag indicating whether a package member may hold selected CV data, i.e. prior to its being read.
+
+    :param tuple names: I/O names of authority, scope & collection (scope & collection are optional).
+
+    """
+    if authority_id not in (None, names[0]):
+        return False
+    if len(names) > 1 and scope_id is not None and format_io_name(scope_id) != names[1]:
+        return False
+    if include is not None:
+        include = [':'.join(format_io_name(j) for j in i.split(':')) for i in include]
+
+    return _is_included(':'.join(names), include)
+
+
+def _iter_package(fpath):
+    """Yields name, path & reader of each non-hidden file within a tar or zip package.
+
+    Readers must be called prior to advancing to the next file.
+
+    """
+    def _get_path(name):
+        return tuple(i for i in name.split('/') if i not in ('', '.'))
+
+    def _is_hidden(path):
+        return not path or any(i.startswith('.') for i in path)
+
+    if zipfile.is_zipfile(fpath):
+        with zipfile.ZipFile(fpath) as package:
+            for info in package.infolist():
+                path = _get_path(info.filename)
+                if not info.is_dir() and not _is_hidden(path):
+                    yield info.filename, path, functools.partial(_read_member, package.read, info)
+    else:
+        with tarfile.open(fpath, 'r|*') as package:
+            for info in package:
+                path = _get_path(info.name)
+                if info.isfile() and not _is_hidden(path):
+                    yield info.name, path, functools.partial(_read_member, package.extractfile, info)
+
+
+def _read_member(reader, info):
+    """Returns text of a file within a tar or zip package.
+
+    """
+    content = reader(info)
+    if not isinstance(content, bytes):
+        content = content.read()
+
+    return content.decode('utf-8')
+
+
+class _PackageRecords(object):
+    """Term records within a zip package, read upon iteration.
+
+    """
+    def __init__(self, fpath, names):
+        """Instance constructor.
+
+        :param str fpath: Path to zip package.
+        :param list names: Names of term files within package.
+
+        """
+        self._fpath = fpath
+        self._names = names
+
+    def __iter__(self):
+        """Yields text of each term file.
+
+        """
+        with zipfile.ZipFile(self._fpath) as package:
+            for name in self._names:
+                yield package.read(name).decode('utf-8')
+
+
+def _decode_terms_deferred(records, collection, termcache):
+    """Decodes terms from bundle records upon first access of a collection.
+
+    """
+    terms = [json_codec.decode(i, schema_aware=True) for i in records]
+    terms = _set_terms(collection, terms, termcache)
+
+    # Terms loaded previously may reference those just loaded (and vice-versa).
+    _set_term_hierarchies(termcache)
+
+    return terms
+
+
+def _get_collection_key(scope, collection):
+    """Returns key of a collection's term records within a bundle or index.
+
+    """
+    return '{}/{}'.format(scope.io_name, collection.io_name)
+
+
+def _set_term_hierarchies(termcache):
+    """Resolves term parent & association namespaces to term instances.
+
+    """
     # Set inter-term hierarchies.
     for term in termcache.values():
         if term.parent in termcache:
@@ -188,31 +703,202 @@ def _read_authority(dpath, scope_id=None):
     for term in [i for i in termcache.values() if i.associations]:
         term.associations = [termcache[i] if i in termcache else i for i in term.associations]
 
-    return authority
+
+def _set_term_columns(authority, threshold):
+    """Holds terms of an authority's large collections in columnar storage.
+
+    """
+    replaced = {}
+    for scope in authority:
+        for collection in scope:
+            if collection.is_loaded and len(collection.terms) >= threshold:
+                rows = collection.set_columnar()
+                replaced.update({k: (collection.terms, v) for k, v in rows.items()})
+    if not replaced:
+        return
+
+    # Re-point references to replaced terms to their views.
+    def _resolve(reference):
+        try:
+            columns, row = replaced[reference]
+        except (KeyError, TypeError):
+            return reference
+        return columns[row]
+
+    for scope in authority:
+        for collection in scope:
+            if collection.is_columnar:
+                collection.terms.set_references(_resolve)
+            elif collection.is_loaded:
+                for term in collection.terms:
+                    term.parent = _resolve(term.parent)
+                    if term.associations:
+                        term.associations = [_resolve(i) for i in term.associations]
 
 
-def _read_terms(dpath, scope, collection, termcache):
+def _read_terms_deferred(dpath, scope, collection, termcache, index=None):
+    """Reads terms from file system upon first access of a collection.
+
+    """
+    try:
+        terms = _read_terms(dpath, scope, collection, termcache, index)
+    # Index is stale, therefore list term directory instead.
+    except FileNotFoundError:
+        if index is None:
+            raise
+        terms = _read_terms(dpath, scope, collection, termcache)
+
+    # Terms loaded previously may reference those just loaded (and vice-versa).
+    _set_term_hierarchies(termcache)
+
+    return terms
+
+
+def _read_collections(dpath, targets, executor, index=None, profile=None):
+    """Reads terms of a set of collections from file system.
+
+    Term files are read concurrently when an executor is passed, results being returned in same order
+    as when reading sequentially.
+
+    """
+    if profile is not None:
+        return [_read_terms_profiled(dpath, s, c, index, profile) for s, c in targets]
+
+    if executor is None:
+        return [[_read_term(*i) for i in _get_term_files(dpath, s, c, index)] for s, c in targets]
+
+    # Processes decode collections to dictionaries, which are cheaply shipped back for final decoding.
+    if isinstance(executor, ProcessPoolExecutor):
+        dpaths = [join(dpath, s.io_name, c.io_name) for s, c in targets]
+        files = [_get_indexed_files(index, s, c) for s, c in targets]
+        return [[decode(i, ENCODING_DICT) for i in obj] for obj in executor.map(_read_term_dicts, dpaths, files)]
+
+    # Threads overlap file system latency whilst decoding (CPU bound) proceeds in calling thread.
+    fpaths = list(executor.map(lambda i: _get_term_files(dpath, *i, index), targets))
+    blobs = executor.map(lambda i: _read_file(*i), itertools.chain.from_iterable(fpaths))
+    terms = (json_codec.decode(i, schema_aware=True) for i in blobs)
+
+    return [list(itertools.islice(terms, len(i))) for i in fpaths]
+
+
+def _read_terms(dpath, scope, collection, termcache, index=None):
     """Reads terms from file system.
 
+    """
+    terms = [_read_term(*i) for i in _get_term_files(dpath, scope, collection, index)]
+
+    return _set_terms(collection, terms, termcache)
+
+
+def _read_terms_profiled(dpath, scope, collection, index, profile):
+    """Reads a collection's terms from file system recording timings & I/O volumes.
+
+    """
+    start = time.perf_counter()
+    terms, size, decode_time = [], 0, 0.0
+    for fpath, expected_size in _get_term_files(dpath, scope, collection, index):
+        with open(fpath, 'rb') as fstream:
+            blob = fstream.read()
+        if expected_size is not None and len(blob) != expected_size:
+            raise _StaleIndexError(fpath)
+        size += len(blob)
+        decode_start = time.perf_counter()
+        terms.append(json_codec.decode(blob.decode('utf-8'), schema_aware=True))
+        decode_time += time.perf_counter() - decode_start
+    profile.record(collection.namespace, time.perf_counter() - start, len(terms), size, decode_time)
+
+    return terms
+
+
+def _get_term_files(dpath, scope, collection, index=None):
+    """Returns paths & indexed sizes of a collection's term files, listing its directory only if not indexed.
+
     """
     dpath = join(dpath, scope.io_name)
     dpath = join(dpath, collection.io_name)
-    dpath = join(dpath, '*')
 
-    return [_read_term(i, collection, termcache) for i in glob.iglob(dpath)]
+    files = _get_indexed_files(index, scope, collection)
+    if files is not None:
+        return [(join(dpath, i), size) for i, size in files]
 
+    return [(i, None) for i in glob.glob(join(dpath, '*'))]
 
-def _read_term(fpath, collection, termcache):
-    """Reads terms from file system.
+
+def _get_indexed_files(index, scope, collection):
+    """Returns names & sizes of a collection's term files as listed within an index (or None if not indexed).
+
+    """
+    try:
+        return [(i[0], i[1]) for i in index[_get_collection_key(scope, collection)]]
+    except (KeyError, TypeError):
+        return None
+
+
+def _read_term_dicts(dpath, files=None):
+    """Reads dictionary representations of a collection's terms from file system.
+
+    """
+    if files is None:
+        files = [(i, None) for i in glob.glob(join(dpath, '*'))]
+    else:
+        files = [(join(dpath, i), size) for i, size in files]
+
+    return [json_codec.decode_as_dict(_read_file(*i), schema_aware=True) for i in files]
+
+
+def _read_term(fpath, size=None):
+    """Reads a term from file system.
+
+    """
+    return json_codec.decode(_read_file(fpath, size), schema_aware=True)
+
+
+def _read_file(fpath, size=None):
+    """Reads a text file from file system.
+
+    :param str fpath: Path to file.
+    :param int size: Size (in bytes) of file as listed within an index.
 
     """
     with open(fpath, 'r') as fstream:
-        term = decode(fstream.read(), ENCODING_JSON)
+        # Files whose size differs from that listed within an index have changed since it was written.
+        if size is not None and os.fstat(fstream.fileno()).st_size != size:
+            raise _StaleIndexError(fpath)
+        return fstream.read()
 
-    term.collection = collection
-    termcache[term.namespace] = term
 
-    return term
+class _StaleIndexError(FileNotFoundError):
+    """Raised when a term file listed within an index has changed since index was written.
+
+    Treated as a missing term file, i.e. term directories are listed instead.
+
+    """
+
+
+def _set_terms(collection, terms, termcache):
+    """Binds terms to their collection & caches them for subsequent hierarchy resolution.
+
+    """
+    for term in terms:
+        term.collection = collection
+        termcache[term.namespace] = term
+
+    return terms
+
+
+def _write_bundle(archive_dir, authority):
+    """Writes an authority to a bundle, i.e. a manifest line followed by a line per term.
+
+    """
+    fpath = join(archive_dir, authority.io_name + _BUNDLE_SUFFIX)
+    with open(fpath, 'w') as fstream:
+        fstream.write(json_codec.encode(authority, indent=None))
+        fstream.write('\n')
+        for scope in authority:
+            for collection in scope:
+                key = _get_collection_key(scope, collection)
+                for term in collection:
+                    fstream.write('{}\t{}\n'.format(key, json_codec.encode(term, indent=None)))
 
 
 def _write_term(dpath, term):
@@ -231,5 +917,8 @@ def _write_term(dpath, term):
     fpath = join(dpath, term.io_name)
 
     # Write term JSON file.
+    as_json = encode(term)
     with open(fpath, 'w') as fstream:
-        fstream.write(encode(term))
+        fstream.write(as_json)
+
+    return [term.io_name, len(as_json.encode('utf-8')), _get_hash(as_json)]
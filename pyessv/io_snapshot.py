@@ -0,0 +1,159 @@
+import hashlib
+import os
+import pickle
+from os.path import join
+
+import pyessv
+from pyessv.constants import DIR_ARCHIVE
+from pyessv.constants import DIR_SNAPSHOT
+from pyessv.io_manager import _get_path_to_authority
+from pyessv.model import Authority
+from pyessv.model import Term
+from pyessv.model.columns import TermColumns
+
+
+# Snapshot format version - increment whenever the domain model changes.
+_FORMAT_VERSION = 7
+
+
+def get_fingerprint(archive_dir=DIR_ARCHIVE):
+    """Returns a fingerprint of a vocabulary archive derived from the size & mtime of each file.
+
+    :param archive_dir: Directory hosting vocabulary archive, or path to a package thereof.
+    :returns: Archive fingerprint.
+    :rtype: str
+
+    """
+    if os.path.isfile(archive_dir):
+        stat = os.stat(archive_dir)
+        return hashlib.sha1('{}|{}'.format(stat.st_size, stat.st_mtime_ns).encode('utf-8')).hexdigest()
+
+    stats = []
+    for dpath, dnames, fnames in os.walk(archive_dir):
+        dnames[:] = [i for i in dnames if not i.startswith('.')]
+        for fname in fnames:
+            if fname.startswith('.'):
+                continue
+            fpath = join(dpath, fname)
+            stat = os.stat(fpath)
+            stats.append('{}|{}|{}'.format(os.path.relpath(fpath, archive_dir), stat.st_size, stat.st_mtime_ns))
+
+    return hashlib.sha1('\n'.join(sorted(stats)).encode('utf-8')).hexdigest()
+
+
+def read(archive_dir=DIR_ARCHIVE, authority=None, scope=None, snapshot_dir=DIR_SNAPSHOT, include=None):
+    """Reads vocabularies from a warm-start snapshot.
+
+    :param archive_dir: Directory hosting vocabulary archive.
+    :param authority: Authority to be loaded (if unspecified then all will be loaded).
+    :param scope: Scope to be loaded (if unspecified then all will be loaded).
+    :param snapshot_dir: Directory hosting snapshots.
+    :param include: Namespaces of authorities, scopes and/or collections to be loaded.
+    :returns: Vocabularies as returned by io_manager.read, or None if snapshot is missing or stale.
+
+    """
+    fpath = _get_path_to_snapshot(archive_dir, authority, scope, snapshot_dir, include)
+    try:
+        with open(fpath, 'rb') as fstream:
+            if pickle.load(fstream) != _get_header(archive_dir, authority):
+                return None
+            result = pickle.load(fstream)
+    # Corrupted or incompatible snapshots are simply ignored.
+    except Exception:
+        return None
+
+    _restore_references(result)
+
+    return result
+
+
+def write(result, archive_dir=DIR_ARCHIVE, authority=None, scope=None, snapshot_dir=DIR_SNAPSHOT, include=None):
+    """Writes vocabularies to a warm-start snapshot.
+
+    :param result: Vocabularies as returned by io_manager.read.
+    :param archive_dir: Directory hosting vocabulary archive.
+    :param authority: Authority that was loaded.
+    :param scope: Scope that was loaded.
+    :param snapshot_dir: Directory hosting snapshots.
+    :param include: Namespaces of authorities, scopes and/or collections that were loaded.
+
+    """
+    try:
+        os.makedirs(snapshot_dir)
+    except OSError:
+        pass
+
+    # Write to a temporary file & swap so that concurrent readers never see a partial snapshot.
+    fpath = _get_path_to_snapshot(archive_dir, authority, scope, snapshot_dir, include)
+    fpath_tmp = '{}.{}'.format(fpath, os.getpid())
+    with open(fpath_tmp, 'wb') as fstream:
+        pickle.dump(_get_header(archive_dir, authority), fstream, pickle.HIGHEST_PROTOCOL)
+        _Pickler(fstream, pickle.HIGHEST_PROTOCOL).dump(result)
+    os.replace(fpath_tmp, fpath)
+
+
+def _get_header(archive_dir, authority):
+    """Returns snapshot header used to determine whether a snapshot is stale.
+
+    """
+    # An authority is fingerprinted via its directory or bundle, a package being fingerprinted as a whole.
+    if authority is not None and os.path.isdir(archive_dir):
+        archive_dir = _get_path_to_authority(archive_dir, authority)
+
+    return (_FORMAT_VERSION, pyessv.__version__, get_fingerprint(archive_dir))
+
+
+def _get_path_to_snapshot(archive_dir, authority, scope, snapshot_dir, include=None):
+    """Returns path to a snapshot file.
+
+    """
+    key = '{}|{}|{}|{}'.format(os.path.realpath(archive_dir), authority, scope, sorted(include or []))
+    key = hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+    return join(snapshot_dir, '{}.pickle'.format(key))
+
+
+def _restore_references(result):
+    """Restores term parent & association references pickled as namespaces.
+
+    """
+    authorities = [result] if isinstance(result, Authority) else result
+    termcache = {t.namespace: t for a in authorities for s in a for c in s for t in c.iter_items()}
+    for term in termcache.values():
+        if term.parent in termcache:
+            term.parent = termcache[term.parent]
+        if term.associations:
+            term.associations = [termcache.get(i, i) for i in term.associations]
+
+
+class _Pickler(pickle.Pickler):
+    """Pickles terms (or term columns) with parent & association references replaced by namespaces.
+
+    Doing so limits pickling recursion depth to that of the archive hierarchy.
+
+    """
+    def reducer_override(self, obj):
+        """Returns reduction of a term or term columns, otherwise defers to default reduction.
+
+        """
+        if isinstance(obj, TermColumns):
+            state = obj.__getstate__()
+            state['parent'] = [_get_reference(i) for i in state['parent']]
+            state['associations'] = [[_get_reference(j) for j in i] if i else None for i in state['associations']]
+            return (TermColumns.__new__, (TermColumns, ), state)
+
+        if not isinstance(obj, Term):
+            return NotImplemented
+
+        state = obj.__getstate__()
+        state['parent'] = _get_reference(obj.parent)
+        state['associations'] = [_get_reference(i) for i in obj.associations]
+
+        return (Term.__new__, (Term, ), state)
+
+
+def _get_reference(obj):
+    """Returns a pickleable reference to a term.
+
+    """
+    return obj.namespace if isinstance(obj, Term) else obj
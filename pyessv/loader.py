@@ -1,14 +1,47 @@
+import collections
 import random
+import threading
+import time
 import uuid
 
 from pyessv import matcher
 from pyessv.cache import get_cached
+from pyessv.cache import get_cached_matches
+from pyessv.cache import get_cached_version
+from pyessv.constants import LOAD_MISS_CACHE_SIZE
+from pyessv.constants import LOAD_WARNING_INTERVAL
+from pyessv.constants import NODE_TYPEKEY_AUTHORITY
+from pyessv.constants import NODE_TYPEKEY_COLLECTION
+from pyessv.constants import NODE_TYPEKEY_SCOPE
+from pyessv.constants import NODE_TYPEKEY_TERM
 from pyessv.constants import PARSING_NODE_FIELDS
+from pyessv.constants import PARSING_STRICTNESS_SET
+from pyessv.exceptions import NamespaceParsingError
 from pyessv.factory import create_term
 from pyessv.model import Authority
+from pyessv.model import Collection
 from pyessv.utils import logger
 from pyessv.utils import compat
 from pyessv.utils.formatter import format_string
+from pyessv.utils.memo import Memo
+
+
+# Identifiers recently not mapped to a vocabulary node, forgotten whenever cached hierarchy is modified or a node renamed.
+_MISSES = Memo(LOAD_MISS_CACHE_SIZE)
+
+# Type keys of nodes at each level of a namespace.
+_TYPEKEYS = (
+    NODE_TYPEKEY_AUTHORITY,
+    NODE_TYPEKEY_SCOPE,
+    NODE_TYPEKEY_COLLECTION,
+    NODE_TYPEKEY_TERM
+    )
+
+# Times at which identifiers not mapped to a vocabulary node were last warned of, plus counts of suppressed warnings.
+_WARNINGS = collections.OrderedDict()
+
+# Lock serialising updates of warnings.
+_LOCK = threading.Lock()
 
 
 def load(identifier=None, verbose=True):
@@ -26,17 +59,99 @@ def load(identifier=None, verbose=True):
         return set(get_cached(Authority))
 
     identifier = identifier.strip()
-    result = _load_by_namespace(identifier)
+    version = get_cached_version()
+    if _MISSES.get(identifier, version, False):
+        result = None
+    else:
+        result = _load_by_namespace(identifier)
+        if result is None:
+            _MISSES.set(identifier, True, version)
     if result is None and verbose:
-        logger.log_warning('Cannot map identifier to a vocabulary entity: {}'.format(identifier))
+        _log_miss(identifier)
 
     return result
 
 
-def _load_by_namespace(identifier):
+def load_many(namespaces, strictness=None, on_missing=None):
+    """Loads a set of vocabulary nodes from archive.
+
+    Duplicate namespaces are loaded once, whilst namespaces sharing a prefix share resolution of
+    that prefix.
+
+    :param iterable namespaces: Vocabulary node namespaces.
+    :param int strictness: Strictness level to apply when matching each namespace part to a node name,
+                           if unspecified then parts are matched as per load.
+    :param func on_missing: Callable returning result of a namespace not mapped to a vocabulary node,
+                            if unspecified then result is None & a warning is logged.
+
+    :return: Vocabulary nodes in input order.
+    :rtype: list
+
+    """
+    assert strictness is None or strictness in PARSING_STRICTNESS_SET, 'Invalid parsing strictness'
+    assert on_missing is None or callable(on_missing), 'Invalid missing namespace callback'
+
+    # Memoise matches of names within parent nodes.
+    memo = {}
+    get_matches = _get_matches if strictness is None else _get_child
+
+    def _get_memoised(parent, name):
+        key = (parent, name)
+        try:
+            return memo[key]
+        except KeyError:
+            result = memo[key] = get_matches(parent, name)
+            return result
+
+    namespaces = list(namespaces)
+    results = {}
+    for namespace in namespaces:
+        if namespace in results:
+            continue
+        assert isinstance(namespace, compat.basestring), 'Invalid namespace'
+        if strictness is None:
+            result = results[namespace] = _load_by_namespace(namespace.strip(), _get_memoised)
+        else:
+            try:
+                result = results[namespace] = _load_strictly(namespace, strictness, _get_memoised)
+            except NamespaceParsingError:
+                result = results[namespace] = None
+        if result is None:
+            if on_missing is None:
+                _log_miss(namespace.strip())
+            else:
+                results[namespace] = on_missing(namespace)
+
+    return [results[i] for i in namespaces]
+
+
+def _log_miss(identifier):
+    """Warns of an identifier not mapped to a vocabulary node, repeated warnings being rate limited.
+
+    """
+    now = time.monotonic()
+    with _LOCK:
+        warned = _WARNINGS.get(identifier)
+        if warned is not None and now - warned[0] < LOAD_WARNING_INTERVAL:
+            warned[1] += 1
+            return
+        suppressed = 0 if warned is None else warned[1]
+        _WARNINGS.pop(identifier, None)
+        _WARNINGS[identifier] = [now, 0]
+        if len(_WARNINGS) > max(LOAD_MISS_CACHE_SIZE, 1):
+            _WARNINGS.popitem(last=False)
+
+    msg = 'Cannot map identifier to a vocabulary entity: {}'.format(identifier)
+    if suppressed:
+        msg = '{} (warning suppressed {} times)'.format(msg, suppressed)
+    logger.log_warning(msg)
+
+
+def _load_by_namespace(identifier, get_matches=None):
     """Loads a vocabulary node from archive by trying to match it's namespace.
 
     :param str identifier: Vocabulary node namespace.
+    :param func get_matches: Callable returning nodes matched by name within a parent node.
 
     :returns: First matching vocabulary node.
     :rtype: pyessv.Node | None
@@ -60,56 +175,84 @@ def _load_by_namespace(identifier):
     elif len(ns) == 4:
         authority, scope, collection, term = ns
 
-    # Walk nodes returning deepest match.
-    for a in get_cached(Authority):
-        if not _is_matched(a, authority):
-            continue
+    # Walk indexed nodes returning deepest match.
+    get_matches = get_matches or _get_matches
+    for a in get_matches(None, authority):
         if scope is None:
             return a
         # ... scopes
-        for s in a:
-            if not _is_matched(s, scope):
-                continue
+        for s in get_matches(a, scope):
             if collection is None:
                 return s
             # ... collections
-            for c in s:
-                if not _is_matched(c, collection):
-                    continue
+            for c in get_matches(s, collection):
                 if term is None:
                     return c
                 # ... terms (concrete)
-                for t in c:
-                    if _is_matched(t, term):
-                        return t
+                for t in get_matches(c, term):
+                    return t
                 # ... terms (virtual)
                 if matcher.match_term(c, term) is not False:
                     return create_term(c, term)
 
 
-def _is_matched(node, identifier):
-    """Returns flag indicating whether node identifier is a match.
+def _load_strictly(namespace, strictness, get_child=None):
+    """Loads a vocabulary node whose namespace parts each match a node name at a parsing strictness level.
+
+    Each part is resolved within the node resolved from the previous part.
+
+    :param str namespace: Vocabulary node namespace.
+    :param int strictness: Strictness level to apply when matching each namespace part to a node name.
+    :param func get_child: Callable returning node matched by name within a parent node.
+
+    :returns: Matching vocabulary node.
+    :rtype: pyessv.Node
+
+    :raises NamespaceParsingError: If a namespace part is not matched.
+
+    """
+    names = compat.str(namespace).strip().split(':')
+    if len(names) > len(_TYPEKEYS):
+        raise NamespaceParsingError('namespace', namespace)
+
+    get_child = get_child or _get_child
+    node = None
+    for typekey, name in zip(_TYPEKEYS, names):
+        node = get_child(node, name)
+        if node is None or not matcher.is_matched(node, name, strictness):
+            raise NamespaceParsingError(typekey, name)
+
+    return node
+
+
+def _get_child(parent, name):
+    """Returns first node matched by name within a parent node, a virtual term being created if necessary.
 
     """
-    identifier = format_string(identifier).lower()
+    matches = _get_matches(parent, name)
+    if matches:
+        return matches[0]
 
-    # Matched by canonical name.
-    if identifier == node.canonical_name:
-        return True
+    if isinstance(parent, Collection):
+        name = compat.str(name).strip().lower()
+        if matcher.match_term(parent, name) is not False:
+            return create_term(parent, name)
 
-    # Matched by raw name.
-    if identifier == node.raw_name.lower():
-        return True
 
-    # Matched by alternative names.
-    elif identifier in [format_string(i).lower() for i in node.alternative_names]:
-        return True
+def _get_matches(parent, name):
+    """Returns nodes matched by name within a parent node (or within cache if parent is unspecified).
+
+    """
+    name = _format_name(name)
 
-    # Tru fixing spec matching in collection alternative name for config_parser
-    elif identifier in [format_string(i).lower().replace("_","-") for i in node.alternative_names]:
-        return True
+    return get_cached_matches(name) if parent is None else parent.get_matches(name)
 
-    return False
+
+def _format_name(identifier):
+    """Returns identifier formatted for matching against normalised node name spellings.
+
+    """
+    return format_string(identifier).lower()
 
 
 def load_random(namespace, field='canonical_name'):
@@ -7,6 +7,8 @@ from pyessv.constants import PARSING_STRICTNESS_2
 from pyessv.constants import PARSING_STRICTNESS_3
 from pyessv.constants import PARSING_STRICTNESS_4
 from pyessv.constants import PARSING_STRICTNESS_SET
+from pyessv.model.columns import TermColumns
+from pyessv.model.lazy import LazyList
 from pyessv.utils import compat
 
 
@@ -29,33 +31,55 @@ def match_term(collection, name, strictness=PARSING_STRICTNESS_2):
         if re.compile(collection.term_regex).match(name) is not None:
             return factory.create_term(collection, name, append=False)
 
+    # Match by term via index of deferred or columnar terms.
+    if isinstance(collection.terms, (LazyList, TermColumns)) and collection.terms.is_searchable:
+        if strictness >= PARSING_STRICTNESS_4:
+            term = collection.terms.find(str(name).strip().lower(), case_sensitive=False)
+        else:
+            term = collection.terms.find(name)
+        if term is not None and is_matched(term, name, strictness):
+            return term
+
+        # Columnar terms are indexed by all names, therefore unindexed names are unmatched.
+        if term is None and isinstance(collection.terms, TermColumns):
+            return False
+
     # Match by term.
     for term in collection:
-        # match by: canonical_name
-        if strictness == PARSING_STRICTNESS_0:
-            if name == term.canonical_name:
-                return term
-
-        # match by: raw_name
-        elif strictness == PARSING_STRICTNESS_1:
-            if name == term.raw_name:
-                return term
-
-        # match by: canonical_name | raw_name
-        elif strictness == PARSING_STRICTNESS_2:
-            if name in {term.canonical_name, term.raw_name}:
-                return term
-
-        # match by: alternative_name
-        if strictness == PARSING_STRICTNESS_3:
-            names = {term.canonical_name, term.raw_name}.union(set(term.alternative_names))
-            if name in names:
-                return term
-
-        # match by: all (case-insensitive)
-        if strictness == PARSING_STRICTNESS_4:
-            name = str(name).strip().lower()
-            if name in [i.lower() for i in term.all_names]:
-                return term
+        if is_matched(term, name, strictness):
+            return term
+
+    return False
+
+
+def is_matched(node, name, strictness):
+    """Gets flag indicating whether a node (e.g. a term) matches a name.
+
+    :param pyessv.Node node: A vocabulary node.
+    :param str name: A node name to be validated.
+    :param int strictness: Strictness level to apply when applying name matching rules.
+
+    """
+    # match by: canonical_name
+    if strictness == PARSING_STRICTNESS_0:
+        return name == node.canonical_name
+
+    # match by: raw_name
+    elif strictness == PARSING_STRICTNESS_1:
+        return name == node.raw_name
+
+    # match by: canonical_name | raw_name
+    elif strictness == PARSING_STRICTNESS_2:
+        return name in {node.canonical_name, node.raw_name}
+
+    # match by: alternative_name
+    elif strictness == PARSING_STRICTNESS_3:
+        names = {node.canonical_name, node.raw_name}.union(set(node.alternative_names))
+        return name in names
+
+    # match by: all (case-insensitive)
+    elif strictness == PARSING_STRICTNESS_4:
+        name = str(name).strip().lower()
+        return name in [i.lower() for i in node.all_names]
 
     return False
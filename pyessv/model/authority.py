@@ -11,6 +11,8 @@ class Authority(IterableNode):
     """An authority assuming responsibity for governance of vocabularies.
 
     """
+    __slots__ = ('scopes', )
+
     def __init__(self):
         """Instance constructor.
 
@@ -18,13 +20,6 @@ class Authority(IterableNode):
         self.scopes = []
         super(Authority, self).__init__(self.scopes, NODE_TYPEKEY_AUTHORITY)
 
-    @property
-    def ancestors(self):
-        """Gets ancestors within archive hierarchy.
-
-        """
-        return []
-
     def get_validators(self):
         """Returns set of validators.
 
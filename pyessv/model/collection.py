@@ -1,6 +1,8 @@
 
 from pyessv.constants import NODE_TYPEKEY_COLLECTION
 from pyessv.constants import REGEX_CANONICAL_NAME
+from pyessv.model.columns import TermColumns
+from pyessv.model.lazy import LazyList
 from pyessv.model.node import IterableNode
 from pyessv.model.term import Term
 from pyessv.utils import compat
@@ -14,6 +16,12 @@ class Collection(IterableNode):
     """A vocabulary term collection.
 
     """
+    __slots__ = (
+        'scope',
+        'terms',
+        'term_regex'
+        )
+
     def __init__(self):
         """Instance constructor.
 
@@ -23,12 +31,22 @@ class Collection(IterableNode):
         self.term_regex = None
         super(Collection, self).__init__(self.terms, NODE_TYPEKEY_COLLECTION)
 
+    def __iter__(self):
+        """Instance iterator initializer.
+
+        """
+        # Columnar terms are sorted by name column.
+        if isinstance(self.terms, TermColumns):
+            return self.terms.iter_sorted()
+
+        return super(Collection, self).__iter__()
+
     @property
-    def ancestors(self):
-        """Gets ancestors within archive hierarchy.
+    def _owner(self):
+        """Gets owning node within archive hierarchy.
 
         """
-        return [self.authority, self.scope]
+        return self.scope
 
     @property
     def authority(self):
@@ -37,6 +55,20 @@ class Collection(IterableNode):
         """
         return self.scope.authority
 
+    @property
+    def is_loaded(self):
+        """Gets flag indicating whether the collection's terms have been loaded.
+
+        """
+        return not isinstance(self.terms, LazyList) or self.terms.is_loaded
+
+    @property
+    def is_columnar(self):
+        """Gets flag indicating whether the collection's terms are held in columnar storage.
+
+        """
+        return isinstance(self.terms, TermColumns)
+
     @property
     def is_virtual(self):
         """Gets flag indicating whether the collection is a virtual one
@@ -45,6 +77,43 @@ class Collection(IterableNode):
         """
         return len(self) == 0
 
+    def defer_terms(self, loader, finder=None, size=None):
+        """Defers loading of terms until first accessed.
+
+        :param func loader: Callable returning the collection's terms.
+        :param func finder: Callable returning a term by name without loading all terms.
+        :param int size: Number of terms (if known in advance).
+
+        """
+        self.terms = self._items = LazyList(loader, finder, size)
+
+    def set_columnar(self):
+        """Holds terms in columnar storage, whereby terms are materialised as views upon access.
+
+        :returns: Map of previously held terms to their row within columnar storage.
+        :rtype: dict
+
+        """
+        terms = list(self.terms)
+        self.terms = self._items = TermColumns(self, terms)
+
+        return {term: row for row, term in enumerate(terms)}
+
+    def get_column(self, field):
+        """Returns values of a term attribute in iteration order, i.e. sorted by canonical name.
+
+        :param str field: Name of a term attribute, e.g. status.
+
+        :returns: Term attribute values.
+        :rtype: list
+
+        """
+        if isinstance(self.terms, TermColumns):
+            values = self.terms.get_column(field)
+            return [values[i] for i in self.terms.get_order()]
+
+        return [getattr(i, field) for i in self]
+
     def get_validators(self):
         """Returns set of validators.
 
@@ -70,7 +139,7 @@ class Collection(IterableNode):
                     assert_namespace(identifier, min_length=3, max_length=4)
 
         def _terms():
-            assert_iterable(self.terms, Term)
+            assert_iterable(self.terms, Term, (list, TermColumns))
 
         return super(Collection, self).get_validators() + (
             _canonical_name,
@@ -0,0 +1,566 @@
+import array
+import threading
+import weakref
+
+from pyessv.constants import GOVERNANCE_STATUS_SET
+from pyessv.constants import NODE_TYPEKEY_TERM
+from pyessv.model.node import get_generation
+from pyessv.model.node import _LIST_MUTATORS
+from pyessv.model.node import _get_matches
+from pyessv.model.node import _get_slots
+from pyessv.model.node import _increment_generation
+from pyessv.model.node import _set_match
+from pyessv.model.term import Term
+from pyessv.utils.formatter import format_spellings
+
+
+# Term attributes held within columns.
+_FIELDS = (
+    'alternative_names',
+    'associations',
+    'canonical_name',
+    'create_date',
+    'data',
+    'description',
+    'label',
+    'parent',
+    'raw_name',
+    'status',
+    'url'
+    )
+
+# Term attributes whose values are encoded within columns.
+_ENCODED_FIELDS = {'alternative_names', 'associations', 'parent', 'status'}
+
+# Term attributes by which terms are indexed & ordered.
+_NAME_FIELDS = {'alternative_names', 'canonical_name', 'raw_name'}
+
+# Term attributes whose list values are written through to columns when changed in place.
+_LIST_FIELDS = {'alternative_names', 'associations'}
+
+# Minimum number of references to views held prior to pruning those no longer retained.
+_VIEWS_LIMIT = 256
+
+# Term status values indexed by status column code.
+_STATUSES = list(GOVERNANCE_STATUS_SET)
+
+# Lock serialising lookups & insertions of term status codes.
+_STATUSES_LOCK = threading.Lock()
+
+
+class TermColumns(object):
+    """Columnar (i.e. struct-of-arrays) storage of a collection's terms.
+
+    Term attributes are held within parallel columns indexed by term row, terms being materialised
+    as views upon access.  A view is retained only whilst referenced elsewhere.  Terms appended
+    after construction are held as is, whilst terms cannot otherwise be inserted, replaced or
+    removed.
+
+    """
+    __slots__ = _FIELDS + (
+        'collection',
+        '_extra',
+        '_generation',
+        '_index',
+        '_lock',
+        '_order',
+        '_views',
+        '_views_limit'
+        )
+
+    def __init__(self, collection, terms=()):
+        """Instance constructor.
+
+        :param pyessv.Collection collection: Collection to which terms belong.
+        :param list terms: Terms to be held within columns.
+
+        """
+        terms = list(terms)
+        for field in _FIELDS:
+            if field in _ENCODED_FIELDS:
+                setattr(self, field, [_encode(field, getattr(i, field)) for i in terms])
+            else:
+                setattr(self, field, [getattr(i, field) for i in terms])
+        self.status = array.array('B', self.status)
+
+        # Equal creation dates are shared.
+        dates = {}
+        self.create_date = [dates.setdefault(i, i) for i in self.create_date]
+
+        self.collection = collection
+        self._extra = []
+        self._set_transients()
+
+    def __getstate__(self):
+        """Instance state getter (invoked when pickling or copying).
+
+        """
+        state = {i: getattr(self, i) for i in _FIELDS}
+
+        # Status codes are process local, therefore statuses are serialised with a table of their own.
+        statuses = sorted(set(_STATUSES[i] for i in self.status))
+        codes = {v: i for i, v in enumerate(statuses)}
+        state['status'] = (statuses, bytes(codes[_STATUSES[i]] for i in self.status))
+        state['collection'] = self.collection
+        state['_extra'] = self._extra
+
+        return state
+
+    def __setstate__(self, state):
+        """Instance state setter (invoked when unpickling or copying).
+
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        statuses, codes = self.status
+        statuses = [_get_status_code(i) for i in statuses]
+        self.status = array.array('B', [statuses[i] for i in codes])
+        self._set_transients()
+
+    def __add__(self, other):
+        """Add operator.
+
+        """
+        return list(self) + list(other)
+
+    def __contains__(self, item):
+        """Instance membership predicate.
+
+        """
+        if isinstance(item, TermView) and item._columns is self:
+            return True
+
+        return any(i is item for i in self._extra)
+
+    def __getitem__(self, key):
+        """Returns a term (or list of terms) by row.
+
+        """
+        if isinstance(key, slice):
+            return [self._get_term(i) for i in range(*key.indices(len(self)))]
+
+        if key < 0:
+            key += len(self)
+        if key < 0 or key >= len(self):
+            raise IndexError('term row out of range')
+
+        return self._get_term(key)
+
+    def __iter__(self):
+        """Instance iterator initializer (in row order).
+
+        """
+        for row in range(len(self)):
+            yield self._get_term(row)
+
+    def __len__(self):
+        """Returns number of terms.
+
+        """
+        return len(self.canonical_name) + len(self._extra)
+
+    @property
+    def is_searchable(self):
+        """Gets flag indicating whether terms can be found by name via an index.
+
+        """
+        return True
+
+    def append(self, term):
+        """Appends a term.
+
+        :param pyessv.Term term: Term to be appended.
+
+        """
+        self._extra.append(term)
+        self._reset()
+
+    def extend(self, terms):
+        """Appends a set of terms.
+
+        :param list terms: Terms to be appended.
+
+        """
+        self._extra.extend(terms)
+        self._reset()
+
+    def find(self, name, case_sensitive=True):
+        """Returns a term by name.
+
+        Name precedence mirrors IterableNode.__getitem__, i.e. canonical > raw > alternative names,
+        with ties resolved by term row.
+
+        :param str name: Term name.
+        :param bool case_sensitive: Flag indicating whether name is to be matched case sensitively.
+
+        :returns: Term matched by name or None.
+
+        """
+        row = self._get_index(case_sensitive).get(name)
+        if row is not None:
+            return self._get_term(row)
+
+    def get_column(self, field):
+        """Returns values of a term attribute in row order.
+
+        :param str field: Name of a term attribute.
+
+        :returns: Term attribute values.
+        :rtype: list
+
+        """
+        assert field in _FIELDS, 'Invalid term attribute: {}'.format(field)
+
+        if field in _ENCODED_FIELDS:
+            values = [_decode(field, i) for i in getattr(self, field)]
+        else:
+            values = list(getattr(self, field))
+
+        return values + [getattr(i, field) for i in self._extra]
+
+    def get_matches(self, name):
+        """Returns terms matched by a normalised name spelling, in canonical name order.
+
+        :param str name: Stripped & lower cased name, e.g. a namespace part.
+
+        :returns: Matched terms.
+        :rtype: tuple
+
+        """
+        self._validate()
+        spellings = self._index[2]
+        if spellings is None:
+            spellings = {}
+            names = [self.get_column(i) for i in ('canonical_name', 'raw_name', 'alternative_names')]
+            for row in self.get_order():
+                for key in format_spellings(*[i[row] for i in names]):
+                    _set_match(spellings, key, row)
+            self._index[2] = spellings
+
+        return tuple(self._get_term(i) for i in _get_matches(spellings, name))
+
+    def get_order(self):
+        """Returns rows sorted by term canonical name.
+
+        :rtype: list
+
+        """
+        self._validate()
+        order = self._order
+        if order is None:
+            names = self.canonical_name + [i.canonical_name for i in self._extra]
+            order = self._order = sorted(range(len(names)), key=names.__getitem__)
+
+        return order
+
+    def get_value(self, row, field):
+        """Returns a columnar term attribute value.
+
+        :param int row: Term row.
+        :param str field: Name of a term attribute.
+
+        """
+        value = getattr(self, field)[row]
+
+        return _decode(field, value) if field in _ENCODED_FIELDS else value
+
+    def iter_sorted(self):
+        """Returns iterator over terms sorted by canonical name.
+
+        """
+        return (self._get_term(i) for i in self.get_order())
+
+    def select(self, field, value):
+        """Returns terms whose attribute is equal to a value (in row order).
+
+        :param str field: Name of a term attribute, e.g. status.
+        :param value: Attribute value to be matched.
+
+        :rtype: list
+
+        """
+        return [self._get_term(i) for i, v in enumerate(self.get_column(field)) if v == value]
+
+    def set_references(self, resolve):
+        """Re-points parent & association references.
+
+        :param func resolve: Callable returning the term referenced by a term or namespace.
+
+        """
+        self.parent = [_encode('parent', resolve(i)) for i in self.parent]
+        self.associations = [_encode('associations', [resolve(j) for j in i]) if i else None
+                             for i in self.associations]
+
+    def set_value(self, row, field, value):
+        """Updates a columnar term attribute value.
+
+        :param int row: Term row.
+        :param str field: Name of a term attribute.
+        :param value: Attribute value.
+
+        """
+        if field in _ENCODED_FIELDS:
+            value = _encode(field, value)
+        getattr(self, field)[row] = value
+
+        if field in _NAME_FIELDS:
+            self._reset()
+            _increment_generation()
+
+    def _get_index(self, case_sensitive):
+        """Returns name index of terms.
+
+        """
+        self._validate()
+        index = self._index[0 if case_sensitive else 1]
+        if index is not None:
+            return index
+
+        index = {}
+        for field in ('alternative_names', 'raw_name', 'canonical_name'):
+            values = self.get_column(field)
+            for row in reversed(range(len(values))):
+                for name in values[row] if field == 'alternative_names' else [values[row]]:
+                    if name:
+                        index[name if case_sensitive else name.strip().lower()] = row
+        self._index[0 if case_sensitive else 1] = index
+
+        return index
+
+    def _get_term(self, row):
+        """Returns a term by row, materialising a view if necessary.
+
+        """
+        if row >= len(self.canonical_name):
+            return self._extra[row - len(self.canonical_name)]
+
+        view = self._views.get(row, _get_none)()
+        if view is None:
+            with self._lock:
+                view = self._views.get(row, _get_none)()
+                if view is None:
+                    view = TermView(self, row)
+                    self._views[row] = weakref.ref(view)
+                    self._prune_views()
+
+        return view
+
+    def _prune_views(self):
+        """Discards references to views no longer retained, once their number has doubled since last pruning.
+
+        """
+        if len(self._views) > self._views_limit:
+            self._views = {i: j for i, j in self._views.items() if j() is not None}
+            self._views_limit = max(2 * len(self._views), _VIEWS_LIMIT)
+
+    def _reset(self):
+        """Resets name index & ordering following a change of term names.
+
+        """
+        self._generation = get_generation()
+        self._index = [None, None, None]
+        self._order = None
+
+    def _validate(self):
+        """Resets name index & ordering if terms appended after construction may since have been renamed.
+
+        """
+        if self._extra and self._generation != get_generation():
+            self._reset()
+
+    def _set_transients(self):
+        """Initialises state that is not pickled.
+
+        """
+        self._lock = threading.Lock()
+        self._views = {}
+        self._views_limit = _VIEWS_LIMIT
+        self._reset()
+
+
+class TermView(Term):
+    """A term whose attributes are held within columnar storage.
+
+    """
+    __slots__ = (
+        '_columns',
+        '_row',
+        '__weakref__'
+        )
+
+    def __init__(self, columns, row):
+        """Instance constructor.
+
+        :param TermColumns columns: Columnar storage of term attributes.
+        :param int row: Term row.
+
+        """
+        self._columns = columns
+        self._hierarchy = None
+        self._namespace = None
+        self._row = row
+
+    def __getstate__(self):
+        """Instance state getter (invoked when pickling or copying).
+
+        """
+        state = {i: getattr(self, i) for i in _get_slots(Term)}
+        state['_hierarchy'] = state['_namespace'] = None
+
+        # Detached terms hold plain lists, i.e. lists not written through to columns.
+        for field in _LIST_FIELDS:
+            state[field] = list(state[field])
+
+        return state
+
+    def __reduce_ex__(self, protocol):
+        """Reduces view to a detached term (invoked when pickling or copying).
+
+        """
+        return (Term.__new__, (Term, ), self.__getstate__())
+
+    @property
+    def collection(self):
+        """Gets collection to which term belongs.
+
+        """
+        return self._columns.collection
+
+    @property
+    def typekey(self):
+        """Gets node type key.
+
+        """
+        return NODE_TYPEKEY_TERM
+
+
+class _ColumnList(list):
+    """A list valued term attribute whose in place changes are written through to columnar storage.
+
+    """
+    __slots__ = (
+        '_columns',
+        '_field',
+        '_row'
+        )
+
+    def __init__(self, columns, row, field, values):
+        """Instance constructor.
+
+        :param TermColumns columns: Columnar storage of term attributes.
+        :param int row: Term row.
+        :param str field: Name of a term attribute.
+        :param list values: Attribute values.
+
+        """
+        super(_ColumnList, self).__init__(values)
+        self._columns = columns
+        self._field = field
+        self._row = row
+
+
+def _get_list_mutator(name):
+    """Returns a list method that writes a changed list through to columnar storage.
+
+    """
+    def _mutate(self, *args, **kwargs):
+        result = getattr(list, name)(self, *args, **kwargs)
+        self._columns.set_value(self._row, self._field, list(self))
+        return result
+
+    return _mutate
+
+
+def _get_none():
+    """Returns None, i.e. dereferences a view that was never referenced.
+
+    """
+    return None
+
+
+def _get_property(field):
+    """Returns a property reading & writing a term attribute from & to columnar storage.
+
+    """
+    def _get(self):
+        value = self._columns.get_value(self._row, field)
+        if field in _LIST_FIELDS:
+            return _ColumnList(self._columns, self._row, field, value)
+        return value
+
+    def _set(self, value):
+        self._columns.set_value(self._row, field, value)
+
+    return property(_get, _set)
+
+
+def _decode(field, value):
+    """Returns a term attribute value decoded from its columnar encoding.
+
+    """
+    if field == 'status':
+        return _STATUSES[value]
+    if field == 'parent':
+        return _get_referenced(value)
+    if field == 'associations':
+        return [_get_referenced(i) for i in value] if value else []
+
+    return value or []
+
+
+def _encode(field, value):
+    """Returns a term attribute value encoded for columnar storage.
+
+    Empty lists are held as None, whilst references to views are held as columns/row pairs
+    so that referenced views need not be retained.
+
+    """
+    if field == 'status':
+        return _get_status_code(value)
+    if field == 'parent':
+        return _get_reference(value)
+    if field == 'associations':
+        return [_get_reference(i) for i in value] if value else None
+
+    return value or None
+
+
+def _get_reference(term):
+    """Returns a compact reference to a term.
+
+    """
+    if isinstance(term, TermView):
+        return (term._columns, term._row)
+
+    return term
+
+
+def _get_referenced(reference):
+    """Returns a term from a compact reference.
+
+    """
+    if isinstance(reference, tuple):
+        return reference[0]._get_term(reference[1])
+
+    return reference
+
+
+def _get_status_code(status):
+    """Returns code of a term status within status column.
+
+    """
+    with _STATUSES_LOCK:
+        try:
+            return _STATUSES.index(status)
+        except ValueError:
+            _STATUSES.append(status)
+            return len(_STATUSES) - 1
+
+
+# Views read & write term attributes from & to columnar storage.
+for _field in _FIELDS:
+    setattr(TermView, _field, _get_property(_field))
+
+# Lists read from columnar storage write in place changes back to it.
+for _name in _LIST_MUTATORS:
+    setattr(_ColumnList, _name, _get_list_mutator(_name))
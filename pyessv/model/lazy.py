@@ -0,0 +1,133 @@
+import threading
+
+
+class LazyList(list):
+    """A list whose items are loaded upon first access.
+
+    """
+    __slots__ = (
+        '_finder',
+        '_loader',
+        '_loaded',
+        '_loading',
+        '_lock',
+        '_size'
+        )
+
+    def __init__(self, loader, finder=None, size=None):
+        """Instance constructor.
+
+        :param func loader: Callable returning the list items.
+        :param func finder: Callable returning an item by name without loading all items.
+        :param int size: Number of items (if known in advance).
+
+        """
+        super(LazyList, self).__init__()
+        self._finder = finder
+        self._loader = loader
+        self._size = size
+        self._loaded = False
+        self._loading = False
+        self._lock = threading.RLock()
+
+    @property
+    def is_loaded(self):
+        """Gets flag indicating whether items have been loaded.
+
+        """
+        return self._loaded
+
+    @property
+    def is_searchable(self):
+        """Gets flag indicating whether items can be found by name without loading all items.
+
+        """
+        return self._finder is not None and not self._loaded
+
+    def __len__(self):
+        """Returns number of items, loading them if necessary.
+
+        """
+        if self._size is not None and not self._loaded:
+            return self._size
+        self.load()
+
+        return list.__len__(self)
+
+    def find(self, name, case_sensitive=True):
+        """Returns an item by name without loading all items.
+
+        :param str name: Item name.
+        :param bool case_sensitive: Flag indicating whether name is to be matched case sensitively.
+
+        :returns: Item matched by name or None.
+
+        """
+        return self._finder(name, case_sensitive)
+
+    def load(self):
+        """Loads items (if not already loaded).
+
+        """
+        if self._loaded:
+            return
+        with self._lock:
+            # Re-entrant calls (i.e. from within loader) are ignored.
+            if self._loaded or self._loading:
+                return
+            self._loading = True
+            try:
+                list.extend(self, self._loader())
+                self._loaded = True
+                self._finder = None
+                self._loader = None
+            finally:
+                self._loading = False
+
+
+def _get_loading_method(name):
+    """Returns a list method wrapper that ensures items are loaded beforehand.
+
+    """
+    method = getattr(list, name)
+
+    def _method(self, *args, **kwargs):
+        self.load()
+        return method(self, *args, **kwargs)
+
+    _method.__name__ = name
+
+    return _method
+
+
+# Ensure items are loaded prior to any list operation.
+for _name in (
+    '__add__',
+    '__contains__',
+    '__delitem__',
+    '__eq__',
+    '__ge__',
+    '__getitem__',
+    '__gt__',
+    '__iadd__',
+    '__iter__',
+    '__le__',
+    '__lt__',
+    '__mul__',
+    '__ne__',
+    '__repr__',
+    '__reversed__',
+    '__setitem__',
+    'append',
+    'clear',
+    'copy',
+    'count',
+    'extend',
+    'index',
+    'insert',
+    'pop',
+    'remove',
+    'reverse',
+    'sort'
+):
+    setattr(LazyList, _name, _get_loading_method(_name))
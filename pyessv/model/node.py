@@ -1,29 +1,81 @@
 import datetime
+import functools
+import operator
+import threading
 
 from pyessv.constants import NODE_TYPEKEY_SET
 from pyessv.utils import compat
 from pyessv.utils.formatter import format_io_name
 from pyessv.utils.formatter import format_attribute_name
+from pyessv.utils.formatter import format_spellings
 from pyessv.utils.validation import assert_iterable
 from pyessv.utils.validation import assert_string
 from pyessv.utils.validation import assert_url
 
 
+# Attributes of iterable nodes whose assignment renames or re-parents them.
+_LINEAGE_ATTRIBUTES = {'authority', 'canonical_name', 'scope'}
+
+# Attributes of nodes by which they are indexed & matched within their parent.
+_NAME_ATTRIBUTES = ('alternative_names', 'canonical_name', 'raw_name')
+
+# Slots holding node names, keyed by name attribute.
+_NAME_SLOTS = {i: '_' + i for i in _NAME_ATTRIBUTES}
+
+# List methods that change a list in place.
+_LIST_MUTATORS = (
+    '__delitem__',
+    '__iadd__',
+    '__imul__',
+    '__setitem__',
+    'append',
+    'clear',
+    'extend',
+    'insert',
+    'pop',
+    'remove',
+    'reverse',
+    'sort'
+    )
+
+# Generation of archive hierarchy, incremented whenever a node is renamed or re-parented.
+_GENERATION = 0
+
+# Lock serialising generation increments.
+_GENERATION_LOCK = threading.Lock()
+
+
 class Node(object):
     """A node within the pyessv domain model.
 
     """
+    __slots__ = (
+        '_alternative_names',
+        '_canonical_name',
+        '_hierarchy',
+        '_namespace',
+        '_raw_name',
+        'create_date',
+        'data',
+        'description',
+        'label',
+        'typekey',
+        'url'
+        )
+
     def __init__(self, typekey):
         """Instance constructor.
 
         """
-        self.alternative_names = list()
-        self.canonical_name = None
+        self._alternative_names = _NameList()
+        self._canonical_name = None
+        self._hierarchy = None
+        self._namespace = None
+        self._raw_name = None
         self.create_date = None
         self.data = None
         self.description = None
         self.label = None
-        self.raw_name = None
         self.typekey = typekey
         self.url = None
 
@@ -33,10 +85,34 @@ class Node(object):
         """
         return self.namespace
 
+    def __getstate__(self):
+        """Instance state getter (invoked when pickling or copying).
+
+        """
+        state = {i: getattr(self, i) for i in _get_slots(type(self))}
+        state['_hierarchy'] = state['_namespace'] = None
+        if state['alternative_names'] is not None:
+            state['alternative_names'] = list(state['alternative_names'])
+
+        return state
+
+    def __setstate__(self, state):
+        """Instance state setter (invoked when unpickling or copying).
+
+        """
+        # Names are assigned to their slots directly, i.e. unpickled & copied nodes are yet to be indexed.
+        for name, value in state.items():
+            setattr(self, _NAME_SLOTS.get(name, name), value)
+        if type(self._alternative_names) is list:
+            self._alternative_names = _NameList(self._alternative_names)
+
     def __getattr__(self, name):
         """Instance attribute getter.
 
         """
+        # Unassigned slots are not sought within data.
+        if name in _get_slots(type(self)):
+            raise AttributeError('{} unassigned attribute'.format(name))
         if self.data is None:
             raise AttributeError('{} unknown attribute'.format(name))
         try:
@@ -64,19 +140,42 @@ class Node(object):
 
         return set(sorted(result))
 
+    @property
+    def _owner(self):
+        """Gets owning node within archive hierarchy.
+
+        """
+        return None
+
+    @property
+    def ancestors(self):
+        """Gets ancestors within archive hierarchy.
+
+        """
+        return list(self._get_hierarchy()[:-1])
+
     @property
     def hierarchy(self):
         """Gets hierachy within archive.
 
         """
-        return self.ancestors + [self]
+        return list(self._get_hierarchy())
 
     @property
     def namespace(self):
         """Gets hierachy within archive.
 
         """
-        return ":".join([i.canonical_name for i in self.hierarchy])
+        # Cached namespace is stale following a rename or re-parenting of node or of its ancestors.
+        generation = _GENERATION
+        owner = self._owner
+        cached = self._namespace
+        if cached is None or cached[0] != generation or cached[1] is not owner or \
+           cached[2] is not self.canonical_name:
+            namespace = self.canonical_name if owner is None else ':'.join((owner.namespace, self.canonical_name))
+            cached = self._namespace = (generation, owner, self.canonical_name, namespace)
+
+        return cached[3]
 
     @property
     def io_name(self):
@@ -85,6 +184,20 @@ class Node(object):
         """
         return format_io_name(self.canonical_name)
 
+    def _get_hierarchy(self):
+        """Returns hierarchy within archive.
+
+        """
+        # Cached hierarchy is stale following a re-parenting of node or of its ancestors.
+        generation = _GENERATION
+        owner = self._owner
+        cached = self._hierarchy
+        if cached is None or cached[0] != generation or cached[1] is not owner:
+            hierarchy = (self, ) if owner is None else owner._get_hierarchy() + (self, )
+            cached = self._hierarchy = (generation, owner, hierarchy)
+
+        return cached[2]
+
     def get_validators(self):
         """Returns set of validators.
 
@@ -131,13 +244,33 @@ class IterableNode(Node):
     """An iterable node within the pyessv domain model.
 
     """
+    __slots__ = (
+        '_index',
+        '_items',
+        '_order',
+        'status'
+        )
+
     def __init__(self, items, typekey):
         """Instance constructor.
 
         """
+        self._index = None
         self._items = items
+        self._order = None
+        self.status = None
         super(IterableNode, self).__init__(typekey)
 
+    def __getstate__(self):
+        """Instance state getter (invoked when pickling or copying).
+
+        """
+        state = super(IterableNode, self).__getstate__()
+        state['_index'] = None
+        state['_order'] = None
+
+        return state
+
     def __add__(self, other):
         """Add operator.
 
@@ -150,10 +283,23 @@ class IterableNode(Node):
         """
         return self[key] is not None
 
+    def __setattr__(self, name, value):
+        """Instance attribute setter.
+
+        """
+        super(IterableNode, self).__setattr__(name, value)
+
+        # Renaming or re-parenting invalidates cached namespaces & hierarchies of all nodes.
+        if name in _LINEAGE_ATTRIBUTES:
+            _increment_generation()
+
     def __getattr__(self, name):
         """Instance attribute getter.
 
         """
+        # Unassigned slots are not sought within items.
+        if name in _get_slots(type(self)):
+            raise AttributeError('{} unassigned attribute'.format(name))
         try:
             return self[name]
         except KeyError:
@@ -164,39 +310,257 @@ class IterableNode(Node):
 
         """
         def _get(name):
-            # Match against a canonical name.
-            for item in self:
-                if item.canonical_name == name:
+            # Match against a name via index of deferred or columnar items.
+            if getattr(self._items, 'is_searchable', False):
+                item = self._items.find(name)
+                if item is not None:
                     return item
 
-            # Match against a raw name.
-            for item in self:
-                if name == item.raw_name:
-                    return item
-
-            # Match against an alternative name.
-            for item in self:
-                if name in item.alternative_names:
-                    return item
+            # Match against a canonical, raw or alternative name.
+            else:
+                for names in self._get_index():
+                    if name in names:
+                        return names[name]
 
             # Match against a key within arbitrary node data.
             if self.data and name in self.data:
                 return self.data[name]
 
         # Seek with raw or formatted key.
-        return _get(key) or _get(format_attribute_name(key))
+        return _get(key) or _get(_format_key(key))
 
     def __iter__(self):
         """Instance iterator initializer.
 
         """
-        return iter(sorted(
-            self._items,
-            key=lambda i: i if isinstance(i, compat.basestring) else i.canonical_name
-            ))
+        return iter(self._get_order())
 
     def __len__(self):
         """Returns number of items in managed collection.
 
         """
         return len(self._items)
+
+    def append_item(self, item):
+        """Appends an item to managed collection, keeping name index current.
+
+        :param pyessv.Node item: Item to be appended.
+
+        """
+        self._items.append(item)
+        self._order = None
+
+        # Index is updated in place only if it was current prior to append.
+        index = self._index
+        if index is not None and index[0] is self._items and index[1] == len(self._items) - 1 and \
+           index[2] == _GENERATION:
+            _set_index_entries(index[3], item)
+            self._index = (self._items, len(self._items), index[2], index[3])
+
+    def get_matches(self, name):
+        """Returns items matched by a normalised name spelling, in iteration order.
+
+        :param str name: Stripped & lower cased name, e.g. a namespace part.
+
+        :returns: Matched items.
+        :rtype: tuple
+
+        """
+        # Columnar items maintain their own index.
+        get_matches = getattr(self._items, 'get_matches', None)
+        if get_matches is not None:
+            return get_matches(name)
+
+        return _get_matches(self._get_index()[3], name)
+
+    def iter_items(self):
+        """Returns iterator over items in managed collection order, i.e. unsorted.
+
+        Cheaper than sorted iteration when order is irrelevant.
+
+        """
+        return iter(self._items)
+
+    def reset_index(self):
+        """Resets name index & iteration order following in place replacement or renaming of items.
+
+        """
+        self._index = None
+        self._order = None
+
+    def _get_index(self):
+        """Returns name index of items, i.e. maps of canonical, raw, alternative names & spellings to items.
+
+        Index is rebuilt whenever managed collection is replaced or resized, or a node is renamed.
+
+        """
+        generation = _GENERATION
+        index = self._index
+        if index is None or index[0] is not self._items or index[1] != len(self._items) or \
+           index[2] != generation:
+            names = ({}, {}, {}, {})
+            for item in self._items:
+                _set_index_entries(names, item)
+            index = self._index = (self._items, len(self._items), generation, names)
+
+        return index[3]
+
+    def _get_order(self):
+        """Returns items sorted by canonical name.
+
+        Order is re-sorted whenever managed collection is replaced or resized, or a node is renamed.
+
+        """
+        generation = _GENERATION
+        order = self._order
+        if order is None or order[0] is not self._items or order[1] != len(self._items) or \
+           order[2] != generation:
+            items = sorted(self._items, key=_get_sort_key)
+            order = self._order = (self._items, len(self._items), generation, items)
+
+        return order[3]
+
+
+class _NameList(list):
+    """A list of alternative names whose in place changes rename its node.
+
+    """
+    __slots__ = ()
+
+
+def get_generation():
+    """Returns generation of archive hierarchy, incremented whenever a node is renamed or re-parented.
+
+    :rtype: int
+
+    """
+    return _GENERATION
+
+
+def _increment_generation():
+    """Increments generation of archive hierarchy.
+
+    """
+    global _GENERATION
+
+    with _GENERATION_LOCK:
+        _GENERATION += 1
+
+
+def _is_attached(node):
+    """Returns flag indicating whether a node is attached to an owning node within archive hierarchy.
+
+    """
+    try:
+        return node._owner is not None
+    except AttributeError:
+        return False
+
+
+def _get_name_property(name):
+    """Returns a property reading & writing a node name from & to its slot.
+
+    """
+    slot = _NAME_SLOTS[name]
+
+    def _set(self, value):
+        # Alternative names changed in place rename node likewise.
+        if type(value) is list:
+            value = _NameList(value)
+        setattr(self, slot, value)
+
+        # Renaming a node invalidates name indexes of its parent, plus lookups memoised against them.
+        if _is_attached(self):
+            _increment_generation()
+
+    return property(operator.attrgetter(slot), _set)
+
+
+def _get_name_list_mutator(name):
+    """Returns a list method that increments generation of archive hierarchy once list is changed.
+
+    """
+    def _mutate(self, *args, **kwargs):
+        result = getattr(list, name)(self, *args, **kwargs)
+        _increment_generation()
+        return result
+
+    return _mutate
+
+
+def _get_matches(spellings, name):
+    """Returns items (or rows) mapped to a name spelling.
+
+    """
+    match = spellings.get(name)
+    if match is None:
+        return ()
+
+    return match if isinstance(match, tuple) else (match, )
+
+
+def _set_match(spellings, name, item, sort_key=None):
+    """Maps a name spelling to an item (or row), a spelling shared by several being mapped to a sorted tuple.
+
+    Items are assumed to be added in sorted order unless a sort key is passed.
+
+    """
+    match = spellings.get(name)
+    if match is None:
+        spellings[name] = item
+    else:
+        match = _get_matches(spellings, name) + (item, )
+        spellings[name] = match if sort_key is None else tuple(sorted(match, key=sort_key))
+
+
+def _set_index_entries(names, item):
+    """Adds an item to maps of canonical, raw & alternative names & of normalised spellings.
+
+    Where names are shared by items precedence follows iteration order, i.e. canonical name order.
+
+    """
+    if isinstance(item, compat.basestring):
+        return
+
+    for mapping, keys in zip(names, ([item.canonical_name], [item.raw_name], item.alternative_names or [])):
+        for key in keys:
+            existing = mapping.get(key)
+            if existing is None or (item.canonical_name or '') < (existing.canonical_name or ''):
+                mapping[key] = item
+
+    for key in format_spellings(item.canonical_name, item.raw_name, item.alternative_names):
+        _set_match(names[3], key, item, _get_sort_key)
+
+
+def _get_sort_key(item):
+    """Returns key by which items are sorted.
+
+    """
+    return item if isinstance(item, compat.basestring) else item.canonical_name
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_key(key):
+    """Returns formatted form of an item key.
+
+    """
+    return format_attribute_name(key)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_slots(cls):
+    """Returns names of attributes held within slots declared by a node class & its ancestors.
+
+    """
+    slots = frozenset(i for c in cls.__mro__ for i in getattr(c, '__slots__', ()))
+
+    return frozenset(i[1:] if i[1:] in _NAME_SLOTS else i for i in slots)
+
+
+# Names are read & written via properties so that renaming of nodes is signalled.
+for _name in _NAME_ATTRIBUTES:
+    setattr(Node, _name, _get_name_property(_name))
+
+# Alternative names changed in place increment generation of archive hierarchy.
+for _name in _LIST_MUTATORS:
+    setattr(_NameList, _name, _get_name_list_mutator(_name))
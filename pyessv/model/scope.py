@@ -11,21 +11,45 @@ class Scope(IterableNode):
     """A scope managed by an authority.
 
     """
+    __slots__ = (
+        '_accessors',
+        'authority',
+        'collections'
+        )
 
     def __init__(self):
         """Instance constructor.
 
         """
+        self._accessors = {}
         self.authority = None
         self.collections = []
         super(Scope, self).__init__(self.collections, NODE_TYPEKEY_SCOPE)
 
+    def __getattr__(self, name):
+        """Instance attribute getter.
+
+        """
+        if name != '_accessors' and name in self._accessors:
+            return self._accessors[name]
+
+        return super(Scope, self).__getattr__(name)
+
     @property
-    def ancestors(self):
-        """Gets ancestors within archive hierarchy.
+    def _owner(self):
+        """Gets owning node within archive hierarchy.
+
+        """
+        return self.authority
+
+    def set_accessor(self, name, func):
+        """Sets a scope level vocabulary accessor function.
+
+        :param str name: Accessor name.
+        :param func: Accessor function.
 
         """
-        return [self.authority]
+        self._accessors[name] = func
 
     def get_validators(self):
         """Returns set of validators.
@@ -11,14 +11,21 @@ class Term(Node):
     """A vocabulary term.
 
     """
+    __slots__ = (
+        'associations',
+        'collection',
+        'parent',
+        'status'
+        )
+
     def __init__(self):
         """Instance constructor.
 
         """
+        self.collection = None
         super(Term, self).__init__(NODE_TYPEKEY_TERM)
 
         self.associations = list()
-        self.collection = None
         self.parent = None
         self.status = GOVERNANCE_STATUS_PENDING
 
@@ -31,11 +38,11 @@ class Term(Node):
         return key in self.all_names
 
     @property
-    def ancestors(self):
-        """Gets ancestors within archive hierarchy.
+    def _owner(self):
+        """Gets owning node within archive hierarchy.
 
         """
-        return [self.authority, self.scope, self.collection]
+        return self.collection
 
     @property
     def authority(self):
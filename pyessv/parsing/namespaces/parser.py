@@ -1,13 +1,18 @@
-from pyessv.loader import load
+from pyessv.cache import get_cached_version
+from pyessv.loader import _get_child
+from pyessv.loader import _TYPEKEYS
+from pyessv.constants import PARSING_MEMO_SIZE
 from pyessv.constants import PARSING_NODE_FIELDS
 from pyessv.constants import PARSING_STRICTNESS_SET
-from pyessv.constants import PARSING_STRICTNESS_0
-from pyessv.constants import PARSING_STRICTNESS_1
 from pyessv.constants import PARSING_STRICTNESS_2
-from pyessv.constants import PARSING_STRICTNESS_3
-from pyessv.constants import PARSING_STRICTNESS_4
 from pyessv.exceptions import NamespaceParsingError
+from pyessv.matcher import is_matched
 from pyessv.utils import compat
+from pyessv.utils.memo import Memo
+
+
+# Recently parsed namespaces (and namespace prefixes), forgotten whenever cached hierarchy is modified.
+_MEMO = Memo(PARSING_MEMO_SIZE)
 
 
 def parse_namespace(
@@ -24,90 +29,39 @@ def parse_namespace(
     """
     assert strictness in PARSING_STRICTNESS_SET, 'Invalid parsing strictness'
     assert field in PARSING_NODE_FIELDS, 'Invalid field'
+    assert compat.str(namespace).count(':') < len(_TYPEKEYS), 'Invalid namespace'
 
-    # Set namespace
-    ns = compat.str(namespace).strip().split(':')
-    assert len(ns) >= 1 and len(ns) <= 4, 'Invalid namespace'
-    ns = ns + [None for i in range(4 - len(ns))]
-
-    # Destructure.
-    authority, scope, collection, term = ns
-
-    # Set parsing targets.
-    targets = [
-        _NodeInfo('authority', authority, strictness),
-        _NodeInfo('scope', scope, strictness),
-        _NodeInfo('collection', collection, strictness),
-        _NodeInfo('term', term, strictness)
-    ]
-    targets = [i for i in targets if i.name is not None]
+    node, error = _parse_namespace(namespace, strictness, get_cached_version())
+    if error is not None:
+        raise NamespaceParsingError(*error)
 
-    # Load parsed nodes.
-    for target in targets:
-        namespace = [i.get_name(target) for i in targets]
-        namespace = [i for i in namespace if i is not None]
-        namespace = ":".join(namespace)
-        node = load(namespace)
-        target.set_node(node)
+    return getattr(node, field)
 
-    return getattr(target.node, field)
 
+def _parse_namespace(namespace, strictness, version):
+    """Parses a namespace, reusing the node parsed from its parent namespace.
 
-class _NodeInfo(object):
-    """Information about a node whose name is being parsed.
+    :returns: Parsed node & parsing error details (if any).
+    :rtype: tuple
 
     """
-    def __init__(self, typekey, name, strictness):
-        """Instance constructor.
-
-        """
-        self.node = None
-        self.name = name
-        self.strictness = strictness
-        self.typekey = typekey
-
-    def get_name(self, target):
-        """Gets parsing relative name.
-
-        """
-        if self.node is not None:
-            return self.node.canonical_name
-        elif self == target:
-            return compat.str(self.name).strip().lower()
-
-    def set_node(self, node):
-        """Sets node returned from archive search.
-
-        """
-        if node is None:
-            raise NamespaceParsingError(self.typekey, self.name)
-
-        # Confirm match based upon the level of parsing strictness perform test.
-        matched = False
-        if self.strictness == PARSING_STRICTNESS_0:
-            if self.name == node.canonical_name:
-                matched = True
-
-        elif self.strictness == PARSING_STRICTNESS_1:
-            if self.name == node.raw_name:
-                matched = True
-
-        elif self.strictness == PARSING_STRICTNESS_2:
-            if self.name in {node.canonical_name, node.raw_name}:
-                matched = True
-
-        elif self.strictness == PARSING_STRICTNESS_3:
-            names = {node.canonical_name, node.raw_name}.union(set(node.alternative_names))
-            if self.name in names:
-                matched = True
-
-        elif self.strictness == PARSING_STRICTNESS_4:
-            name = compat.str(self.name).strip().lower()
-            if name in [i.lower() for i in node.all_names]:
-                matched = True
-
-        # Raise parsing error if appropriate.
-        if matched is False:
-            raise NamespaceParsingError(self.typekey, self.name)
-
-        self.node = node
+    key = (namespace, strictness)
+    parsed = _MEMO.get(key, version)
+    if parsed is not None:
+        return parsed
+
+    # Resolve name within parent node.
+    parent, _, name = compat.str(namespace).strip().rpartition(':')
+    if parent:
+        parent, error = _parse_namespace(parent, strictness, version)
+    else:
+        parent, error = None, None
+    if error is None:
+        node = _get_child(parent, name)
+        if node is None or not is_matched(node, name, strictness):
+            error = (_TYPEKEYS[compat.str(namespace).strip().count(':')], name)
+    parsed = (None, error) if error is not None else (node, None)
+
+    _MEMO.set(key, parsed, version)
+
+    return parsed
@@ -0,0 +1,106 @@
+"""
+Instrumentation of library initialisation.
+
+"""
+import contextlib
+import time
+
+
+class InitProfile(object):
+    """Timings & I/O volumes recorded whilst initialising library.
+
+    """
+    def __init__(self):
+        """Instance constructor.
+
+        """
+        self.nodes = {}
+        self.steps = {}
+
+    def record(self, namespace, wall=0.0, files=0, size=0, decode=0.0):
+        """Accumulates measurements against a vocabulary node & its ancestors.
+
+        :param str namespace: Namespace of vocabulary node.
+        :param float wall: Elapsed time (seconds).
+        :param int files: Number of files read.
+        :param int size: Number of bytes read.
+        :param float decode: Time spent decoding (seconds).
+
+        """
+        names = namespace.split(':')
+        for i in range(1, len(names) + 1):
+            key = ':'.join(names[:i])
+            try:
+                entry = self.nodes[key]
+            except KeyError:
+                entry = self.nodes[key] = ProfileEntry(key)
+            entry.wall += wall
+            entry.files += files
+            entry.size += size
+            entry.decode += decode
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """Times an initialisation step.
+
+        :param str name: Step name.
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + time.perf_counter() - start
+
+    def get_report(self):
+        """Returns a text report of steps & vocabulary nodes sorted by descending elapsed time.
+
+        :rtype: str
+
+        """
+        lines = ['{:<60}{:>10}'.format('step', 'wall(s)')]
+        for name, wall in sorted(self.steps.items(), key=lambda i: -i[1]):
+            lines.append('{:<60}{:>10.3f}'.format(name, wall))
+        lines.append('')
+        lines.append('{:<60}{:>10}{:>10}{:>8}{:>12}'.format('node', 'wall(s)', 'decode(s)', 'files', 'bytes'))
+        for entry in sorted(self.nodes.values(), key=lambda i: (-i.wall, i.namespace)):
+            lines.append('{:<60}{:>10.3f}{:>10.3f}{:>8}{:>12}'.format(
+                entry.namespace, entry.wall, entry.decode, entry.files, entry.size
+                ))
+
+        return '\n'.join(lines)
+
+
+class ProfileEntry(object):
+    """Timings & I/O volumes recorded against a vocabulary node.
+
+    """
+    def __init__(self, namespace):
+        """Instance constructor.
+
+        :param str namespace: Namespace of vocabulary node.
+
+        """
+        self.namespace = namespace
+        self.wall = 0.0
+        self.files = 0
+        self.size = 0
+        self.decode = 0.0
+
+    def __repr__(self):
+        """Instance representation.
+
+        """
+        return '{}: wall={:.3f}s decode={:.3f}s files={} bytes={}'.format(
+            self.namespace, self.wall, self.decode, self.files, self.size
+            )
+
+
+def get_step(profile, name):
+    """Returns context manager timing an initialisation step (or doing nothing if not profiling).
+
+    :param InitProfile profile: Profile being recorded (if any).
+    :param str name: Step name.
+
+    """
+    return contextlib.nullcontext() if profile is None else profile.step(name)
@@ -43,3 +43,27 @@ def format_io_name(name):
             .replace('_', '-') \
             .replace(' ', '-') \
             .lower()
+
+
+def format_spellings(canonical_name, raw_name, alternative_names):
+    """Formats the set of normalised spellings by which a node is matched when loaded by namespace.
+
+    :param str canonical_name: Node canonical name.
+    :param str raw_name: Node raw name.
+    :param list alternative_names: Node alternative names.
+
+    :returns: Spellings comparable with stripped & lower cased identifiers.
+    :rtype: set
+
+    """
+    result = {canonical_name}
+    if raw_name is not None:
+        result.add(raw_name.lower())
+    for name in alternative_names or []:
+        if name is not None:
+            name = format_string(name).lower()
+            result.add(name)
+            result.add(name.replace('_', '-'))
+    result.discard(None)
+
+    return result
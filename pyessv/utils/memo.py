@@ -0,0 +1,63 @@
+import collections
+import threading
+
+
+class Memo(object):
+    """A bounded memo of recently used results, all of which are forgotten upon a change of version.
+
+    """
+    def __init__(self, size):
+        """Instance constructor.
+
+        :param int size: Maximum number of results remembered (disabled if zero).
+
+        """
+        self._lock = threading.Lock()
+        self._size = size
+        self._state = (None, collections.OrderedDict())
+
+    def get(self, key, version, default=None):
+        """Returns a remembered result.
+
+        :param key: Result key.
+        :param int version: Version against which result is sought.
+        :param default: Value returned if result is not remembered.
+
+        """
+        state = self._state
+        if state[0] != version:
+            return default
+        try:
+            result = state[1][key]
+        except KeyError:
+            return default
+
+        with self._lock:
+            try:
+                state[1].move_to_end(key)
+            except KeyError:
+                pass
+
+        return result
+
+    def set(self, key, result, version):
+        """Remembers a result, forgetting least recently used results.
+
+        :param key: Result key.
+        :param result: Result to be remembered.
+        :param int version: Version against which result was computed.
+
+        """
+        if self._size <= 0:
+            return
+
+        with self._lock:
+            # Results computed against a superseded version are discarded.
+            if self._state[0] is None or version > self._state[0]:
+                self._state = (version, collections.OrderedDict())
+            elif version < self._state[0]:
+                return
+            items = self._state[1]
+            items[key] = result
+            if len(items) > self._size:
+                items.popitem(last=False)
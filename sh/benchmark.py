@@ -0,0 +1,78 @@
+import argparse
+import timeit
+
+from pyessv import encode
+from pyessv import io_manager
+from pyessv import load
+from pyessv import load_many
+from pyessv import parse
+from pyessv.cache import encache
+from pyessv.constants import DIR_ARCHIVE
+from pyessv.constants import ENCODING_DICT
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser('Times namespace-heavy library paths over a vocabulary archive.')
+_ARGS.add_argument(
+    '--archive-dir',
+    help='Directory hosting vocabulary archive.',
+    dest='archive_dir',
+    type=str,
+    default=DIR_ARCHIVE
+    )
+_ARGS.add_argument(
+    '--repeat',
+    help='Number of times each path is timed (best time is reported).',
+    dest='repeat',
+    type=int,
+    default=5
+    )
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    authorities = io_manager.read(args.archive_dir)
+    nodes = _get_nodes(authorities)
+    terms = [i for i in nodes if i.typekey == 'term']
+    namespaces = [i.namespace for i in nodes]
+    for authority in authorities:
+        encache(authority)
+
+    benchmarks = (
+        ('namespace', lambda: [i.namespace for i in nodes]),
+        ('hierarchy', lambda: [i.hierarchy for i in nodes]),
+        ('repr', lambda: [repr(i) for i in nodes]),
+        ('encode (terms)', lambda: [encode(i, ENCODING_DICT) for i in terms]),
+        ('cache', lambda: [encache(i) for i in authorities]),
+        ('load', lambda: [load(i) for i in namespaces]),
+        ('load (batch)', lambda: load_many(namespaces)),
+        ('parse', lambda: [parse(i) for i in namespaces]),
+        )
+
+    print('{:<20}{:>12}{:>16}'.format('path', 'best (ms)', 'per node (us)'))
+    for name, func in benchmarks:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:<20}{:>12.1f}{:>16.2f}'.format(name, best * 1e3, best * 1e6 / len(nodes)))
+
+
+def _get_nodes(authorities):
+    """Returns all nodes within a set of authorities.
+
+    """
+    nodes = []
+    for authority in authorities:
+        nodes.append(authority)
+        for scope in authority:
+            nodes.append(scope)
+            for collection in scope:
+                nodes.append(collection)
+                nodes += list(collection)
+
+    return nodes
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
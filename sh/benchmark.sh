@@ -0,0 +1,16 @@
+#!/bin/bash
+
+# Import utils.
+source $PYESSV_LIB_HOME/sh/utils.sh
+
+# Main entry point.
+main()
+{
+	log "benchmark starts ..."
+
+	pushd $PYESSV_LIB_HOME
+	PYESSV_INITIALISATION_MODE=MANUAL pipenv run python $PYESSV_LIB_HOME/sh/benchmark.py "$@"
+}
+
+# Invoke entry point.
+main "$@"
@@ -0,0 +1,37 @@
+import argparse
+
+from pyessv import io_image
+from pyessv import io_manager
+from pyessv.constants import DIR_ARCHIVE
+
+
+# Define command line options.
+_ARGS = argparse.ArgumentParser('Writes vocabulary archive to a read-only memory mappable image.')
+_ARGS.add_argument(
+    '--dest',
+    help='Path to image file to be written.',
+    dest='dest',
+    type=str
+    )
+_ARGS.add_argument(
+    '--archive-dir',
+    help='Directory hosting vocabulary archive.',
+    dest='archive_dir',
+    type=str,
+    default=DIR_ARCHIVE
+    )
+
+
+def _main(args):
+    """Main entry point.
+
+    """
+    if args.dest is None or len(args.dest.strip()) == 0:
+        raise ValueError('Destination is a required parameter')
+
+    io_image.write(io_manager.read(args.archive_dir), args.dest)
+
+
+# Entry point.
+if __name__ == '__main__':
+    _main(_ARGS.parse_args())
@@ -0,0 +1,46 @@
+import asyncio
+import inspect
+import threading
+
+import pyessv as LIB
+from pyessv import aio
+from pyessv import initializer
+
+
+def test_interface():
+    """pyessv-tests: aio: interface.
+
+    """
+    for func in (aio.init_async, aio.load_async, aio.parse_identifer_async, aio.ready_async, aio.reload_async):
+        assert inspect.iscoroutinefunction(func)
+
+
+def test_load_async():
+    """pyessv-tests: aio: load.
+
+    """
+    async def _load():
+        assert await aio.ready_async() is True
+        return await asyncio.gather(*[aio.load_async(i.namespace) for i in LIB.load()])
+
+    authorities = LIB.load()
+    assert set(asyncio.run(_load())) == authorities
+
+
+def test_ready_async():
+    """pyessv-tests: aio: wait for initialisation.
+
+    """
+    async def _wait():
+        waiter = asyncio.ensure_future(aio.ready_async())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        threading.Thread(target=initializer._set_ready).start()
+        return await asyncio.wait_for(waiter, 60)
+
+    initializer._READY.clear()
+    try:
+        assert asyncio.run(_wait()) is True
+    finally:
+        initializer._set_ready()
+    assert asyncio.run(aio.ready_async()) is True
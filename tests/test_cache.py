@@ -1,9 +1,13 @@
 import inspect
 
+import pytest
+
 import pyessv
+from pyessv import loader
 from pyessv.cache import encache
 from pyessv.cache import decache
 from pyessv.cache import get_cached
+from pyessv.cache import get_cached_version
 import tests.utils as tu
 
 
@@ -27,10 +31,69 @@ def test_cache():
     assert isinstance(get_cached(tu.AUTHORITY_NAME), pyessv.Authority)
 
 
+def test_load_misses(capsys):
+    """pyessv-tests: caching: load misses
+
+    """
+    namespace = 'missing-authority'
+    for _ in range(3):
+        assert pyessv.load(namespace) is None
+    assert capsys.readouterr().out.count(namespace) == 1
+
+    # Misses are forgotten once cache is modified.
+    authority = pyessv.create_authority(namespace, 'description')
+    assert pyessv.load(namespace) is authority
+    decache(namespace)
+
+
+def test_load_misses_virtual(monkeypatch):
+    """pyessv-tests: caching: load misses retained when matching virtual terms
+
+    """
+    scope = tu.create_virtual_scope()
+    try:
+        namespace = 'missing-authority'
+        assert pyessv.load(namespace, verbose=False) is None
+
+        # Virtual terms matched by reg-ex are detached from archive hierarchy.
+        version = get_cached_version()
+        for name in ('r1i1', 'r2i1'):
+            assert len(pyessv.parse_identifer(scope, pyessv.IDENTIFIER_TYPE_DATASET, name)) == 1
+        assert get_cached_version() == version
+
+        monkeypatch.setattr(loader, '_load_by_namespace', None)
+        assert pyessv.load(namespace, verbose=False) is None
+    finally:
+        decache(tu.VIRTUAL_AUTHORITY_NAME)
+
+
+def test_load_renamed():
+    """pyessv-tests: caching: load renamed nodes
+
+    """
+    namespace = ':'.join([tu.COLLECTION_01_NAMESPACE, 'renamed'])
+    assert pyessv.load(namespace, verbose=False) is None
+    with pytest.raises(pyessv.NamespaceParsingError):
+        pyessv.parse_namespace(namespace)
+
+    # Misses & parsed namespaces are forgotten once a node is renamed.
+    term = pyessv.load(tu.TERM_01_NAMESPACE)
+    term.canonical_name = 'renamed'
+    try:
+        assert pyessv.load(namespace) is term
+        assert pyessv.parse_namespace(namespace) == 'renamed'
+        assert pyessv.load(tu.COLLECTION_01_NAMESPACE)['renamed'] is term
+    finally:
+        term.canonical_name = tu.TERM_01_NAME
+
+
 def test_decache():
     """pyessv-tests: caching: decache
 
     """
+    assert pyessv.load(tu.AUTHORITY_NAME) is not None
+
     decache(tu.AUTHORITY_NAME)
 
     assert get_cached(tu.AUTHORITY_NAME) is None
+    assert pyessv.load(tu.AUTHORITY_NAME, verbose=False) is None
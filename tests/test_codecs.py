@@ -1,7 +1,12 @@
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from pyessv.codecs import decode
 from pyessv.codecs import encode
+from pyessv.codecs import json_codec
 from pyessv.constants import ENCODING_DICT
 from pyessv.constants import ENCODING_JSON
 from pyessv.constants import ENCODING_SET
@@ -50,3 +55,85 @@ def test_encode(node, encoding):
     assert isinstance(decoded, type(node))
     for field in STANDARD_NODE_FIELDS:
         assert getattr(decoded, field) == getattr(node, field)
+
+
+def test_decode_schema_aware():
+    """pyessv-tests: decode (schema aware).
+
+    """
+    representation = encode(tu.create_term_01(), ENCODING_JSON)
+    representation = representation.replace('"_type"', '"data": {"start": "2001-01-01"},\n    "_type"', 1)
+
+    decoded = json_codec.decode(representation, schema_aware=True)
+
+    assert decoded.create_date == json_codec.decode(representation).create_date
+    assert decoded.data == {'start': '2001-01-01'}
+
+
+def test_decode_shared_data():
+    """pyessv-tests: decode (shared data).
+
+    """
+    representation = encode(tu.create_term_01(), ENCODING_JSON)
+    representation = representation.replace('"_type"', '"data": {"dates": ["2001-01-01"]},\n    "_type"', 1)
+
+    decoded = [json_codec.decode(representation, schema_aware=True) for _ in range(2)]
+
+    assert decoded[0].data['dates'] is decoded[1].data['dates']
+    assert decoded[0].data == decoded[1].data
+    with pytest.raises(TypeError):
+        decoded[0].data['dates'].append('2002-01-01')
+
+
+def test_decode_shared_data_modified():
+    """pyessv-tests: decode (shared data, modified via copies).
+
+    """
+    obj = json.loads(encode(tu.create_term_01(), ENCODING_JSON))
+    obj['data'] = {'model_component': {'aerosol': {'description': 'none'}}, 'dates': ['2001-01-01']}
+    representation = json.dumps(obj)
+    decoded = [json_codec.decode(representation, schema_aware=True) for _ in range(2)]
+
+    # Nested data is modified in place via copies, leaving other nodes unchanged.
+    term = decoded[0]
+    with pytest.raises(TypeError):
+        term.data['model_component']['aerosol']['description'] = 'modified'
+    model_component = copy.deepcopy(term.data['model_component'])
+    model_component['aerosol']['description'] = 'modified'
+    term.data['model_component'] = model_component
+    dates = copy.copy(term.data['dates'])
+    dates.append('2002-01-01')
+    term.data['dates'] = dates
+
+    assert decoded[1].data == obj['data']
+    reencoded = json.loads(encode(term, ENCODING_JSON))
+    assert reencoded['data']['model_component']['aerosol']['description'] == 'modified'
+    assert reencoded['data']['dates'] == ['2001-01-01', '2002-01-01']
+
+
+def test_decode_shared_data_concurrently():
+    """pyessv-tests: decode (shared data, concurrently).
+
+    """
+    obj = json.loads(encode(tu.create_term_01(), ENCODING_JSON))
+    obj['data'] = {'concurrent': {'dates': ['2001-01-01']}}
+    representation = json.dumps(obj)
+
+    with ThreadPoolExecutor(8) as executor:
+        decoded = list(executor.map(lambda _: json_codec.decode(representation, schema_aware=True), range(64)))
+
+    assert len({id(i.data['concurrent']) for i in decoded}) == 1
+
+
+def test_decode_null_fields():
+    """pyessv-tests: decode (null fields).
+
+    """
+    obj = json.loads(encode(tu.create_term_01(), ENCODING_JSON))
+    obj['alternative_names'] = obj['data'] = None
+    representation = json.dumps(obj)
+
+    decoded = json_codec.decode(representation, schema_aware=True)
+
+    assert decoded.alternative_names == []
+    assert decoded.data == {}
@@ -30,3 +30,19 @@ def test_governance(action, expected_status):
     tu.assert_str(term.status, expected_status)
 
     tu.teardown()
+
+
+@pytest.mark.parametrize("action, expected_status", yield_parameterizations())
+def test_governance_cascade(action, expected_status):
+    """Performs governance tests cascading from a collection to its terms.
+
+    """
+    tu.create_test_entities()
+
+    collection = tu.create_collection_01()
+    action(collection)
+    tu.assert_str(collection.status, expected_status)
+    for term in collection:
+        tu.assert_str(term.status, expected_status)
+
+    tu.teardown()
@@ -0,0 +1,153 @@
+import os
+import subprocess
+import sys
+
+
+# Script asserting that vocabularies are loaded upon first access.
+_LAZY_SCRIPT = """
+import os
+
+import pyessv
+from pyessv import initializer
+assert initializer._IS_INITIALISED is False
+
+# Any entry point reading vocabularies initialises library, e.g. loading a random term.
+namespace = []
+for _ in range(3):
+    dpath = os.path.join(pyessv.DIR_ARCHIVE, *namespace)
+    namespace.append(sorted(i for i in os.listdir(dpath) if os.path.isdir(os.path.join(dpath, i)) and not i.startswith('.'))[0])
+assert pyessv.load_random(':'.join(namespace)) is not None
+assert initializer._IS_INITIALISED is True
+
+authorities = pyessv.load()
+for authority in authorities:
+    assert getattr(pyessv, authority.canonical_name.replace('-', '_').upper()) is authority
+"""
+
+# Script asserting that changed vocabularies are reloaded.
+_RELOAD_SCRIPT = """
+import json
+import os
+import shutil
+import sys
+import time
+
+import pyessv
+from pyessv import io_manager
+from pyessv.constants import COLUMNAR_THRESHOLD
+import tests.utils as tu
+
+archive_dir = sys.argv[1]
+io_manager.write(tu.create_authority(), archive_dir)
+time.sleep(0.05)
+pyessv.init(archive_dir, tu.AUTHORITY_NAME)
+assert pyessv.reload() == []
+
+# Change a term, add a term & remove a term.
+authority = pyessv.load(tu.AUTHORITY_NAME)
+scope = pyessv.load(tu.SCOPE_NAMESPACE)
+collection = pyessv.load(tu.COLLECTION_01_NAMESPACE)
+assert collection.is_columnar == bool(COLUMNAR_THRESHOLD)
+dpath = os.path.join(archive_dir, tu.AUTHORITY_NAME, tu.SCOPE_NAME)
+with open(os.path.join(dpath, tu.COLLECTION_01_NAME, tu.TERM_01_NAME)) as fstream:
+    obj = json.loads(fstream.read())
+obj['description'] = 'reloaded'
+with open(os.path.join(dpath, tu.COLLECTION_01_NAME, tu.TERM_01_NAME), 'w') as fstream:
+    fstream.write(json.dumps(obj))
+obj['canonical_name'] = 'term-04'
+with open(os.path.join(dpath, tu.COLLECTION_01_NAME, 'term-04'), 'w') as fstream:
+    fstream.write(json.dumps(obj))
+os.remove(os.path.join(dpath, tu.COLLECTION_02_NAME, tu.TERM_02_NAME))
+
+assert sorted(pyessv.reload()) == [tu.COLLECTION_01_NAMESPACE, tu.COLLECTION_02_NAMESPACE]
+assert [i.description for i in collection] == [tu.TERM_01_DESCRIPTION]
+
+# Previously loaded authority & scope are left as they were, unchanged collections being shared.
+assert authority[tu.SCOPE_NAME] is scope
+assert scope[tu.COLLECTION_01_NAME] is collection
+assert pyessv.load(tu.AUTHORITY_NAME) is not authority
+assert pyessv.load(tu.AUTHORITY_NAME) is getattr(pyessv, tu.AUTHORITY_NAME.upper())
+assert pyessv.load(tu.SCOPE_NAMESPACE) is not scope
+assert pyessv.load(tu.SCOPE_NAMESPACE).authority is pyessv.load(tu.AUTHORITY_NAME)
+assert pyessv.load(tu.COLLECTION_03_NAMESPACE) is scope[tu.COLLECTION_03_NAME]
+assert pyessv.load(tu.COLLECTION_03_NAMESPACE).scope is pyessv.load(tu.SCOPE_NAMESPACE)
+assert pyessv.load(tu.COLLECTION_01_NAMESPACE) is not collection
+assert pyessv.load(tu.COLLECTION_01_NAMESPACE).is_columnar == collection.is_columnar
+assert pyessv.load(tu.TERM_01_NAMESPACE).description == 'reloaded'
+assert pyessv.load(tu.COLLECTION_01_NAMESPACE + ':term-04') is not None
+assert len(pyessv.load(tu.COLLECTION_02_NAMESPACE)) == 0
+assert pyessv.get_cached(tu.TERM_02_NAMESPACE) is None
+assert pyessv.reload() == []
+
+# Replaced collections & their unchanged terms are left as they were.
+collection = pyessv.load(tu.COLLECTION_01_NAMESPACE)
+term = pyessv.load(tu.TERM_01_NAMESPACE)
+fpath = os.path.join(dpath, tu.COLLECTION_01_NAME, 'term-04')
+shutil.copy(fpath, fpath + '.tmp')
+os.replace(fpath + '.tmp', fpath)
+listed = []
+get_term_stats = io_manager.get_term_stats
+io_manager.get_term_stats = lambda *args: listed.append(args[1].namespace) or get_term_stats(*args)
+assert pyessv.reload() == [tu.COLLECTION_01_NAMESPACE]
+assert listed == [tu.COLLECTION_01_NAMESPACE]
+assert term.collection is collection
+assert pyessv.load(tu.TERM_01_NAMESPACE) is not term
+assert pyessv.load(tu.TERM_01_NAMESPACE).collection is pyessv.load(tu.COLLECTION_01_NAMESPACE)
+assert pyessv.load(tu.TERM_01_NAMESPACE).description == 'reloaded'
+
+# Change manifest.
+fpath = os.path.join(archive_dir, tu.AUTHORITY_NAME, 'MANIFEST')
+os.utime(fpath, ns=(time.time_ns() + 10 ** 9, time.time_ns() + 10 ** 9))
+authority = pyessv.load(tu.AUTHORITY_NAME)
+assert pyessv.reload() == [tu.AUTHORITY_NAME]
+assert pyessv.load(tu.AUTHORITY_NAME) is not authority
+assert pyessv.load(tu.TERM_01_NAMESPACE).description == 'reloaded'
+"""
+
+# Script asserting that vocabularies are loaded in background.
+_BACKGROUND_SCRIPT = """
+import sys
+
+import pyessv
+from pyessv import io_manager
+import tests.utils as tu
+
+io_manager.write(tu.create_authority(), sys.argv[1])
+future = pyessv.init(sys.argv[1], background=True)
+assert pyessv.load(tu.TERM_01_NAMESPACE).description == tu.TERM_01_DESCRIPTION
+assert [i.canonical_name for i in future.result(timeout=60)] == [tu.AUTHORITY_NAME]
+assert pyessv.ready() is True
+assert pyessv.get_cached(tu.TERM_02_NAMESPACE) is not None
+"""
+
+
+def test_init_lazy():
+    """pyessv-tests: initializer: lazy initialisation.
+
+    """
+    env = dict(os.environ, PYESSV_INITIALISATION_MODE='LAZY')
+
+    subprocess.check_call([sys.executable, '-c', _LAZY_SCRIPT], env=env)
+
+
+def test_reload(tmp_path):
+    """pyessv-tests: initializer: reload.
+
+    """
+    env = dict(os.environ, PYESSV_INITIALISATION_MODE='LAZY')
+
+    # Collections held in columnar storage are reloaded likewise.
+    for threshold in ('0', '1'):
+        env['PYESSV_COLUMNAR_THRESHOLD'] = threshold
+        dpath = tmp_path / threshold
+        dpath.mkdir()
+        subprocess.check_call([sys.executable, '-c', _RELOAD_SCRIPT, str(dpath)], env=env)
+
+
+def test_init_background(tmp_path):
+    """pyessv-tests: initializer: background initialisation.
+
+    """
+    env = dict(os.environ, PYESSV_INITIALISATION_MODE='LAZY')
+
+    subprocess.check_call([sys.executable, '-c', _BACKGROUND_SCRIPT, str(tmp_path)], env=env)
@@ -14,6 +14,8 @@ _CLASSES = {
 
 # Set of constants exposed by library.
 _CONSTANTS = {
+    'ARCHIVE_LAYOUT_BUNDLE',
+    'ARCHIVE_LAYOUT_DIRECTORY',
     'DIR_ARCHIVE',
     'ENCODING_DICT',
     'ENCODING_JSON',
@@ -47,6 +49,12 @@ _EXCEPTIONS = {
 
 # Set of functions exposed by library.
 _FUNCS = {
+    # ... aio
+    'init_async',
+    'load_async',
+    'parse_identifer_async',
+    'ready_async',
+    'reload_async',
     # ... archive
     'archive',
     # ... cache
@@ -67,10 +75,15 @@ _FUNCS = {
     'reject',
     'reset',
     # ... initialisation
+    'get_init_profile',
     'init',
+    'ready',
+    'reload',
+    'watch',
     # ... loader
     'load_random',
     'load',
+    'load_many',
     # ... matcher
     'match_term',
     # ... logging
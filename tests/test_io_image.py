@@ -0,0 +1,45 @@
+import inspect
+
+import pyessv as LIB
+from pyessv import io_image
+import tests.utils as tu
+
+
+# Module level fixture setup.
+setup_module = tu.setup
+
+# Module level fixture teardown.
+teardown_module = tu.teardown
+
+
+def test_interface():
+    """pyessv-tests: io-image: interface.
+
+    """
+    assert inspect.isfunction(io_image.read)
+    assert inspect.isfunction(io_image.write)
+
+
+def test_read_write(tmp_path):
+    """pyessv-tests: io-image: read & write.
+
+    """
+    fpath = str(tmp_path / 'vocabs.img')
+    io_image.write(tu.create_authority(), fpath)
+    authority = io_image.read(fpath)[0]
+
+    assert authority.namespace == tu.AUTHORITY_NAMESPACE
+    collection = authority[tu.SCOPE_NAME][tu.COLLECTION_01_NAME]
+    assert not collection.is_loaded
+    assert len(collection) == 1
+
+    # Name lookups decode terms without loading collection.
+    for name in [tu.TERM_01_NAME] + tu.TERM_01_ALTERNATIVE_NAMES:
+        assert collection[name].namespace == tu.TERM_01_NAMESPACE
+    assert LIB.match_term(collection, tu.TERM_01_NAME.upper(), LIB.PARSING_STRICTNESS_4)
+    assert not collection.is_loaded
+
+    # Iteration decodes all terms.
+    assert [i.namespace for i in collection] == [tu.TERM_01_NAMESPACE]
+    assert collection.is_loaded
+    assert collection[tu.TERM_01_NAME] is collection.terms[0]
@@ -1,13 +1,21 @@
+import copy
+import glob
 import inspect
 import io
 import json
 import os
+import pickle
 import random
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 import pyessv as LIB
 from pyessv import io_manager
+from pyessv.model import columns
+from pyessv.profiler import InitProfile
 import tests.utils as tu
 
 
@@ -70,6 +78,272 @@ def test_read_one_scope():
     assert len(authority) == 1
 
 
+def test_read_lazy():
+    """pyessv-tests: io: read lazily.
+
+    """
+    auth = random.choice(os.listdir(LIB.DIR_ARCHIVE))
+    eager = io_manager.read(authority=auth)
+    lazy = io_manager.read(authority=auth, lazy=True)
+    for scope in lazy:
+        for collection in scope:
+            assert not collection.is_loaded
+            expected = eager[scope.canonical_name][collection.canonical_name]
+            assert [i.namespace for i in collection] == [i.namespace for i in expected]
+            assert collection.is_loaded
+
+
+def test_read_concurrently():
+    """pyessv-tests: io: read concurrently.
+
+    """
+    def _get_namespaces(authorities):
+        return [t.namespace for a in authorities for s in a for c in s for t in c.terms]
+
+    expected = _get_namespaces(io_manager.read())
+    assert _get_namespaces(io_manager.read(io_workers=4)) == expected
+    assert _get_namespaces(io_manager.read(io_processes=2)) == expected
+
+    # Threads are used in lieu of forked processes whilst other threads are alive.
+    event = threading.Event()
+    thread = threading.Thread(target=event.wait)
+    thread.start()
+    try:
+        with io_manager._get_executor(None, 2) as executor:
+            assert isinstance(executor, ThreadPoolExecutor)
+        assert _get_namespaces(io_manager.read(io_processes=2)) == expected
+    finally:
+        event.set()
+        thread.join()
+
+
+def test_read_bundle(tmp_path):
+    """pyessv-tests: io: read bundle.
+
+    """
+    def _get_terms(authority):
+        return [(t.namespace, t.description) for s in authority for c in s for t in c]
+
+    for lazy in (False, True):
+        archive_dir, bundle_dir = tmp_path / 'archive-{}'.format(lazy), tmp_path / 'bundle-{}'.format(lazy)
+        archive_dir.mkdir()
+        bundle_dir.mkdir()
+        io_manager.write(tu.create_authority(), str(archive_dir))
+        io_manager.convert(str(archive_dir), str(bundle_dir), LIB.ARCHIVE_LAYOUT_BUNDLE)
+        assert os.listdir(str(bundle_dir)) == ['{}.bundle'.format(tu.AUTHORITY_NAME)]
+
+        expected = io_manager.read(str(archive_dir), tu.AUTHORITY_NAME)
+        authority = io_manager.read(str(bundle_dir), tu.AUTHORITY_NAME, lazy=lazy)
+        assert isinstance(authority, LIB.Authority)
+        assert _get_terms(authority) == _get_terms(expected)
+        assert [_get_terms(i) for i in io_manager.read(str(bundle_dir))] == [_get_terms(expected)]
+
+
+def test_read_package(tmp_path):
+    """pyessv-tests: io: read package.
+
+    """
+    def _get_terms(authority):
+        return sorted((t.namespace, t.description) for s in authority for c in s for t in c)
+
+    archive_dir = tmp_path / 'archive'
+    archive_dir.mkdir()
+    io_manager.write(tu.create_authority(), str(archive_dir))
+    expected = _get_terms(io_manager.read(str(archive_dir), tu.AUTHORITY_NAME))
+    for package_format in ('gztar', 'zip'):
+        fpath = shutil.make_archive(str(tmp_path / 'package'), package_format, str(tmp_path), 'archive')
+        authority = io_manager.read(fpath, tu.AUTHORITY_NAME)
+        assert isinstance(authority, LIB.Authority)
+        assert _get_terms(authority) == expected
+        assert [_get_terms(i) for i in io_manager.read(fpath, lazy=True)] == [expected]
+        with pytest.raises(IOError):
+            io_manager.read(fpath, 'xxx')
+
+
+def test_read_package_include(tmp_path):
+    """pyessv-tests: io: read selected collections from package.
+
+    """
+    archive_dir = tmp_path / 'archive'
+    archive_dir.mkdir()
+    io_manager.write(tu.create_authority(), str(archive_dir))
+
+    # Hidden & unselected files are never read.
+    fpaths = glob.glob(str(archive_dir / tu.AUTHORITY_NAME / tu.SCOPE_NAME / tu.COLLECTION_02_NAME / '*'))
+    fpaths.append(str(archive_dir / tu.AUTHORITY_NAME / tu.SCOPE_NAME / tu.COLLECTION_01_NAME / '.hidden'))
+    for fpath in fpaths:
+        with open(fpath, 'wb') as fstream:
+            fstream.write(b'\xff')
+
+    include = [tu.COLLECTION_01_NAMESPACE]
+    for package_format in ('gztar', 'zip'):
+        fpath = shutil.make_archive(str(tmp_path / 'package'), package_format, str(tmp_path), 'archive')
+        for lazy in (False, True):
+            authority = io_manager.read(fpath, tu.AUTHORITY_NAME, lazy=lazy, include=include)
+            assert [i.namespace for i in authority[tu.SCOPE_NAME]] == include
+            assert len(authority[tu.SCOPE_NAME][tu.COLLECTION_01_NAME]) > 0
+        assert io_manager.read(fpath, include=['xxx']) == []
+        with pytest.raises(ValueError):
+            io_manager.read(fpath, tu.AUTHORITY_NAME)
+
+
+def test_read_include(tmp_path):
+    """pyessv-tests: io: read selected collections.
+
+    """
+    io_manager.write(tu.create_authority(), str(tmp_path))
+
+    # Unselected term files are never read.
+    for fpath in glob.glob(os.path.join(str(tmp_path), tu.AUTHORITY_NAME, tu.SCOPE_NAME, tu.COLLECTION_02_NAME, '*')):
+        with open(fpath, 'w') as fstream:
+            fstream.write('corrupt')
+
+    for include in ([tu.COLLECTION_01_NAMESPACE], [tu.COLLECTION_01_NAMESPACE, tu.COLLECTION_03_NAMESPACE]):
+        authorities = io_manager.read(str(tmp_path), include=include)
+        assert [i.namespace for i in authorities] == [tu.AUTHORITY_NAME]
+        assert [i.namespace for i in authorities[0]] == [tu.SCOPE_NAMESPACE]
+        assert [i.namespace for i in authorities[0][tu.SCOPE_NAME]] == include
+        assert len(authorities[0][tu.SCOPE_NAME][tu.COLLECTION_01_NAME]) > 0
+
+    assert io_manager.read(str(tmp_path), include=['xxx']) == []
+
+
+def test_read_columnar(tmp_path):
+    """pyessv-tests: io: read collections into columnar storage.
+
+    """
+    io_manager.write(tu.create_authority(), str(tmp_path))
+
+    expected = io_manager.read(str(tmp_path), columnar=0)[0]
+    authority = io_manager.read(str(tmp_path), columnar=1)[0]
+    for scope, expected_scope in zip(authority, expected):
+        for collection, expected_collection in zip(scope, expected_scope):
+            assert collection.is_columnar == (len(expected_collection) > 0)
+            assert [LIB.encode(i) for i in collection] == [LIB.encode(i) for i in expected_collection]
+
+    collection = authority[tu.SCOPE_NAME][tu.COLLECTION_01_NAME]
+    term = collection[tu.TERM_01_ALTERNATIVE_NAMES[0]]
+    assert isinstance(term, LIB.Term)
+    assert term is collection[tu.TERM_01_NAME]
+    assert collection.get_column('canonical_name') == [i.canonical_name for i in collection]
+
+    # Views write through to columns.
+    term.status = LIB.GOVERNANCE_STATUS_ACCEPTED
+    assert collection.terms.select('status', LIB.GOVERNANCE_STATUS_ACCEPTED) == [term]
+
+    # Lists changed in place write through to columns.
+    term.alternative_names.clear()
+    assert term.alternative_names == []
+    term.alternative_names.append('renamed')
+    term.alternative_names += ['renamed-again']
+    assert term.alternative_names == ['renamed', 'renamed-again']
+    assert collection['renamed'] is term
+    assert collection[tu.TERM_01_ALTERNATIVE_NAMES[0]] is None
+    term.associations.append(tu.TERM_02_NAMESPACE)
+    assert term.associations == [tu.TERM_02_NAMESPACE]
+
+    # Copies are detached from columns.
+    detached = copy.copy(term)
+    detached.alternative_names.append('detached')
+    assert collection['detached'] is None
+    assert 'detached' not in term.alternative_names
+
+    # Columnar storage is opt-in.
+    if 'PYESSV_COLUMNAR_THRESHOLD' not in os.environ:
+        assert not any(c.is_columnar for s in io_manager.read(str(tmp_path))[0] for c in s)
+
+
+def test_read_columnar_statuses(tmp_path, monkeypatch):
+    """pyessv-tests: io: term statuses held within columnar storage.
+
+    """
+    io_manager.write(tu.create_authority(), str(tmp_path))
+    collections = [c for s in io_manager.read(str(tmp_path), columnar=1)[0] for c in s if c.is_columnar]
+    terms = [t for c in collections for t in c]
+
+    # Unknown statuses are coded consistently whilst assigned concurrently.
+    statuses = ['status-{}'.format(i) for i in range(len(terms))]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: setattr(i[0], 'status', i[1]), zip(terms, statuses)))
+    assert [i.status for i in terms] == statuses
+
+    # Statuses are serialised with columns, i.e. independently of process local status codes.
+    state = pickle.dumps([c.terms for c in collections])
+    monkeypatch.setattr(columns, '_STATUSES', list(reversed(columns._STATUSES)))
+    assert [t.status for i in pickle.loads(state) for t in i] == statuses
+
+
+def test_read_index(tmp_path, tmp_path_factory, monkeypatch):
+    """pyessv-tests: io: read indexed term files.
+
+    """
+    def _get_terms(authority):
+        return sorted(t.namespace for s in authority for c in s for t in c)
+
+    io_manager.write(tu.create_authority(), str(tmp_path))
+    assert os.path.isfile(os.path.join(str(tmp_path), tu.AUTHORITY_NAME, 'INDEX'))
+    expected = _get_terms(tu.create_authority())
+
+    # Term directories are not listed whilst index is current.
+    with monkeypatch.context() as patch:
+        patch.setattr(io_manager.glob, 'glob', None)
+        assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME)) == expected
+
+    # Index is trusted within copies of archive, i.e. whose modification times differ.
+    copied = str(tmp_path_factory.mktemp('copy'))
+    shutil.copytree(os.path.join(str(tmp_path), tu.AUTHORITY_NAME), os.path.join(copied, tu.AUTHORITY_NAME))
+    for dpath, _, fnames in os.walk(copied):
+        for fpath in [dpath] + [os.path.join(dpath, i) for i in fnames]:
+            os.utime(fpath, ns=(0, 0))
+    with monkeypatch.context() as patch:
+        patch.setattr(io_manager.glob, 'glob', None)
+        assert _get_terms(io_manager.read(copied, tu.AUTHORITY_NAME)) == expected
+        assert _get_terms(io_manager.read(copied, tu.AUTHORITY_NAME, io_workers=4)) == expected
+
+    # Term directories are listed once a listed term file changes size, e.g. whilst adding a term file.
+    dpath = os.path.join(str(tmp_path), tu.AUTHORITY_NAME, tu.SCOPE_NAME, tu.COLLECTION_01_NAME)
+    with open(os.path.join(dpath, tu.TERM_01_NAME)) as fstream:
+        obj = json.loads(fstream.read())
+    with open(os.path.join(dpath, tu.TERM_01_NAME), 'w') as fstream:
+        fstream.write(json.dumps(obj))
+    obj['canonical_name'] = 'term-04'
+    with open(os.path.join(dpath, 'term-04'), 'w') as fstream:
+        fstream.write(json.dumps(obj))
+    expected = sorted(expected + [tu.COLLECTION_01_NAMESPACE + ':term-04'])
+    assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME)) == expected
+    assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME, lazy=True)) == expected
+    assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME, io_workers=4)) == expected
+
+    # Term directories are listed once manifest changes, e.g. following addition of a term.
+    with open(os.path.join(copied, tu.AUTHORITY_NAME, 'MANIFEST'), 'a') as fstream:
+        fstream.write('\n')
+    shutil.copy(os.path.join(dpath, 'term-04'), dpath.replace(str(tmp_path), copied))
+    assert _get_terms(io_manager.read(copied, tu.AUTHORITY_NAME)) == expected
+
+    # Term directories are listed once index is stale.
+    os.remove(os.path.join(str(tmp_path), tu.AUTHORITY_NAME, tu.SCOPE_NAME, tu.COLLECTION_01_NAME, tu.TERM_01_NAME))
+    expected.remove(tu.TERM_01_NAMESPACE)
+    assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME)) == expected
+    assert _get_terms(io_manager.read(str(tmp_path), tu.AUTHORITY_NAME, lazy=True)) == expected
+
+
+def test_read_profiled(tmp_path):
+    """pyessv-tests: io: read whilst profiling.
+
+    """
+    io_manager.write(tu.create_authority(), str(tmp_path))
+    profile = InitProfile()
+    authority = io_manager.read(str(tmp_path), tu.AUTHORITY_NAME, io_workers=4, profile=profile)
+
+    terms = [t for s in authority for c in s for t in c]
+    assert profile.nodes[tu.AUTHORITY_NAME].files == len(terms) + 1
+    assert profile.nodes[tu.SCOPE_NAMESPACE].files == len(terms)
+    assert profile.nodes[tu.COLLECTION_01_NAMESPACE].files == 1
+    assert profile.nodes[tu.COLLECTION_01_NAMESPACE].size > 0
+    assert profile.nodes[tu.AUTHORITY_NAME].wall >= profile.nodes[tu.SCOPE_NAMESPACE].wall
+    assert profile.get_report().splitlines()[3].startswith(tu.AUTHORITY_NAME)
+
+
 def test_read_one_negative():
     """pyessv-tests: io: read one (negative).
 
@@ -0,0 +1,72 @@
+import inspect
+import os
+import shutil
+
+import pyessv as LIB
+from pyessv import io_manager
+from pyessv import io_snapshot
+import tests.utils as tu
+
+
+# Module level fixture setup.
+setup_module = tu.setup
+
+# Module level fixture teardown.
+teardown_module = tu.teardown
+
+
+def test_interface():
+    """pyessv-tests: io-snapshot: interface.
+
+    """
+    assert inspect.isfunction(io_snapshot.get_fingerprint)
+    assert inspect.isfunction(io_snapshot.read)
+    assert inspect.isfunction(io_snapshot.write)
+
+
+def test_read_write(tmp_path):
+    """pyessv-tests: io-snapshot: read & write.
+
+    """
+    archive_dir, snapshot_dir = str(tmp_path / 'archive'), str(tmp_path / 'snapshot')
+    os.makedirs(archive_dir)
+    io_manager.write(tu.create_authority(), archive_dir)
+    authorities = io_manager.read(archive_dir)
+
+    assert io_snapshot.read(archive_dir, snapshot_dir=snapshot_dir) is None
+    io_snapshot.write(authorities, archive_dir, snapshot_dir=snapshot_dir)
+    restored = io_snapshot.read(archive_dir, snapshot_dir=snapshot_dir)
+
+    assert [i.namespace for i in restored] == [i.namespace for i in authorities]
+    term = restored[0][tu.SCOPE_NAME][tu.COLLECTION_01_NAME][tu.TERM_01_NAME]
+    assert term.namespace == tu.TERM_01_NAMESPACE
+    assert term.collection is restored[0][tu.SCOPE_NAME][tu.COLLECTION_01_NAME]
+
+
+def test_invalidation(tmp_path):
+    """pyessv-tests: io-snapshot: invalidation upon archive change.
+
+    """
+    archive_dir, snapshot_dir = str(tmp_path / 'archive'), str(tmp_path / 'snapshot')
+    os.makedirs(archive_dir)
+    io_manager.write(tu.create_authority(), archive_dir)
+    io_snapshot.write(io_manager.read(archive_dir), archive_dir, snapshot_dir=snapshot_dir)
+    assert io_snapshot.read(archive_dir, snapshot_dir=snapshot_dir) is not None
+
+    fpath = os.path.join(archive_dir, tu.AUTHORITY_NAME, tu.SCOPE_NAME, tu.COLLECTION_01_NAME, tu.TERM_01_NAME)
+    with open(fpath, 'a') as fstream:
+        fstream.write('\n')
+
+    assert io_snapshot.read(archive_dir, snapshot_dir=snapshot_dir) is None
+
+    # Authorities held within bundles are fingerprinted via their bundle.
+    io_manager.write(tu.create_authority(), archive_dir, LIB.ARCHIVE_LAYOUT_BUNDLE)
+    shutil.rmtree(os.path.join(archive_dir, tu.AUTHORITY_NAME))
+    io_snapshot.write(io_manager.read(archive_dir, tu.AUTHORITY_NAME), archive_dir, tu.AUTHORITY_NAME,
+                      snapshot_dir=snapshot_dir)
+    assert io_snapshot.read(archive_dir, tu.AUTHORITY_NAME, snapshot_dir=snapshot_dir) is not None
+
+    with open(os.path.join(archive_dir, tu.AUTHORITY_NAME + '.bundle'), 'a') as fstream:
+        fstream.write('\n')
+
+    assert io_snapshot.read(archive_dir, tu.AUTHORITY_NAME, snapshot_dir=snapshot_dir) is None
@@ -0,0 +1,23 @@
+import pyessv as LIB
+from . import utils as tu
+
+
+# Module level setup/teardown.
+setup_module = tu.setup
+teardown_module = tu.teardown
+
+
+def test_load_many():
+    """pyessv-tests: loader: load many.
+
+    """
+    term = tu.create_term_01()
+    alternative = ':'.join(tu.TERM_01_NAMESPACE.split(':')[:-1] + [tu.TERM_01_ALTERNATIVE_NAMES[0]])
+    namespaces = [tu.TERM_01_NAMESPACE, tu.SCOPE_NAMESPACE, 'missing', alternative, tu.TERM_01_NAMESPACE]
+
+    assert LIB.load_many(namespaces, on_missing=lambda i: i) == \
+        [term, term.collection.scope, 'missing', term, term]
+    assert LIB.load_many(namespaces, strictness=LIB.PARSING_STRICTNESS_3, on_missing=lambda i: None) == \
+        [term, term.collection.scope, None, term, term]
+    assert LIB.load_many(namespaces, strictness=LIB.PARSING_STRICTNESS_0, on_missing=lambda i: None) == \
+        [term, term.collection.scope, None, None, term]
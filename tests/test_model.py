@@ -1,5 +1,6 @@
 import pytest
 
+import pyessv as LIB
 import tests.utils as tu
 
 
@@ -31,3 +32,145 @@ def test_iterability(node, keys):
     for key in keys:
         assert key in node
         assert node[key] is not None
+
+
+@pytest.mark.parametrize("node_factory", (
+    tu.create_authority,
+    tu.create_scope,
+    tu.create_collection_01,
+    tu.create_term_01
+))
+def test_slots(node_factory):
+    """Test that domain model instances are slotted.
+
+    """
+    node = node_factory()
+    assert type(node).__dictoffset__ == 0
+    with pytest.raises(AttributeError):
+        node.xxx = None
+
+
+def _create_term(name, alternative_names=[]):
+    """Creates & returns a term detached from archive.
+
+    """
+    term = LIB.Term()
+    term.canonical_name = term.raw_name = name
+    term.alternative_names = alternative_names
+
+    return term
+
+
+def test_name_index():
+    """Test name index of domain model.
+
+    """
+    collection = LIB.Collection()
+    for name in ('b', 'a'):
+        term = _create_term(name, ['x'])
+        collection.append_item(term)
+        assert collection[name] is term
+
+    # Shared names resolve as per iteration order.
+    assert collection['x'] is collection['a']
+
+    # Items appended or replaced directly are indexed upon demand.
+    term = _create_term('c')
+    collection.terms.append(term)
+    assert collection['c'] is term
+    collection.terms[0] = _create_term('d')
+    collection.reset_index()
+    assert collection['b'] is None
+    assert collection['d'] is collection.terms[0]
+
+
+def test_name_matches():
+    """Test normalised name spelling index of domain model.
+
+    """
+    collection = LIB.Collection()
+    for name in ('b', 'a'):
+        collection.append_item(_create_term(name, ['Shared_Name']))
+    term = _create_term('c')
+    term.raw_name = 'C'
+    collection.append_item(term)
+
+    assert collection.get_matches('c') == (term, )
+    assert collection.get_matches('shared_name') == (collection['a'], collection['b'])
+    assert collection.get_matches('shared-name') == collection.get_matches('shared_name')
+    assert collection.get_matches('C') == ()
+
+    # Columnar items are matched identically.
+    collection.set_columnar()
+    assert [i.name for i in collection.get_matches('shared-name')] == ['a', 'b']
+    assert collection.get_matches('c')[0].name == 'c'
+
+
+def test_name_index_invalidation():
+    """Test that name index & iteration order reflect renaming in place.
+
+    """
+    for columnar in (False, True):
+        collection = LIB.Collection()
+        for name in ('a', 'b', 'c'):
+            term = _create_term(name)
+            term.collection = collection
+            collection.append_item(term)
+        if columnar:
+            collection.set_columnar()
+        assert [i.name for i in collection] == ['a', 'b', 'c']
+
+        term = collection['c']
+        term.canonical_name = term.raw_name = '0'
+        assert collection['0'] is term
+        assert collection['c'] is None
+        assert collection.get_matches('0') == (term, )
+        assert [i.name for i in collection] == ['0', 'a', 'b']
+
+        term.alternative_names.append('alias')
+        assert collection['alias'] is term
+        assert collection.get_matches('alias') == (term, )
+
+
+def test_iteration_order():
+    """Test iteration order of domain model.
+
+    """
+    collection = LIB.Collection()
+    for name in ('b', 'c', 'a'):
+        collection.append_item(_create_term(name))
+        assert [i.name for i in collection] == sorted(i.name for i in collection.terms)
+
+    collection.terms.append(_create_term('0'))
+    assert [i.name for i in collection] == ['0', 'a', 'b', 'c']
+    assert [i.name for i in collection.iter_items()] == ['b', 'c', 'a', '0']
+
+
+def test_namespace_invalidation():
+    """Test that cached namespaces reflect renaming & re-parenting.
+
+    """
+    collection = LIB.Collection()
+    collection.canonical_name = 'collection'
+    collection.scope = LIB.Scope()
+    collection.scope.canonical_name = 'scope'
+    collection.scope.authority = LIB.Authority()
+    collection.scope.authority.canonical_name = 'authority'
+    term = _create_term('term')
+    collection.append_item(term)
+    term.collection = collection
+    assert term.namespace == 'authority:scope:collection:term'
+    assert term.hierarchy == [collection.scope.authority, collection.scope, collection, term]
+
+    collection.scope.canonical_name = 'renamed'
+    assert term.namespace == 'authority:renamed:collection:term'
+
+    term.canonical_name = 'renamed'
+    assert term.namespace == 'authority:renamed:collection:renamed'
+
+    other = LIB.Collection()
+    other.canonical_name = 'other'
+    other.scope = collection.scope
+    term.collection = other
+    assert term.namespace == 'authority:renamed:other:renamed'
+    assert term.ancestors == [collection.scope.authority, collection.scope, other]
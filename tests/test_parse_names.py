@@ -1,6 +1,8 @@
 import pytest
 
 import pyessv as LIB
+from pyessv.cache import decache
+from pyessv.parsing.namespaces import parser
 import tests.utils as tu
 
 
@@ -108,3 +110,35 @@ def test_parse_name(typekey, name, expected, strictness, parent):
            'Name parsing error: node-type={}. name={}. actual = {}. expected {}.'.format(
                 typekey, name, result, expected
             )
+
+
+def test_parse_memo():
+    """Test that parsed namespaces are forgotten once cache is modified.
+
+    """
+    namespace = '{}:{}:{}:{}'.format(tu.AUTHORITY_NAME, tu.SCOPE_NAME, tu.COLLECTION_01_NAME, 'term-memo')
+    for _ in range(2):
+        with pytest.raises(LIB.NamespaceParsingError):
+            LIB.parse(namespace)
+
+    LIB.create_term(LIB.load(tu.COLLECTION_01_NAMESPACE), 'term-memo', 'description', label='Term Memo')
+    assert LIB.parse(namespace) == 'term-memo'
+    assert LIB.parse(namespace, field='label') == 'Term Memo'
+
+
+def test_parse_memo_virtual(monkeypatch):
+    """Test that parsed namespaces are remembered whilst virtual terms are matched by reg-ex.
+
+    """
+    scope = tu.create_virtual_scope()
+    try:
+        assert LIB.parse(tu.TERM_01_NAMESPACE) == tu.TERM_01_NAME
+
+        # Namespaces are parsed from memo, i.e. without resolving names.
+        monkeypatch.setattr(parser, '_get_child', None)
+        for name in ('r1i1', 'r2i1', 'r3i1'):
+            assert len(LIB.parse_identifer(scope, LIB.IDENTIFIER_TYPE_DATASET, name)) == 1
+            assert LIB.parse(tu.TERM_01_NAMESPACE) == tu.TERM_01_NAME
+            assert LIB.parse(tu.TERM_01_NAMESPACE, field='raw_name') == tu.TERM_01_NAME
+    finally:
+        decache(tu.VIRTUAL_AUTHORITY_NAME)
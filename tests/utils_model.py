@@ -4,6 +4,7 @@ import shutil
 
 import pyessv as LIB
 from pyessv.cache import decache
+from pyessv.parsing.identifiers import config
 
 
 # Test authority.
@@ -257,6 +258,36 @@ def create_term_03(collection=None):
     return TERM_03
 
 
+# Test virtual authority, i.e. one whose collection terms are constrained by a reg-ex only.
+VIRTUAL_AUTHORITY_NAME = 'virtual-authority'
+VIRTUAL_SCOPE_NAMESPACE = ':'.join([VIRTUAL_AUTHORITY_NAME, 'scope'])
+VIRTUAL_COLLECTION_NAMESPACE = ':'.join([VIRTUAL_SCOPE_NAMESPACE, 'collection'])
+VIRTUAL_COLLECTION_TERM_REGEX = r'^r[0-9]+i[0-9]+$'
+
+
+def create_virtual_scope():
+    """Creates & returns a test scope holding a virtual collection, plus its dataset parsing configuration.
+
+    Virtual authority is uncached via decache(VIRTUAL_AUTHORITY_NAME).
+
+    """
+    authority = LIB.create_authority(VIRTUAL_AUTHORITY_NAME, 'description')
+    scope = LIB.create_scope(authority, 'scope', 'description')
+    collection = LIB.create_collection(scope, 'collection', 'description', term_regex=VIRTUAL_COLLECTION_TERM_REGEX)
+
+    cfg = config.ParsingConfiguration(
+        LIB.IDENTIFIER_TYPE_DATASET,
+        VIRTUAL_SCOPE_NAMESPACE,
+        '%(collection)s',
+        '.',
+        [config.CollectionParsingSpecification(collection.namespace, True)],
+        None
+        )
+    config._CACHE['{} :: {}'.format(scope, LIB.IDENTIFIER_TYPE_DATASET)] = cfg
+
+    return scope
+
+
 def create_test_entities():
     """Returns tuple of test entities.
 